@@ -45,6 +45,12 @@ struct Point:
 
 WEEK: constant(uint256) = 7 * 86400
 TOKEN_CHECKPOINT_DEADLINE: constant(uint256) = 86400
+# Maximum number of user points and weeks looked at in one claim
+MAX_CLAIM_ITERATIONS: constant(int128) = 500
+# Maximum number of user points and weeks looked at by `claim_calls`
+MAX_CLAIM_SIMULATION: constant(int128) = 5000
+# Maximum number of addresses in a list, each ABI encoded as 32 bytes
+MAX_LIST: constant(int128) = 100
 
 start_time: public(uint256)
 time_cursor: public(uint256)
@@ -173,6 +179,28 @@ def _find_timestamp_user_epoch(ve: address, user: address, _timestamp: uint256,
     return _min
 
 
+@internal
+def _find_timestamp_epoch_hinted(ve: address, _timestamp: uint256, _hint: uint256) -> uint256:
+    # Verify `_hint` as the result of `_find_timestamp_epoch`, or fall back to the search
+    max_epoch: uint256 = VotingEscrow(ve).epoch()
+    if _hint <= max_epoch:
+        if _hint == 0 or VotingEscrow(ve).point_history(_hint).ts <= _timestamp:
+            if _hint == max_epoch or VotingEscrow(ve).point_history(_hint + 1).ts > _timestamp:
+                return _hint
+    return self._find_timestamp_epoch(ve, _timestamp)
+
+
+@view
+@internal
+def _find_timestamp_user_epoch_hinted(ve: address, user: address, _timestamp: uint256, max_user_epoch: uint256, _hint: uint256) -> uint256:
+    # Verify `_hint` as the result of `_find_timestamp_user_epoch`, or fall back to the search
+    if _hint <= max_user_epoch:
+        if _hint == 0 or VotingEscrow(ve).user_point_history(user, _hint).ts <= _timestamp:
+            if _hint == max_user_epoch or VotingEscrow(ve).user_point_history(user, _hint + 1).ts > _timestamp:
+                return _hint
+    return self._find_timestamp_user_epoch(ve, user, _timestamp, max_user_epoch)
+
+
 @view
 @external
 def ve_for_at(_user: address, _timestamp: uint256) -> uint256:
@@ -189,8 +217,28 @@ def ve_for_at(_user: address, _timestamp: uint256) -> uint256:
     return convert(max(pt.bias - pt.slope * convert(_timestamp - pt.ts, int128), 0), uint256)
 
 
+@view
+@external
+def ve_for_at_hinted(_user: address, _timestamp: uint256, _user_epoch: uint256) -> uint256:
+    """
+    @notice Get the veCRV balance for `_user` at `_timestamp`, using an epoch hint
+    @dev Same result as `ve_for_at`. A correct hint is verified with two calls to
+         the voting escrow, instead of a binary search. A wrong hint falls back
+         to the search.
+    @param _user Address to query balance for
+    @param _timestamp Epoch time
+    @param _user_epoch Last user epoch of `_user` with a timestamp not greater than `_timestamp`
+    @return uint256 veCRV balance
+    """
+    ve: address = self.voting_escrow
+    max_user_epoch: uint256 = VotingEscrow(ve).user_point_epoch(_user)
+    epoch: uint256 = self._find_timestamp_user_epoch_hinted(ve, _user, _timestamp, max_user_epoch, _user_epoch)
+    pt: Point = VotingEscrow(ve).user_point_history(_user, epoch)
+    return convert(max(pt.bias - pt.slope * convert(_timestamp - pt.ts, int128), 0), uint256)
+
+
 @internal
-def _checkpoint_total_supply():
+def _checkpoint_total_supply(_epochs: uint256[20], _hinted: bool):
     ve: address = self.voting_escrow
     t: uint256 = self.time_cursor
     rounded_timestamp: uint256 = block.timestamp / WEEK * WEEK
@@ -200,7 +248,11 @@ def _checkpoint_total_supply():
         if t > rounded_timestamp:
             break
         else:
-            epoch: uint256 = self._find_timestamp_epoch(ve, t)
+            epoch: uint256 = 0
+            if _hinted:
+                epoch = self._find_timestamp_epoch_hinted(ve, t, _epochs[i])
+            else:
+                epoch = self._find_timestamp_epoch(ve, t)
             pt: Point = VotingEscrow(ve).point_history(epoch)
             dt: int128 = 0
             if t > pt.ts:
@@ -221,11 +273,26 @@ def checkpoint_total_supply():
          new epoch week. This function may be called independently
          of a claim, to reduce claiming gas costs.
     """
-    self._checkpoint_total_supply()
+    self._checkpoint_total_supply(empty(uint256[20]), False)
+
+
+@external
+def checkpoint_total_supply_hinted(_epochs: uint256[20]):
+    """
+    @notice Update the veCRV total supply checkpoint, using epoch hints
+    @dev Same result as `checkpoint_total_supply`. Each correct hint is verified
+         with two calls to the voting escrow, instead of a binary search. Wrong
+         hints fall back to the search.
+    @param _epochs Hints for each week from `time_cursor` onward - the last
+                   voting escrow epoch with a timestamp not greater than the week
+    """
+    self._checkpoint_total_supply(_epochs, True)
 
 
 @internal
-def _claim(addr: address, ve: address, _last_token_time: uint256) -> uint256:
+def _claim(addr: address, ve: address, _last_token_time: uint256, _max_iterations: int128) -> (uint256, bool):
+    # Returns the amount to distribute, and whether more remains to be claimed
+    # after looking at `_max_iterations` user points and weeks
     # Minimal user_epoch is 0 (if user had no point)
     user_epoch: uint256 = 0
     to_distribute: uint256 = 0
@@ -235,7 +302,7 @@ def _claim(addr: address, ve: address, _last_token_time: uint256) -> uint256:
 
     if max_user_epoch == 0:
         # No lock = no fees
-        return 0
+        return 0, False
 
     week_cursor: uint256 = self.time_cursor_of[addr]
     if week_cursor == 0:
@@ -253,15 +320,19 @@ def _claim(addr: address, ve: address, _last_token_time: uint256) -> uint256:
         week_cursor = (user_point.ts + WEEK - 1) / WEEK * WEEK
 
     if week_cursor >= _last_token_time:
-        return 0
+        return 0, False
 
     if week_cursor < _start_time:
         week_cursor = _start_time
     old_user_point: Point = empty(Point)
+    remaining: bool = True
 
     # Iterate over weeks
-    for i in range(50):
+    for i in range(MAX_CLAIM_ITERATIONS):
+        if i == _max_iterations:
+            break
         if week_cursor >= _last_token_time:
+            remaining = False
             break
 
         if week_cursor >= user_point.ts and user_epoch <= max_user_epoch:
@@ -278,19 +349,63 @@ def _claim(addr: address, ve: address, _last_token_time: uint256) -> uint256:
             dt: int128 = convert(week_cursor - old_user_point.ts, int128)
             balance_of: uint256 = convert(max(old_user_point.bias - dt * old_user_point.slope, 0), uint256)
             if balance_of == 0 and user_epoch > max_user_epoch:
+                remaining = False
                 break
             if balance_of > 0:
                 to_distribute += balance_of * self.tokens_per_week[week_cursor] / self.ve_supply[week_cursor]
 
             week_cursor += WEEK
 
+    if remaining:
+        # Out of iterations - check if the next one would have finished the claim
+        if week_cursor >= _last_token_time:
+            remaining = False
+        elif user_epoch > max_user_epoch:
+            next_dt: int128 = convert(week_cursor - old_user_point.ts, int128)
+            if old_user_point.bias - next_dt * old_user_point.slope <= 0:
+                remaining = False
+
     user_epoch = min(max_user_epoch, user_epoch - 1)
     self.user_epoch_of[addr] = user_epoch
     self.time_cursor_of[addr] = week_cursor
 
     log Claimed(addr, to_distribute, user_epoch, max_user_epoch)
 
-    return to_distribute
+    return to_distribute, remaining
+
+
+@internal
+def _checkpoint_for_claim() -> uint256:
+    """
+    @notice Checkpoint the total supply and token distribution ahead of a claim
+    @return Start of the week of the last token checkpoint
+    """
+    if block.timestamp >= self.time_cursor:
+        self._checkpoint_total_supply(empty(uint256[20]), False)
+
+    last_token_time: uint256 = self.last_token_time
+
+    if self.can_checkpoint_token and (block.timestamp > last_token_time + TOKEN_CHECKPOINT_DEADLINE):
+        self._checkpoint_token()
+        last_token_time = block.timestamp
+
+    return last_token_time / WEEK * WEEK
+
+
+@internal
+def _claim_and_transfer(addr: address, ve: address, _token: address, _last_token_time: uint256) -> uint256:
+    """
+    @notice Claim fees for `addr` as part of a batch, leaving `token_last_balance`
+            to be updated by the caller
+    @return uint256 Amount of fees transferred to `addr`
+    """
+    amount: uint256 = 0
+    remaining: bool = False
+    amount, remaining = self._claim(addr, ve, _last_token_time, 50)
+    if amount != 0:
+        assert ERC20(_token).transfer(addr, amount)
+
+    return amount
 
 
 @external
@@ -308,18 +423,11 @@ def claim(_addr: address = msg.sender) -> uint256:
     """
     assert not self.is_killed
 
-    if block.timestamp >= self.time_cursor:
-        self._checkpoint_total_supply()
-
-    last_token_time: uint256 = self.last_token_time
-
-    if self.can_checkpoint_token and (block.timestamp > last_token_time + TOKEN_CHECKPOINT_DEADLINE):
-        self._checkpoint_token()
-        last_token_time = block.timestamp
+    last_token_time: uint256 = self._checkpoint_for_claim()
 
-    last_token_time = last_token_time / WEEK * WEEK
-
-    amount: uint256 = self._claim(_addr, self.voting_escrow, last_token_time)
+    amount: uint256 = 0
+    remaining: bool = False
+    amount, remaining = self._claim(_addr, self.voting_escrow, last_token_time, 50)
     if amount != 0:
         token: address = self.token
         assert ERC20(token).transfer(_addr, amount)
@@ -342,28 +450,48 @@ def claim_many(_receivers: address[20]) -> bool:
     """
     assert not self.is_killed
 
-    if block.timestamp >= self.time_cursor:
-        self._checkpoint_total_supply()
+    last_token_time: uint256 = self._checkpoint_for_claim()
+    voting_escrow: address = self.voting_escrow
+    token: address = self.token
+    total: uint256 = 0
 
-    last_token_time: uint256 = self.last_token_time
+    for addr in _receivers:
+        if addr == ZERO_ADDRESS:
+            break
 
-    if self.can_checkpoint_token and (block.timestamp > last_token_time + TOKEN_CHECKPOINT_DEADLINE):
-        self._checkpoint_token()
-        last_token_time = block.timestamp
+        total += self._claim_and_transfer(addr, voting_escrow, token, last_token_time)
 
-    last_token_time = last_token_time / WEEK * WEEK
+    if total != 0:
+        self.token_last_balance -= total
+
+    return True
+
+
+@external
+@nonreentrant('lock')
+def claim_list(_receivers: Bytes[3200]) -> bool:
+    """
+    @notice Make multiple fee claims in a single call
+    @dev The same as `claim_many`, without zero address padding.
+         Addresses are ABI encoded as 32 bytes each, without a length prefix.
+    @param _receivers List of addresses to claim for
+    @return bool success
+    """
+    assert not self.is_killed
+    assert len(_receivers) % 32 == 0  # dev: invalid address list
+
+    last_token_time: uint256 = self._checkpoint_for_claim()
     voting_escrow: address = self.voting_escrow
     token: address = self.token
     total: uint256 = 0
+    length: int128 = convert(len(_receivers), int128)
 
-    for addr in _receivers:
-        if addr == ZERO_ADDRESS:
+    for i in range(MAX_LIST):
+        if i * 32 == length:
             break
+        addr: address = extract32(_receivers, i * 32, output_type=address)
 
-        amount: uint256 = self._claim(addr, voting_escrow, last_token_time)
-        if amount != 0:
-            assert ERC20(token).transfer(addr, amount)
-            total += amount
+        total += self._claim_and_transfer(addr, voting_escrow, token, last_token_time)
 
     if total != 0:
         self.token_last_balance -= total
@@ -371,6 +499,151 @@ def claim_many(_receivers: address[20]) -> bool:
     return True
 
 
+@external
+@nonreentrant('lock')
+def claim_partial(_addr: address, _max_iterations: uint256) -> bool:
+    """
+    @notice Claim fees for `_addr`, looking at up to `_max_iterations`
+            user veCRV points and weeks
+    @dev The same as `claim`, with a caller chosen limit instead of 50.
+         Each call after the first spends one iteration reloading the
+         last user point, so at least 2 are needed to make progress.
+         Use `claim_calls` to find the number of calls needed.
+    @param _addr Address to claim fees for
+    @param _max_iterations Maximum number of points and weeks to look at
+    @return bool True if more fees remain to be claimed in another call
+    """
+    assert not self.is_killed
+    assert _max_iterations > 1
+
+    last_token_time: uint256 = self._checkpoint_for_claim()
+
+    amount: uint256 = 0
+    remaining: bool = False
+    amount, remaining = self._claim(
+        _addr,
+        self.voting_escrow,
+        last_token_time,
+        convert(min(_max_iterations, MAX_CLAIM_ITERATIONS), int128)
+    )
+    if amount != 0:
+        token: address = self.token
+        assert ERC20(token).transfer(_addr, amount)
+        self.token_last_balance -= amount
+
+    return remaining
+
+
+@view
+@internal
+def _claim_calls(addr: address, ve: address, _last_token_time: uint256, _max_iterations: int128) -> uint256:
+    # Follows `_claim` over consecutive calls, without claiming
+    user_epoch: uint256 = 0
+
+    max_user_epoch: uint256 = VotingEscrow(ve).user_point_epoch(addr)
+    _start_time: uint256 = self.start_time
+
+    if max_user_epoch == 0:
+        return 0
+
+    week_cursor: uint256 = self.time_cursor_of[addr]
+    resumed: bool = week_cursor != 0
+    if week_cursor == 0:
+        user_epoch = self._find_timestamp_user_epoch(ve, addr, _start_time, max_user_epoch)
+    else:
+        user_epoch = self.user_epoch_of[addr]
+
+    if user_epoch == 0:
+        user_epoch = 1
+
+    user_point: Point = VotingEscrow(ve).user_point_history(addr, user_epoch)
+
+    if week_cursor == 0:
+        week_cursor = (user_point.ts + WEEK - 1) / WEEK * WEEK
+
+    if week_cursor < _start_time:
+        week_cursor = _start_time
+    old_user_point: Point = empty(Point)
+    calls: uint256 = 0
+    iterations: int128 = 0
+    counted: bool = False
+
+    for i in range(MAX_CLAIM_SIMULATION):
+        if iterations == 0:
+            if calls > 0:
+                # Each call after the first starts again from the stored user epoch
+                user_epoch = min(max_user_epoch, user_epoch - 1)
+                if user_epoch == 0:
+                    user_epoch = 1
+                user_point = VotingEscrow(ve).user_point_history(addr, user_epoch)
+                old_user_point = empty(Point)
+            if resumed or calls > 0:
+                # Reloading the stored point does not need a call of its own
+                if week_cursor >= user_point.ts and user_epoch <= max_user_epoch:
+                    user_epoch += 1
+                    old_user_point = user_point
+                    if user_epoch > max_user_epoch:
+                        user_point = empty(Point)
+                    else:
+                        user_point = VotingEscrow(ve).user_point_history(addr, user_epoch)
+                    iterations = 1
+            counted = False
+
+        # Same conditions as the end of the claim
+        if week_cursor >= _last_token_time:
+            return calls
+        if user_epoch > max_user_epoch:
+            dt: int128 = convert(week_cursor - old_user_point.ts, int128)
+            if old_user_point.bias - dt * old_user_point.slope <= 0:
+                return calls
+
+        if not counted:
+            calls += 1
+            counted = True
+
+        if week_cursor >= user_point.ts and user_epoch <= max_user_epoch:
+            user_epoch += 1
+            old_user_point = user_point
+            if user_epoch > max_user_epoch:
+                user_point = empty(Point)
+            else:
+                user_point = VotingEscrow(ve).user_point_history(addr, user_epoch)
+        else:
+            week_cursor += WEEK
+
+        iterations += 1
+        if iterations == _max_iterations:
+            iterations = 0
+
+    raise "Too many iterations"
+
+
+@view
+@external
+def claim_calls(_addr: address, _max_iterations: uint256 = 50) -> uint256:
+    """
+    @notice Get the number of calls needed to claim all fees for `_addr`
+    @dev Counts calls to `claim_partial` with the same `_max_iterations`,
+         or to `claim` with the default of 50, made now and in a row
+    @param _addr Address to claim fees for
+    @param _max_iterations Maximum number of points and weeks looked at per call
+    @return uint256 Number of calls
+    """
+    assert _max_iterations > 1
+
+    last_token_time: uint256 = self.last_token_time
+    if self.can_checkpoint_token and (block.timestamp > last_token_time + TOKEN_CHECKPOINT_DEADLINE):
+        last_token_time = block.timestamp
+    last_token_time = last_token_time / WEEK * WEEK
+
+    return self._claim_calls(
+        _addr,
+        self.voting_escrow,
+        last_token_time,
+        convert(min(_max_iterations, MAX_CLAIM_ITERATIONS), int128)
+    )
+
+
 @external
 def burn(_coin: address) -> bool:
     """
@@ -13,6 +13,9 @@ WEEK: constant(uint256) = 604800
 # Cannot change weight votes more often than once in 10 days
 WEIGHT_VOTE_DELAY: constant(uint256) = 10 * 86400
 
+# Maximum number of gauges voted for in one `vote_for_many_gauge_weights` call
+MAX_BATCH_VOTES: constant(int128) = 20
+
 
 struct Point:
     bias: uint256
@@ -224,10 +227,11 @@ def _get_total() -> uint256:
     @return Total weight
     """
     t: uint256 = self.time_total
-    _n_gauge_types: int128 = self.n_gauge_types
     if t > block.timestamp:
-        # If we have already checkpointed - still need to change the value
-        t -= WEEK
+        # Already filled - every type is filled as well, and changes to the sum
+        # of a type since then have been applied to the total as differences
+        return self.points_total[t]
+    _n_gauge_types: int128 = self.n_gauge_types
     pt: uint256 = self.points_total[t]
 
     for gauge_type in range(100):
@@ -286,6 +290,118 @@ def _get_weight(gauge_addr: address) -> uint256:
         return 0
 
 
+@internal
+def _fill_type_weight(gauge_type: int128, _until: uint256):
+    """
+    @notice Fill historic type weights week-over-week up to the first week
+            after `_until`, as in `_get_type_weight`
+    @param gauge_type Gauge type id
+    @param _until Time to fill up to
+    """
+    t: uint256 = self.time_type_weight[gauge_type]
+    if t > 0:
+        w: uint256 = self.points_type_weight[gauge_type][t]
+        for i in range(500):
+            if t > _until:
+                break
+            t += WEEK
+            self.points_type_weight[gauge_type][t] = w
+            if t > _until:
+                self.time_type_weight[gauge_type] = t
+
+
+@internal
+def _fill_sum(gauge_type: int128, _until: uint256):
+    """
+    @notice Fill sum of gauge weights for the same type week-over-week up to
+            the first week after `_until`, as in `_get_sum`
+    @param gauge_type Gauge type id
+    @param _until Time to fill up to
+    """
+    t: uint256 = self.time_sum[gauge_type]
+    if t > 0:
+        pt: Point = self.points_sum[gauge_type][t]
+        for i in range(500):
+            if t > _until:
+                break
+            t += WEEK
+            d_bias: uint256 = pt.slope * WEEK
+            if pt.bias > d_bias:
+                pt.bias -= d_bias
+                d_slope: uint256 = self.changes_sum[gauge_type][t]
+                pt.slope -= d_slope
+            else:
+                pt.bias = 0
+                pt.slope = 0
+            self.points_sum[gauge_type][t] = pt
+            if t > _until:
+                self.time_sum[gauge_type] = t
+
+
+@internal
+def _fill_total(_until: uint256):
+    """
+    @notice Fill historic total weights week-over-week up to the first week
+            after `_until`, as in `_get_total`
+    @param _until Time to fill up to
+    """
+    t: uint256 = self.time_total
+    _n_gauge_types: int128 = self.n_gauge_types
+    if t > block.timestamp:
+        # If we have already checkpointed - still need to change the value
+        t -= WEEK
+
+    for gauge_type in range(100):
+        if gauge_type == _n_gauge_types:
+            break
+        self._fill_sum(gauge_type, _until)
+        self._fill_type_weight(gauge_type, _until)
+
+    for i in range(500):
+        if t > _until:
+            break
+        t += WEEK
+        pt: uint256 = 0
+        for gauge_type in range(100):
+            if gauge_type == _n_gauge_types:
+                break
+            type_sum: uint256 = self.points_sum[gauge_type][t].bias
+            type_weight: uint256 = self.points_type_weight[gauge_type][t]
+            pt += type_sum * type_weight
+        self.points_total[t] = pt
+
+        if t > _until:
+            self.time_total = t
+
+
+@internal
+def _fill_weight(gauge_addr: address, _until: uint256):
+    """
+    @notice Fill historic gauge weights week-over-week up to the first week
+            after `_until`, as in `_get_weight`
+    @param gauge_addr Address of the gauge
+    @param _until Time to fill up to
+    """
+    t: uint256 = self.time_weight[gauge_addr]
+    if t > 0:
+        pt: Point = self.points_weight[gauge_addr][t]
+        for i in range(500):
+            if t > _until:
+                break
+            t += WEEK
+            d_bias: uint256 = pt.slope * WEEK
+            if pt.bias > d_bias:
+                pt.bias -= d_bias
+                d_slope: uint256 = self.changes_weight[gauge_addr][t]
+                pt.slope -= d_slope
+            else:
+                pt.bias = 0
+                pt.slope = 0
+            self.points_weight[gauge_addr][t] = pt
+            if t > _until:
+                self.time_weight[gauge_addr] = t
+
+
 @external
 def add_gauge(addr: address, gauge_type: int128, weight: uint256 = 0):
     """
@@ -342,6 +458,35 @@ def checkpoint_gauge(addr: address):
     self._get_total()
 
 
+@external
+def catch_up(_max_weeks: uint256):
+    """
+    @notice Fill data common for all gauges by at most `_max_weeks` weeks
+    @dev Fills the sum of weights and the weight of every type, and the total
+         weight. A long backlog of missed checkins can be filled over several
+         transactions, instead of within the next vote or checkpoint.
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    if _max_weeks > 0:
+        # types are always filled at least as far as the total
+        t: uint256 = self.time_total
+        self._fill_total(min(block.timestamp, t + (min(_max_weeks, 500) - 1) * WEEK))
+
+
+@external
+def catch_up_gauge(addr: address, _max_weeks: uint256):
+    """
+    @notice Fill data for a specific gauge by at most `_max_weeks` weeks
+    @dev Unlike `checkpoint_gauge`, data common for all gauges is not filled.
+         Use `catch_up` for that.
+    @param addr Gauge address
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    if _max_weeks > 0:
+        t: uint256 = self.time_weight[addr]
+        self._fill_weight(addr, min(block.timestamp, t + (min(_max_weeks, 500) - 1) * WEEK))
+
+
 @internal
 @view
 def _gauge_relative_weight(addr: address, time: uint256) -> uint256:
@@ -522,13 +667,16 @@ def vote_for_gauge_weights(_gauge_addr: address, _user_weight: uint256):
     ## Remove old and schedule new slope changes
     # Remove slope changes for old slopes
     # Schedule recording of initial slope for next_time
+    # The total is filled first, so that only the change in the sum of this type is applied to it
+    _total_weight: uint256 = self._get_total()
     old_weight_bias: uint256 = self._get_weight(_gauge_addr)
     old_weight_slope: uint256 = self.points_weight[_gauge_addr][next_time].slope
     old_sum_bias: uint256 = self._get_sum(gauge_type)
     old_sum_slope: uint256 = self.points_sum[gauge_type][next_time].slope
+    new_sum_bias: uint256 = max(old_sum_bias + new_bias, old_bias) - old_bias
 
     self.points_weight[_gauge_addr][next_time].bias = max(old_weight_bias + new_bias, old_bias) - old_bias
-    self.points_sum[gauge_type][next_time].bias = max(old_sum_bias + new_bias, old_bias) - old_bias
+    self.points_sum[gauge_type][next_time].bias = new_sum_bias
     if old_slope.end > next_time:
         self.points_weight[_gauge_addr][next_time].slope = max(old_weight_slope + new_slope.slope, old_slope.slope) - old_slope.slope
         self.points_sum[gauge_type][next_time].slope = max(old_sum_slope + new_slope.slope, old_slope.slope) - old_slope.slope
@@ -543,7 +691,8 @@ def vote_for_gauge_weights(_gauge_addr: address, _user_weight: uint256):
     self.changes_weight[_gauge_addr][new_slope.end] += new_slope.slope
     self.changes_sum[gauge_type][new_slope.end] += new_slope.slope
 
-    self._get_total()
+    type_weight: uint256 = self.points_type_weight[gauge_type][next_time]
+    self.points_total[next_time] = _total_weight + new_sum_bias * type_weight - old_sum_bias * type_weight
 
     self.vote_user_slopes[msg.sender][_gauge_addr] = new_slope
 
@@ -553,6 +702,119 @@ def vote_for_gauge_weights(_gauge_addr: address, _user_weight: uint256):
     log VoteForGauge(block.timestamp, msg.sender, _gauge_addr, _user_weight)
 
 
+@external
+def vote_for_many_gauge_weights(
+    _gauge_addrs: address[MAX_BATCH_VOTES],
+    _user_weights: uint256[MAX_BATCH_VOTES]
+):
+    """
+    @notice Allocate voting power for changing the weights of several pools at once
+    @dev Votes are applied in turn as in `vote_for_gauge_weights`, but the lock of
+         `msg.sender` is read once, and the sum of weights of each gauge type is
+         updated in memory and stored once, with its change applied to the total
+         weight. Voting power is checked after all votes are applied, so power can be
+         moved between gauges in any order. The list of gauges is terminated by
+         the first `ZERO_ADDRESS`.
+    @param _gauge_addrs Gauges which `msg.sender` votes for
+    @param _user_weights Weight for each gauge in bps (units of 0.01%)
+    """
+    escrow: address = self.voting_escrow
+    slope: uint256 = convert(VotingEscrow(escrow).get_last_user_slope(msg.sender), uint256)
+    lock_end: uint256 = VotingEscrow(escrow).locked__end(msg.sender)
+    next_time: uint256 = (block.timestamp + WEEK) / WEEK * WEEK
+    assert lock_end > next_time, "Your token lock expires too soon"
+    new_dt: uint256 = lock_end - next_time
+
+    power_used: uint256 = self.vote_user_power[msg.sender]
+    _total_weight: uint256 = self._get_total()
+
+    # Gauge types voted for, with their sum of weights at `next_time` before
+    # and after the votes, and the slope changes to schedule at `lock_end`
+    types: int128[MAX_BATCH_VOTES] = empty(int128[MAX_BATCH_VOTES])
+    old_sum_biases: uint256[MAX_BATCH_VOTES] = empty(uint256[MAX_BATCH_VOTES])
+    sum_biases: uint256[MAX_BATCH_VOTES] = empty(uint256[MAX_BATCH_VOTES])
+    sum_slopes: uint256[MAX_BATCH_VOTES] = empty(uint256[MAX_BATCH_VOTES])
+    sum_changes: uint256[MAX_BATCH_VOTES] = empty(uint256[MAX_BATCH_VOTES])
+    n_types: int128 = 0
+
+    for i in range(MAX_BATCH_VOTES):
+        _gauge_addr: address = _gauge_addrs[i]
+        if _gauge_addr == ZERO_ADDRESS:
+            break
+        _user_weight: uint256 = _user_weights[i]
+        assert (_user_weight >= 0) and (_user_weight <= 10000), "You used all your voting power"
+        assert block.timestamp >= self.last_user_vote[msg.sender][_gauge_addr] + WEIGHT_VOTE_DELAY, "Cannot vote so often"
+
+        gauge_type: int128 = self.gauge_types_[_gauge_addr] - 1
+        assert gauge_type >= 0, "Gauge not added"
+
+        # Find the type in memory, reading its sum on first use
+        idx: int128 = n_types
+        for j in range(MAX_BATCH_VOTES):
+            if j == n_types:
+                break
+            if types[j] == gauge_type:
+                idx = j
+                break
+        if idx == n_types:
+            types[idx] = gauge_type
+            old_sum_biases[idx] = self._get_sum(gauge_type)
+            sum_biases[idx] = old_sum_biases[idx]
+            sum_slopes[idx] = self.points_sum[gauge_type][next_time].slope
+            n_types += 1
+
+        old_slope: VotedSlope = self.vote_user_slopes[msg.sender][_gauge_addr]
+        old_dt: uint256 = 0
+        if old_slope.end > next_time:
+            old_dt = old_slope.end - next_time
+        old_bias: uint256 = old_slope.slope * old_dt
+        new_slope: VotedSlope = VotedSlope({
+            slope: slope * _user_weight / 10000,
+            end: lock_end,
+            power: _user_weight
+        })
+        new_bias: uint256 = new_slope.slope * new_dt
+
+        power_used = power_used + new_slope.power - old_slope.power
+
+        old_weight_bias: uint256 = self._get_weight(_gauge_addr)
+        old_weight_slope: uint256 = self.points_weight[_gauge_addr][next_time].slope
+
+        self.points_weight[_gauge_addr][next_time].bias = max(old_weight_bias + new_bias, old_bias) - old_bias
+        sum_biases[idx] = max(sum_biases[idx] + new_bias, old_bias) - old_bias
+        if old_slope.end > next_time:
+            self.points_weight[_gauge_addr][next_time].slope = max(old_weight_slope + new_slope.slope, old_slope.slope) - old_slope.slope
+            sum_slopes[idx] = max(sum_slopes[idx] + new_slope.slope, old_slope.slope) - old_slope.slope
+        else:
+            self.points_weight[_gauge_addr][next_time].slope += new_slope.slope
+            sum_slopes[idx] += new_slope.slope
+        if old_slope.end > block.timestamp:
+            # Cancel old slope changes if they still didn't happen
+            self.changes_weight[_gauge_addr][old_slope.end] -= old_slope.slope
+            self.changes_sum[gauge_type][old_slope.end] -= old_slope.slope
+        self.changes_weight[_gauge_addr][new_slope.end] += new_slope.slope
+        sum_changes[idx] += new_slope.slope
+
+        self.vote_user_slopes[msg.sender][_gauge_addr] = new_slope
+        self.last_user_vote[msg.sender][_gauge_addr] = block.timestamp
+
+        log VoteForGauge(block.timestamp, msg.sender, _gauge_addr, _user_weight)
+
+    assert (power_used >= 0) and (power_used <= 10000), 'Used too much power'
+    self.vote_user_power[msg.sender] = power_used
+
+    for i in range(MAX_BATCH_VOTES):
+        if i == n_types:
+            break
+        gauge_type: int128 = types[i]
+        self.points_sum[gauge_type][next_time] = Point({bias: sum_biases[i], slope: sum_slopes[i]})
+        self.changes_sum[gauge_type][lock_end] += sum_changes[i]
+        type_weight: uint256 = self.points_type_weight[gauge_type][next_time]
+        _total_weight = _total_weight + sum_biases[i] * type_weight - old_sum_biases[i] * type_weight
+
+    self.points_total[next_time] = _total_weight
+
+
 @external
 @view
 def get_gauge_weight(addr: address) -> uint256:
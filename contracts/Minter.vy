@@ -17,6 +17,10 @@ interface GaugeController:
     def gauge_types(addr: address) -> int128: view
 
 
+# Maximum number of gauges in a list, each ABI encoded as 32 bytes
+MAX_LIST: constant(int128) = 100
+
+
 event Minted:
     recipient: indexed(address)
     gauge: address
@@ -77,6 +81,35 @@ def mint_many(gauge_addrs: address[8]):
         self._mint_for(gauge_addrs[i], msg.sender)
 
 
+@external
+@nonreentrant('lock')
+def mint_list(gauge_addrs: Bytes[3200]):
+    """
+    @notice Mint everything which belongs to `msg.sender` across multiple gauges
+    @dev Addresses are ABI encoded as 32 bytes each, without a length prefix.
+         `_mint_for` is inlined, as internal calls copy the whole list.
+    @param gauge_addrs List of `LiquidityGauge` addresses
+    """
+    assert len(gauge_addrs) % 32 == 0  # dev: invalid address list
+    length: int128 = convert(len(gauge_addrs), int128)
+
+    for i in range(MAX_LIST):
+        if i * 32 == length:
+            break
+        gauge_addr: address = extract32(gauge_addrs, i * 32, output_type=address)
+        assert GaugeController(self.controller).gauge_types(gauge_addr) >= 0  # dev: gauge is not added
+
+        LiquidityGauge(gauge_addr).user_checkpoint(msg.sender)
+        total_mint: uint256 = LiquidityGauge(gauge_addr).integrate_fraction(msg.sender)
+        to_mint: uint256 = total_mint - self.minted[msg.sender][gauge_addr]
+
+        if to_mint != 0:
+            MERC20(self.token).mint(msg.sender, to_mint)
+            self.minted[msg.sender][gauge_addr] = total_mint
+
+            log Minted(msg.sender, gauge_addr, total_mint)
+
+
 @external
 @nonreentrant('lock')
 def mint_for(gauge_addr: address, _for: address):
@@ -35,6 +35,8 @@ interface Registry:
 
 
 MAX_COINS: constant(int128) = 8
+# Maximum number of addresses in a list, each ABI encoded as 32 bytes
+MAX_LIST: constant(int128) = 100
 ADDRESS_PROVIDER: constant(address) = 0x0000000022D53366457F9d5E68Ec105046FC4383
 
 struct PoolInfo:
@@ -218,6 +220,23 @@ def withdraw_many(_pools: address[20]):
         Curve(pool).withdraw_admin_fees()
 
 
+@external
+@nonreentrant('lock')
+def withdraw_list(_pools: Bytes[3200]):
+    """
+    @notice Withdraw admin fees from multiple pools
+    @dev Addresses are ABI encoded as 32 bytes each, without a length prefix
+    @param _pools List of pool addresses to withdraw admin fees from
+    """
+    assert len(_pools) % 32 == 0  # dev: invalid address list
+    length: int128 = convert(len(_pools), int128)
+
+    for i in range(MAX_LIST):
+        if i * 32 == length:
+            break
+        Curve(extract32(_pools, i * 32, output_type=address)).withdraw_admin_fees()
+
+
 @external
 @nonreentrant('burn')
 def burn(_coin: address):
@@ -258,6 +277,32 @@ def burn_many(_coins: address[20]):
         Burner(self.burners[coin]).burn(coin, value=_value)  # dev: should implement burn()
 
 
+@external
+@nonreentrant('burn')
+def burn_list(_coins: Bytes[3200]):
+    """
+    @notice Burn accrued admin fees from multiple coins
+    @dev Only callable by an EOA to prevent flashloan exploits.
+         Addresses are ABI encoded as 32 bytes each, without a length prefix.
+    @param _coins List of coin addresses
+    """
+    assert tx.origin == msg.sender
+    assert not self.burner_kill
+    assert len(_coins) % 32 == 0  # dev: invalid address list
+    length: int128 = convert(len(_coins), int128)
+
+    for i in range(MAX_LIST):
+        if i * 32 == length:
+            break
+        coin: address = extract32(_coins, i * 32, output_type=address)
+
+        _value: uint256 = 0
+        if coin == 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE:
+            _value = self.balance
+
+        Burner(self.burners[coin]).burn(coin, value=_value)  # dev: should implement burn()
+
+
 @external
 @nonreentrant('lock')
 def kill_me(_pool: address):
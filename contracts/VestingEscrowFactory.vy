@@ -9,6 +9,7 @@
 from vyper.interfaces import ERC20
 
 MIN_VESTING_DURATION: constant(uint256) = 86400 * 365
+MAX_BATCH_SIZE: constant(int128) = 32
 
 
 interface VestingEscrowSimple:
@@ -46,6 +47,30 @@ def __init__(_target: address, _admin: address):
     self.admin = _admin
 
 
+@internal
+def _deploy_vesting_contract(
+    _token: address,
+    _recipient: address,
+    _amount: uint256,
+    _can_disable: bool,
+    _vesting_start: uint256,
+    _vesting_end: uint256
+) -> address:
+    _contract: address = create_forwarder_to(self.target)
+    assert ERC20(_token).approve(_contract, _amount)  # dev: approve failed
+    VestingEscrowSimple(_contract).initialize(
+        self.admin,
+        _token,
+        _recipient,
+        _amount,
+        _vesting_start,
+        _vesting_end,
+        _can_disable
+    )
+
+    return _contract
+
+
 @external
 def deploy_vesting_contract(
     _token: address,
@@ -71,19 +96,52 @@ def deploy_vesting_contract(
     assert _vesting_start >= block.timestamp  # dev: start time too soon
     assert _vesting_duration >= MIN_VESTING_DURATION  # dev: duration too short
 
-    _contract: address = create_forwarder_to(self.target)
-    assert ERC20(_token).approve(_contract, _amount)  # dev: approve failed
-    VestingEscrowSimple(_contract).initialize(
-        self.admin,
+    return self._deploy_vesting_contract(
         _token,
         _recipient,
         _amount,
+        _can_disable,
         _vesting_start,
-        _vesting_start + _vesting_duration,
-        _can_disable
+        _vesting_start + _vesting_duration
     )
 
-    return _contract
+
+@external
+def deploy_many_vesting_contracts(
+    _token: address,
+    _recipients: address[MAX_BATCH_SIZE],
+    _amounts: uint256[MAX_BATCH_SIZE],
+    _can_disable: bool,
+    _vesting_duration: uint256,
+    _vesting_start: uint256 = block.timestamp
+) -> uint256:
+    """
+    @notice Deploy a new vesting contract for each of multiple recipients
+    @dev All contracts share the same token, schedule and `_can_disable` setting.
+         The list of recipients is terminated by the first `ZERO_ADDRESS`.
+    @param _token Address of the ERC20 token being distributed
+    @param _recipients List of addresses to vest tokens for
+    @param _amounts Amount of tokens being vested for each recipient
+    @param _can_disable Can admin disable recipients' ability to claim tokens?
+    @param _vesting_duration Time period over which tokens are released
+    @param _vesting_start Epoch time when tokens begin to vest
+    @return Number of vesting contracts deployed
+    """
+    assert msg.sender == self.admin  # dev: admin only
+    assert _vesting_start >= block.timestamp  # dev: start time too soon
+    assert _vesting_duration >= MIN_VESTING_DURATION  # dev: duration too short
+
+    _vesting_end: uint256 = _vesting_start + _vesting_duration
+    _count: uint256 = 0
+    for i in range(MAX_BATCH_SIZE):
+        if _recipients[i] == ZERO_ADDRESS:
+            break
+        self._deploy_vesting_contract(
+            _token, _recipients[i], _amounts[i], _can_disable, _vesting_start, _vesting_end
+        )
+        _count += 1
+
+    return _count
 
 
 @external
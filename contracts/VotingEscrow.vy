@@ -541,23 +541,36 @@ def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
         return convert(last_point.bias, uint256)
 
 
-@external
+@internal
 @view
-def balanceOfAt(addr: address, _block: uint256) -> uint256:
+def find_block_epoch_hinted(_block: uint256, max_epoch: uint256, _hint: uint256) -> uint256:
     """
-    @notice Measure voting power of `addr` at block height `_block`
-    @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
-    @param addr User's wallet address
-    @param _block Block to calculate the voting power at
-    @return Voting power
+    @notice Verify a hint for the result of `find_block_epoch`
+    @dev Falls back to the binary search if the hint is wrong
+    @param _block Block to find
+    @param max_epoch Don't go beyond this epoch
+    @param _hint Last epoch with a block number not greater than `_block`
+    @return Epoch, same as `find_block_epoch`
     """
-    # Copying and pasting totalSupply code because Vyper cannot pass by
-    # reference yet
-    assert _block <= block.number
+    if _hint <= max_epoch:
+        if _hint == 0 or self.point_history[_hint].blk <= _block:
+            if _hint == max_epoch or self.point_history[_hint + 1].blk > _block:
+                return _hint
+    return self.find_block_epoch(_block, max_epoch)
 
-    # Binary search
+
+@internal
+@view
+def find_user_block_epoch(addr: address, _block: uint256, max_epoch: uint256) -> uint256:
+    """
+    @notice Binary search for the last user point at or before a block
+    @param addr User's wallet address
+    @param _block Block to find
+    @param max_epoch Don't go beyond this user epoch
+    @return User epoch
+    """
     _min: uint256 = 0
-    _max: uint256 = self.user_point_epoch[addr]
+    _max: uint256 = max_epoch
     for i in range(128):  # Will be always enough for 128-bit numbers
         if _min >= _max:
             break
@@ -566,11 +579,42 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
             _min = _mid
         else:
             _max = _mid - 1
+    return _min
 
-    upoint: Point = self.user_point_history[addr][_min]
 
-    max_epoch: uint256 = self.epoch
-    _epoch: uint256 = self.find_block_epoch(_block, max_epoch)
+@internal
+@view
+def find_user_block_epoch_hinted(addr: address, _block: uint256, max_epoch: uint256, _hint: uint256) -> uint256:
+    """
+    @notice Verify a hint for the result of `find_user_block_epoch`
+    @dev Falls back to the binary search if the hint is wrong
+    @param addr User's wallet address
+    @param _block Block to find
+    @param max_epoch Don't go beyond this user epoch
+    @param _hint Last user epoch with a block number not greater than `_block`
+    @return User epoch, same as `find_user_block_epoch`
+    """
+    if _hint <= max_epoch:
+        if _hint == 0 or self.user_point_history[addr][_hint].blk <= _block:
+            if _hint == max_epoch or self.user_point_history[addr][_hint + 1].blk > _block:
+                return _hint
+    return self.find_user_block_epoch(addr, _block, max_epoch)
+
+
+@internal
+@view
+def balance_of_at(addr: address, _block: uint256, _user_epoch: uint256, _epoch: uint256, max_epoch: uint256) -> uint256:
+    """
+    @notice Measure voting power of `addr` at block height `_block`
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @param _user_epoch Last user epoch at or before `_block`
+    @param _epoch Last epoch at or before `_block`
+    @param max_epoch Current epoch
+    @return Voting power
+    """
+    upoint: Point = self.user_point_history[addr][_user_epoch]
+
     point_0: Point = self.point_history[_epoch]
     d_block: uint256 = 0
     d_t: uint256 = 0
@@ -592,6 +636,53 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
         return 0
 
 
+@external
+@view
+def balanceOfAt(addr: address, _block: uint256) -> uint256:
+    """
+    @notice Measure voting power of `addr` at block height `_block`
+    @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @return Voting power
+    """
+    assert _block <= block.number
+
+    max_epoch: uint256 = self.epoch
+    return self.balance_of_at(
+        addr,
+        _block,
+        self.find_user_block_epoch(addr, _block, self.user_point_epoch[addr]),
+        self.find_block_epoch(_block, max_epoch),
+        max_epoch
+    )
+
+
+@external
+@view
+def balanceOfAtHinted(addr: address, _block: uint256, _user_epoch: uint256, _epoch: uint256) -> uint256:
+    """
+    @notice Measure voting power of `addr` at block height `_block`, using epoch hints
+    @dev Same result as `balanceOfAt`. Correct hints are verified with two reads
+         each, instead of two binary searches. Wrong hints fall back to the search.
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @param _user_epoch Last user epoch of `addr` with a block number not greater than `_block`
+    @param _epoch Last epoch with a block number not greater than `_block`
+    @return Voting power
+    """
+    assert _block <= block.number
+
+    max_epoch: uint256 = self.epoch
+    return self.balance_of_at(
+        addr,
+        _block,
+        self.find_user_block_epoch_hinted(addr, _block, self.user_point_epoch[addr], _user_epoch),
+        self.find_block_epoch_hinted(_block, max_epoch, _epoch),
+        max_epoch
+    )
+
+
 @internal
 @view
 def supply_at(point: Point, t: uint256) -> uint256:
@@ -634,18 +725,16 @@ def totalSupply(t: uint256 = block.timestamp) -> uint256:
     return self.supply_at(last_point, t)
 
 
-@external
+@internal
 @view
-def totalSupplyAt(_block: uint256) -> uint256:
+def supply_at_block(_block: uint256, target_epoch: uint256, _epoch: uint256) -> uint256:
     """
-    @notice Calculate total voting power at some point in the past
+    @notice Calculate total voting power at block height `_block`
     @param _block Block to calculate the total voting power at
+    @param target_epoch Last epoch at or before `_block`
+    @param _epoch Current epoch
     @return Total voting power at `_block`
     """
-    assert _block <= block.number
-    _epoch: uint256 = self.epoch
-    target_epoch: uint256 = self.find_block_epoch(_block, _epoch)
-
     point: Point = self.point_history[target_epoch]
     dt: uint256 = 0
     if target_epoch < _epoch:
@@ -660,6 +749,36 @@ def totalSupplyAt(_block: uint256) -> uint256:
     return self.supply_at(point, point.ts + dt)
 
 
+@external
+@view
+def totalSupplyAt(_block: uint256) -> uint256:
+    """
+    @notice Calculate total voting power at some point in the past
+    @param _block Block to calculate the total voting power at
+    @return Total voting power at `_block`
+    """
+    assert _block <= block.number
+    _epoch: uint256 = self.epoch
+    return self.supply_at_block(_block, self.find_block_epoch(_block, _epoch), _epoch)
+
+
+@external
+@view
+def totalSupplyAtHinted(_block: uint256, _epoch_hint: uint256) -> uint256:
+    """
+    @notice Calculate total voting power at some point in the past, using an epoch hint
+    @dev Same result as `totalSupplyAt`. A correct hint is verified with two reads,
+         instead of a binary search. A wrong hint falls back to the search.
+    @param _block Block to calculate the total voting power at
+    @param _epoch_hint Last epoch with a block number not greater than `_block`
+    @return Total voting power at `_block`
+    """
+    assert _block <= block.number
+    _epoch: uint256 = self.epoch
+    target_epoch: uint256 = self.find_block_epoch_hinted(_block, _epoch, _epoch_hint)
+    return self.supply_at_block(_block, target_epoch, _epoch)
+
+
 # Dummy methods for compatibility with Aragon
 
 @external
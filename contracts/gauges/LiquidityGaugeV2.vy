@@ -202,9 +202,11 @@ def _update_liquidity_limit(addr: address, l: uint256, L: uint256):
 
 
 @internal
-def _checkpoint_rewards(_addr: address, _total_supply: uint256):
+def _checkpoint_rewards(_addr: address, _total_supply: uint256, _claim: bool):
     """
     @notice Claim pending rewards and checkpoint rewards for a user
+    @param _claim Claim from the reward contract. If False, only rewards
+                  which have already been received are paid out
     """
     if _total_supply == 0:
         return
@@ -216,17 +218,21 @@ def _checkpoint_rewards(_addr: address, _total_supply: uint256):
         if token == ZERO_ADDRESS:
             break
         reward_tokens[i] = token
-        reward_balances[i] = ERC20(token).balanceOf(self)
+        if _claim:
+            reward_balances[i] = ERC20(token).balanceOf(self)
 
-    # claim from reward contract
-    raw_call(self.reward_contract, slice(self.reward_sigs, 8, 4))  # dev: bad claim sig
+    if _claim:
+        # claim from reward contract
+        raw_call(self.reward_contract, slice(self.reward_sigs, 8, 4))  # dev: bad claim sig
 
     user_balance: uint256 = self.balanceOf[_addr]
     for i in range(MAX_REWARDS):
         token: address = reward_tokens[i]
         if token == ZERO_ADDRESS:
             break
-        dI: uint256 = 10**18 * (ERC20(token).balanceOf(self) - reward_balances[i]) / _total_supply
+        dI: uint256 = 0
+        if _claim:
+            dI = 10**18 * (ERC20(token).balanceOf(self) - reward_balances[i]) / _total_supply
         if _addr == ZERO_ADDRESS:
             if dI != 0:
                 self.reward_integral[token] += dI
@@ -361,7 +367,7 @@ def claimable_reward(_addr: address, _token: address) -> uint256:
     """
     claimable: uint256 = ERC20(_token).balanceOf(_addr)
     if self.reward_contract != ZERO_ADDRESS:
-        self._checkpoint_rewards(_addr, self.totalSupply)
+        self._checkpoint_rewards(_addr, self.totalSupply, True)
     claimable = ERC20(_token).balanceOf(_addr) - claimable
 
     integral: uint256 = self.reward_integral[_token]
@@ -380,7 +386,7 @@ def claim_rewards(_addr: address = msg.sender):
     @notice Claim available reward tokens for `_addr`
     @param _addr Address to claim for
     """
-    self._checkpoint_rewards(_addr, self.totalSupply)
+    self._checkpoint_rewards(_addr, self.totalSupply, True)
 
 
 @external
@@ -462,7 +468,7 @@ def deposit(_value: uint256, _addr: address = msg.sender):
         reward_contract: address = self.reward_contract
         total_supply: uint256 = self.totalSupply
         if reward_contract != ZERO_ADDRESS:
-            self._checkpoint_rewards(_addr, total_supply)
+            self._checkpoint_rewards(_addr, total_supply, True)
 
         total_supply += _value
         new_balance: uint256 = self.balanceOf[_addr] + _value
@@ -498,7 +504,7 @@ def withdraw(_value: uint256):
         reward_contract: address = self.reward_contract
         total_supply: uint256 = self.totalSupply
         if reward_contract != ZERO_ADDRESS:
-            self._checkpoint_rewards(msg.sender, total_supply)
+            self._checkpoint_rewards(msg.sender, total_supply, True)
 
         total_supply -= _value
         new_balance: uint256 = self.balanceOf[msg.sender] - _value
@@ -541,13 +547,14 @@ def _transfer(_from: address, _to: address, _value: uint256):
     if _value != 0:
         total_supply: uint256 = self.totalSupply
         if reward_contract != ZERO_ADDRESS:
-            self._checkpoint_rewards(_from, total_supply)
+            self._checkpoint_rewards(_from, total_supply, True)
         new_balance: uint256 = self.balanceOf[_from] - _value
         self.balanceOf[_from] = new_balance
         self._update_liquidity_limit(_from, new_balance, total_supply)
 
         if reward_contract != ZERO_ADDRESS:
-            self._checkpoint_rewards(_to, total_supply)
+            # rewards were already claimed when checkpointing `_from`
+            self._checkpoint_rewards(_to, total_supply, False)
         new_balance = self.balanceOf[_to] + _value
         self.balanceOf[_to] = new_balance
         self._update_liquidity_limit(_to, new_balance, total_supply)
@@ -664,7 +671,7 @@ def set_rewards(_reward_contract: address, _sigs: bytes32, _reward_tokens: addre
     current_reward_contract: address = self.reward_contract
     total_supply: uint256 = self.totalSupply
     if current_reward_contract != ZERO_ADDRESS:
-        self._checkpoint_rewards(ZERO_ADDRESS, total_supply)
+        self._checkpoint_rewards(ZERO_ADDRESS, total_supply, True)
         withdraw_sig: Bytes[4] = slice(self.reward_sigs, 4, 4)
         if convert(withdraw_sig, uint256) != 0:
             if total_supply != 0:
@@ -719,7 +726,7 @@ def set_rewards(_reward_contract: address, _sigs: bytes32, _reward_tokens: addre
 
     if _reward_contract != ZERO_ADDRESS:
         # do an initial checkpoint to verify that claims are working
-        self._checkpoint_rewards(ZERO_ADDRESS, total_supply)
+        self._checkpoint_rewards(ZERO_ADDRESS, total_supply, True)
 
 
 @external
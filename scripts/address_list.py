@@ -0,0 +1,26 @@
+"""
+Address Lists
+=============
+Encodes the address lists taken by `PoolProxy.withdraw_list` and `burn_list`,
+`Minter.mint_list` and `FeeDistributor.claim_list`.
+
+Each address is ABI encoded as 32 bytes, without a length prefix. Unlike the fixed
+size arrays taken by the `_many` functions, lists are not padded with `ZERO_ADDRESS`,
+and hold up to 100 addresses.
+"""
+
+try:
+    from eth_abi import encode as encode_abi
+except ImportError:
+    from eth_abi import encode_abi
+
+MAX_LENGTH = 100
+
+
+def encode_addresses(addresses):
+    """
+    Encode up to `MAX_LENGTH` addresses as a list.
+    """
+    if len(addresses) > MAX_LENGTH:
+        raise ValueError(f"Cannot encode more than {MAX_LENGTH} addresses")
+    return encode_abi(["address"] * len(addresses), [str(i).lower() for i in addresses])
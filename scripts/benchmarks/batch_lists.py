@@ -0,0 +1,190 @@
+import json
+from math import ceil
+
+from brownie import (
+    ERC20,
+    ERC20CRV,
+    ERC20LP,
+    ZERO_ADDRESS,
+    FeeDistributor,
+    GaugeController,
+    LiquidityGauge,
+    Minter,
+    PoolProxy,
+    VotingEscrow,
+    accounts,
+    chain,
+    compile_source,
+)
+
+from scripts.address_list import encode_addresses
+
+# this script compares the gas used by the fixed size `_many` functions of `PoolProxy`,
+# `Minter` and `FeeDistributor` with their `_list` variants. `_many` calls are padded with
+# `ZERO_ADDRESS`, and split into several transactions once a batch exceeds their array
+# size. both are measured from the same chain state, using a snapshot, and include the
+# base transaction cost and calldata.
+#
+# run with `brownie run benchmarks/batch_lists` in a development network
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+# number of addresses in a batch
+SIZES = [1, 5, 10, 20, 50]
+
+# number of addresses in a batch of fee claims, at most one per account
+CLAIM_SIZES = [1, 5, 10]
+
+RESULTS_JSON = "batch-lists-benchmark.json"
+
+MOCKS = """
+# @version 0.2.7
+
+withdrawn: public(uint256)
+burned: public(HashMap[address, bool])
+
+@external
+def withdraw_admin_fees():
+    self.withdrawn += 1
+
+@payable
+@external
+def burn(_coin: address) -> bool:
+    self.burned[_coin] = True
+    return True
+"""
+
+
+def _padded_calls(fn, addresses, size, *args):
+    # gas used by `fn` over as many padded calls as needed
+    gas_used = 0
+    for i in range(0, len(addresses), size):
+        batch = addresses[i : i + size]
+        padded = [list(x[i : i + size]) + [ZERO_ADDRESS] * (size - len(batch)) for x in args]
+        tx = fn(batch + [ZERO_ADDRESS] * (size - len(batch)), *padded, {"from": accounts[0]})
+        gas_used += tx.gas_used
+    return gas_used
+
+
+def _compare(name, many_fn, list_fn, addresses, size):
+    chain.snapshot()
+    many = _padded_calls(many_fn, addresses, size)
+    chain.revert()
+    tx = list_fn(encode_addresses(addresses))
+    chain.revert()
+
+    calls = ceil(len(addresses) / size)
+    print(
+        f"{name}, {len(addresses)} addresses: {many} in {calls} call(s), {tx.gas_used} listed "
+        f"({1 - tx.gas_used / many:.1%} saved)"
+    )
+    return {"many": many, "many_calls": calls, "list": tx.gas_used}
+
+
+def measure_pool_proxy(sizes=SIZES):
+    admin = accounts[0]
+    proxy = PoolProxy.deploy(admin, admin, admin, {"from": admin})
+    mock = compile_source(MOCKS).Vyper
+    pools = [mock.deploy({"from": admin}) for i in range(max(sizes))]
+    coins = [f"0x{i + 1:040x}" for i in range(max(sizes))]
+
+    _padded_calls(proxy.set_many_burners, coins, 20, [pools[0]] * len(coins))
+
+    results = {"withdraw": {}, "burn": {}}
+    for count in sizes:
+        results["withdraw"][count] = _compare(
+            "withdraw",
+            proxy.withdraw_many,
+            lambda pools: proxy.withdraw_list(pools, {"from": admin}),
+            pools[:count],
+            20,
+        )
+        results["burn"][count] = _compare(
+            "burn",
+            proxy.burn_many,
+            lambda coins: proxy.burn_list(coins, {"from": admin}),
+            coins[:count],
+            20,
+        )
+
+    return results
+
+
+def measure_minter(sizes=SIZES):
+    admin = accounts[0]
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    gauge_controller = GaugeController.deploy(token, voting_escrow, {"from": admin})
+    minter = Minter.deploy(token, gauge_controller, {"from": admin})
+    token.set_minter(minter, {"from": admin})
+    lp_token = ERC20LP.deploy("Curve LP token", "usdCrv", 18, 10 ** 9, {"from": admin})
+
+    gauge_controller.add_type("Liquidity", 10 ** 18, {"from": admin})
+    gauges = []
+    for i in range(max(sizes)):
+        gauge = LiquidityGauge.deploy(lp_token, minter, admin, {"from": admin})
+        gauge_controller.add_gauge(gauge, 0, 10 ** 18, {"from": admin})
+        lp_token.approve(gauge, 10 ** 18, {"from": admin})
+        gauge.deposit(10 ** 18, {"from": admin})
+        gauges.append(gauge)
+    chain.sleep(2 * WEEK)
+    chain.mine()
+
+    results = {"mint": {}}
+    for count in sizes:
+        results["mint"][count] = _compare(
+            "mint",
+            minter.mint_many,
+            lambda gauges: minter.mint_list(gauges, {"from": admin}),
+            gauges[:count],
+            8,
+        )
+
+    return results
+
+
+def measure_fee_distributor(sizes=CLAIM_SIZES):
+    admin = accounts[0]
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    coin = ERC20.deploy("Coin", "COIN", 18, {"from": admin})
+    distributor = FeeDistributor.deploy(
+        voting_escrow, chain.time(), coin, admin, admin, {"from": admin}
+    )
+
+    users = accounts[: max(sizes)]
+    for acct in users:
+        if acct != admin:
+            token.transfer(acct, 10 ** 21, {"from": admin})
+        token.approve(voting_escrow, 10 ** 21, {"from": acct})
+        voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": acct})
+    chain.sleep(3 * WEEK)
+    coin._mint_for_testing(10 ** 24, {"from": distributor})
+    distributor.checkpoint_token({"from": admin})
+    distributor.checkpoint_total_supply({"from": admin})
+
+    results = {"claim": {}}
+    for count in sizes:
+        results["claim"][count] = _compare(
+            "claim",
+            distributor.claim_many,
+            lambda users: distributor.claim_list(users, {"from": admin}),
+            list(users[:count]),
+            20,
+        )
+
+    return results
+
+
+def main():
+    results = {}
+    results.update(measure_pool_proxy())
+    results.update(measure_minter())
+    results.update(measure_fee_distributor())
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
@@ -0,0 +1,70 @@
+import json
+
+from brownie import ZERO_ADDRESS, accounts, chain
+
+from scripts.benchmarks.controller_setup import deploy_gauge_controller
+
+# this script compares the gas used to split a vote across many gauges with one
+# `vote_for_gauge_weights` call per gauge, against a single `vote_for_many_gauge_weights`
+# call. both are measured from the same chain state, using a snapshot. every gauge already
+# carries weight from an earlier voter, and gauges are spread evenly across `TYPES` types.
+#
+# run with `brownie run benchmarks/batch_votes` in a development network
+
+# number of gauges the vote is split across
+SPLITS = [5, 10, 20]
+
+# number of gauge types
+TYPES = 3
+
+# maximum number of gauges in one `vote_for_many_gauge_weights` call
+MAX_BATCH_VOTES = 20
+
+RESULTS_JSON = "batch-votes-benchmark.json"
+
+
+def deploy_system(gauge_count):
+    admin, voter, other = accounts[:3]
+    gauge_controller, gauges = deploy_gauge_controller(TYPES, gauge_count, voters=(voter, other))
+
+    for gauge in gauges:
+        gauge_controller.vote_for_gauge_weights(gauge, 10000 // gauge_count, {"from": other})
+    gauge_controller.checkpoint({"from": admin})
+
+    return gauge_controller, gauges, voter
+
+
+def measure(splits=SPLITS):
+    """
+    Measure the gas used to split a vote across each number of gauges in `splits`,
+    returning a dict of {splits: {"sequential": gas, "batch": gas}}.
+    """
+    results = {}
+    for count in splits:
+        gauge_controller, gauges, voter = deploy_system(count)
+        weight = 10000 // count
+
+        chain.snapshot()
+        sequential = 0
+        for gauge in gauges:
+            tx = gauge_controller.vote_for_gauge_weights(gauge, weight, {"from": voter})
+            sequential += tx.gas_used
+        chain.revert()
+
+        padding = MAX_BATCH_VOTES - count
+        tx = gauge_controller.vote_for_many_gauge_weights(
+            gauges + [ZERO_ADDRESS] * padding, [weight] * count + [0] * padding, {"from": voter}
+        )
+        results[count] = {"sequential": sequential, "batch": tx.gas_used}
+        print(
+            f"{count} gauges: {sequential} sequential, {tx.gas_used} batched "
+            f"({1 - tx.gas_used / sequential:.1%} saved)"
+        )
+
+    return results
+
+
+def main():
+    results = measure()
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
@@ -0,0 +1,116 @@
+import json
+
+from brownie import accounts, chain
+from brownie.exceptions import VirtualMachineError
+
+from scripts.benchmarks.controller_setup import deploy_gauge_controller
+
+# this script measures the gas used to fill the weekly data of `GaugeController` after
+# a period without checkpoints, as a function of the number of stale weeks and gauge types.
+# the data common to all gauges and the data of one gauge are measured separately:
+#
+#   checkpoint / checkpoint_gauge      fill every stale week in one transaction
+#   catch_up / catch_up_gauge          fill at most `max_weeks` weeks per transaction
+#
+# for the bounded functions, the number of transactions and the gas used by the most
+# expensive one are recorded along with the total. a single checkpoint, or a bounded call
+# of `max_weeks` weeks, that does not fit within the block gas limit is recorded as `null`.
+#
+# run with `brownie run benchmarks/catch_up` in a development network
+
+WEEK = 86400 * 7
+
+# parameters - every combination is measured
+STALE_WEEKS = [1, 4, 16, 52, 104, 260, 500]
+TYPES = [1, 5, 10]
+MAX_WEEKS = [10, 50]
+
+RESULTS_JSON = "catch-up-benchmark.json"
+
+
+def deploy_system(types):
+    """
+    Deploy a gauge controller with `types` gauge types and two gauges of each type,
+    with votes scheduling slope changes over the following weeks.
+    """
+    admin, user = accounts[:2]
+    gauge_controller, gauges = deploy_gauge_controller(types, types * 2, 10 ** 18, (user,))
+
+    for gauge in gauges:
+        gauge_controller.vote_for_gauge_weights(gauge, 10000 // len(gauges), {"from": user})
+
+    return gauge_controller, gauges[0], admin
+
+
+def _checkpoint(fn, args, acct):
+    try:
+        return fn(*args, {"from": acct}).gas_used
+    except (ValueError, VirtualMachineError):
+        # exceeds the block gas limit
+        return None
+
+
+def _catch_up(fn, args, acct, max_weeks, last_time):
+    gas = []
+    while last_time() <= chain.time():
+        try:
+            gas.append(fn(*args, max_weeks, {"from": acct}).gas_used)
+        except (ValueError, VirtualMachineError):
+            # `max_weeks` weeks exceed the block gas limit
+            return None
+    return {"txs": len(gas), "max": max(gas), "total": sum(gas)}
+
+
+def measure(stale_weeks=STALE_WEEKS, types=TYPES, max_weeks=MAX_WEEKS):
+    """
+    Measure each combination of parameters, returning a dict of
+    {types: {stale weeks: {function: gas}}}.
+    """
+    results = {}
+    for type_count in types:
+        results[type_count] = {}
+        for weeks in stale_weeks:
+            gauge_controller, gauge, admin = deploy_system(type_count)
+            chain.sleep(weeks * WEEK)
+            chain.mine()
+            chain.snapshot()
+            result = results[type_count][weeks] = {}
+
+            result["checkpoint"] = _checkpoint(gauge_controller.checkpoint, (), admin)
+            chain.revert()
+            for limit in max_weeks:
+                result[f"catch_up[{limit}]"] = _catch_up(
+                    gauge_controller.catch_up, (), admin, limit, gauge_controller.time_total
+                )
+                chain.revert()
+
+            # fill the common data first, so only the gauge's own weeks are measured. the
+            # smallest bound fits within a block for every number of gauge types
+            _catch_up(
+                gauge_controller.catch_up, (), admin, min(max_weeks), gauge_controller.time_total
+            )
+            chain.snapshot()
+            result["checkpoint_gauge"] = _checkpoint(
+                gauge_controller.checkpoint_gauge, (gauge,), admin
+            )
+            chain.revert()
+            for limit in max_weeks:
+                result[f"catch_up_gauge[{limit}]"] = _catch_up(
+                    gauge_controller.catch_up_gauge,
+                    (gauge,),
+                    admin,
+                    limit,
+                    lambda: gauge_controller.time_weight(gauge),
+                )
+                chain.revert()
+
+            for name, gas in result.items():
+                print(f"{type_count} types, {weeks} weeks, {name}: {gas}")
+
+    return results
+
+
+def main():
+    results = measure()
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
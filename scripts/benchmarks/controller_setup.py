@@ -0,0 +1,38 @@
+from brownie import ERC20CRV, GaugeController, VotingEscrow, accounts, chain
+
+# shared deployment for the `GaugeController` benchmarks
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+def deploy_gauge_controller(types, gauge_count, weight=0, voters=()):
+    """
+    Deploy a gauge controller with `types` gauge types of equal weight, and `gauge_count`
+    gauges of `weight` spread evenly across them. Each account in `voters` locks CRV for
+    four years, so that it may vote.
+
+    Returns the gauge controller and a list of gauge addresses.
+    """
+    admin = accounts[0]
+
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    gauge_controller = GaugeController.deploy(token, voting_escrow, {"from": admin})
+
+    for i in range(types):
+        gauge_controller.add_type(f"Type {i}", 10 ** 18, {"from": admin})
+
+    # the controller never calls its gauges, so any address will do
+    gauges = [f"0x{i + 1:040x}" for i in range(gauge_count)]
+    for i, gauge in enumerate(gauges):
+        gauge_controller.add_gauge(gauge, i % types, weight, {"from": admin})
+
+    for acct in voters:
+        token.transfer(acct, 10 ** 24, {"from": admin})
+        token.approve(voting_escrow, 10 ** 24, {"from": acct})
+        voting_escrow.create_lock(10 ** 24, chain.time() + 4 * YEAR - WEEK, {"from": acct})
+
+    return gauge_controller, gauges
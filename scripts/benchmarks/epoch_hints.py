@@ -0,0 +1,95 @@
+import json
+
+from brownie import ERC20CRV, FeeDistributor, VotingEscrow, accounts, chain
+
+from scripts.epoch_hints import block_epoch, total_supply_epochs, user_block_epoch
+
+# this script compares the gas used by the historical lookups of `VotingEscrow` and
+# `FeeDistributor` against their epoch-hinted variants, for point histories of increasing
+# length. view functions are measured with `estimate_gas`, at the block half way through
+# the history. `checkpoint_total_supply` is measured over `WEEKS` weeks, with two identical
+# distributors so that both calls start from the same state.
+#
+# run with `brownie run benchmarks/epoch_hints` in a development network
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+# number of voting escrow epochs created by the user being measured
+EPOCHS = [16, 64, 256]
+
+# number of weeks since the last total supply checkpoint
+WEEKS = 20
+
+RESULTS_JSON = "epoch-hints-benchmark.json"
+
+
+def deploy_system(epochs):
+    admin, user = accounts[:2]
+
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    distributors = [
+        FeeDistributor.deploy(voting_escrow, chain.time(), token, admin, admin, {"from": admin})
+        for i in range(2)
+    ]
+
+    token.transfer(user, 10 ** 24, {"from": admin})
+    token.approve(voting_escrow, 2 ** 256 - 1, {"from": user})
+    voting_escrow.create_lock(10 ** 18, chain.time() + 4 * YEAR - WEEK, {"from": user})
+
+    # every deposit adds a global and a user epoch
+    blocks = []
+    sleep = WEEKS * WEEK // epochs
+    for i in range(epochs - 1):
+        chain.sleep(sleep)
+        blocks.append(voting_escrow.increase_amount(10 ** 18, {"from": user}).block_number)
+    chain.sleep(3600)
+    chain.mine()
+
+    return voting_escrow, distributors, user, blocks[len(blocks) // 2]
+
+
+def measure(epochs=EPOCHS):
+    """
+    Measure the gas used by each lookup for every history length in `epochs`,
+    returning a dict of {epochs: {function: {"search": gas, "hinted": gas}}}.
+    """
+    results = {}
+    for count in epochs:
+        voting_escrow, distributors, user, block = deploy_system(count)
+        epoch = block_epoch(voting_escrow, block)
+        user_epoch = user_block_epoch(voting_escrow, user, block)
+
+        hints = total_supply_epochs(distributors[1], voting_escrow, chain.time())
+        tx = distributors[0].checkpoint_total_supply({"from": user})
+        tx_hinted = distributors[1].checkpoint_total_supply_hinted(hints, {"from": user})
+
+        results[count] = {
+            "balanceOfAt": {
+                "search": voting_escrow.balanceOfAt.estimate_gas(user, block),
+                "hinted": voting_escrow.balanceOfAtHinted.estimate_gas(
+                    user, block, user_epoch, epoch
+                ),
+            },
+            "totalSupplyAt": {
+                "search": voting_escrow.totalSupplyAt.estimate_gas(block),
+                "hinted": voting_escrow.totalSupplyAtHinted.estimate_gas(block, epoch),
+            },
+            "checkpoint_total_supply": {"search": tx.gas_used, "hinted": tx_hinted.gas_used},
+        }
+        for name, gas in results[count].items():
+            print(
+                f"{count} epochs, {name}: {gas['search']} search, {gas['hinted']} hinted "
+                f"({1 - gas['hinted'] / gas['search']:.1%} saved)"
+            )
+
+    return results
+
+
+def main():
+    results = measure()
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
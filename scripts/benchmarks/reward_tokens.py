@@ -0,0 +1,125 @@
+import json
+
+from brownie import (
+    ERC20,
+    ERC20CRV,
+    ERC20LP,
+    ZERO_ADDRESS,
+    GaugeController,
+    LiquidityGaugeV2,
+    Minter,
+    VotingEscrow,
+    accounts,
+    chain,
+    compile_source,
+)
+
+# this script measures the gas used by a `LiquidityGaugeV2` transfer and reward claim as the
+# number of reward tokens grows, when every reward stream is running, when only the first one
+# is, and when all of them have finished. a transfer claims from the reward contract while
+# checkpointing the sender, and the receiver is paid from the rewards already received.
+#
+# run with `brownie run benchmarks/reward_tokens` in a development network
+
+DAY = 86400
+
+# number of reward tokens
+REWARD_TOKENS = list(range(1, 9))
+
+RESULTS_JSON = "reward-tokens-benchmark.json"
+
+REWARDS = """
+# @version 0.2.7
+
+from vyper.interfaces import ERC20
+
+tokens: address[8]
+finish: uint256[8]
+last: uint256
+
+@external
+def set_stream(_idx: uint256, _token: address, _finish: uint256):
+    self.tokens[_idx] = _token
+    self.finish[_idx] = _finish
+    self.last = block.timestamp
+
+@external
+def claim():
+    for i in range(8):
+        token: address = self.tokens[i]
+        if token == ZERO_ADDRESS:
+            break
+        end: uint256 = min(block.timestamp, self.finish[i])
+        if end > self.last:
+            ERC20(token).transfer(msg.sender, 10**12 * (end - self.last))
+    self.last = block.timestamp
+"""
+
+
+def deploy_system(reward_tokens, active):
+    admin, alice, bob = accounts[:3]
+
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    gauge_controller = GaugeController.deploy(token, voting_escrow, {"from": admin})
+    minter = Minter.deploy(token, gauge_controller, {"from": admin})
+    lp_token = ERC20LP.deploy("Curve LP token", "usdCrv", 18, 10 ** 9, {"from": admin})
+
+    gauge = LiquidityGaugeV2.deploy(lp_token, minter, admin, {"from": admin})
+    gauge_controller.add_type("Liquidity", 10 ** 18, {"from": admin})
+    gauge_controller.add_gauge(gauge, 0, 10 ** 18, {"from": admin})
+    for acct in (alice, bob):
+        lp_token.transfer(acct, 10 ** 21, {"from": admin})
+        lp_token.approve(gauge, 10 ** 21, {"from": acct})
+        gauge.deposit(10 ** 21, {"from": acct})
+
+    # the first `active` streams run for a year, the others finish after a day
+    rewards = compile_source(REWARDS).Vyper.deploy({"from": admin})
+    coins = []
+    for i in range(reward_tokens):
+        coin = ERC20.deploy(f"Reward {i}", f"R{i}", 18, {"from": admin})
+        coin._mint_for_testing(10 ** 30, {"from": rewards})
+        finish = chain.time() + (365 * DAY if i < active else DAY)
+        rewards.set_stream(i, coin, finish, {"from": admin})
+        coins.append(coin)
+
+    sigs = f"0x{'00' * 4}{'00' * 4}{rewards.claim.signature[2:]}{'00' * 20}"
+    gauge.set_rewards(rewards, sigs, coins + [ZERO_ADDRESS] * (8 - len(coins)), {"from": admin})
+
+    return gauge, alice, bob
+
+
+def measure(reward_tokens=REWARD_TOKENS):
+    """
+    Measure the gas used by a transfer and a claim with each number of reward tokens in
+    `reward_tokens`, returning a dict of {reward_tokens: {streams: {action: gas}}}.
+    """
+    results = {}
+    for count in reward_tokens:
+        results[count] = {}
+        for name, active in (("all active", count), ("one active", 1), ("none active", 0)):
+            gauge, alice, bob = deploy_system(count, active)
+
+            # the first claim after the streams finish receives what is left of them
+            chain.sleep(2 * DAY)
+            gauge.claim_rewards({"from": alice})
+            chain.sleep(3600)
+            results[count][name] = {
+                "transfer": gauge.transfer(bob, 10 ** 18, {"from": alice}).gas_used
+            }
+            chain.sleep(3600)
+            results[count][name]["claim"] = gauge.claim_rewards({"from": alice}).gas_used
+            print(
+                f"{count} reward tokens, {name}: {results[count][name]['transfer']} per "
+                f"transfer, {results[count][name]['claim']} per claim"
+            )
+
+    return results
+
+
+def main():
+    results = measure()
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
@@ -0,0 +1,312 @@
+import csv
+import json
+import random
+import statistics
+import time
+from collections import deque
+from enum import IntEnum
+
+from brownie import (
+    ERC20CRV,
+    ERC20LP,
+    GaugeController,
+    LiquidityGauge,
+    Minter,
+    VotingEscrow,
+    accounts,
+    chain,
+)
+
+import pylab
+
+# this script is a parametric version of `tests/test_scalability.py`. it sweeps the number
+# of gauges, gauge types, users, rounds and the time between rounds, and records the gas
+# used per action type and the wall time per round for every configuration.
+#
+# each parameter in `SWEEP` is varied one at a time, with all other parameters taken from
+# `BASELINE`, so every parameter produces one scaling curve. the full system is deployed
+# for each configuration inside a snapshot, which is reverted afterward.
+#
+# run with `brownie run benchmarks/scalability` in a development network
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+# a vote for the same gauge is only allowed every 10 days, see `GaugeController.WEIGHT_VOTE_DELAY`
+WEIGHT_VOTE_DELAY = 86400 * 10
+
+BASELINE = {
+    # number of liquidity gauges
+    "gauge_count": 25,
+    # number of gauge types (distributed evenly across the gauges)
+    "type_count": 5,
+    # number of users
+    "user_count": 100,
+    # number of rounds - every gauge is interacted with once per round
+    "rounds": 10,
+    # seconds between rounds, which sets the number of weeks between checkpoints
+    "round_interval": 86401,
+}
+
+SWEEP = {
+    "gauge_count": [10, 25, 50, 100],
+    "type_count": [1, 3, 5, 10],
+    "user_count": [25, 100, 250, 1000],
+    "rounds": [5, 10, 20, 40],
+    "round_interval": [86401, WEEK, 4 * WEEK, 12 * WEEK],
+}
+
+SEED = 42
+
+RESULTS_JSON = "scalability-benchmark.json"
+RESULTS_CSV = "scalability-benchmark.csv"
+# formatted with the name of the swept parameter
+PLOT_PNG = "scalability-{}.png"
+
+
+class ActionEnum(IntEnum):
+    """
+    Enum of possible gauge actions in a benchmark round.
+    """
+
+    vote = 0
+    deposit = 1
+    withdraw = 2
+    mint = 3
+    noop = 4
+
+    @classmethod
+    def get_action(cls, value: int, gauge_count: int):
+        value = len(cls) * value // (gauge_count + 1)
+        return cls(value)
+
+
+def _validate(config):
+    if config["user_count"] * config["round_interval"] < WEIGHT_VOTE_DELAY:
+        raise ValueError(f"Users would vote more often than the weight vote delay: {config}")
+    if config["rounds"] * config["round_interval"] > 3 * YEAR:
+        raise ValueError(f"Locks would expire before the final round: {config}")
+
+
+def deploy_system(config):
+    """
+    Deploy the DAO contracts and `gauge_count` gauges, and lock CRV for `user_count` users.
+    """
+    admin = accounts[0]
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    gauge_controller = GaugeController.deploy(token, voting_escrow, {"from": admin})
+    minter = Minter.deploy(token, gauge_controller, {"from": admin})
+    lp_token = ERC20LP.deploy("Curve LP token", "usdCrv", 18, 10 ** 9, {"from": admin})
+    token.set_minter(minter, {"from": admin})
+
+    while len(accounts) < config["user_count"]:
+        accounts.add()
+    users = list(accounts)[: config["user_count"]]
+
+    for acct in users:
+        if acct != admin:
+            lp_token.transfer(acct, 10 ** 22, {"from": admin})
+            token.transfer(acct, 10 ** 22, {"from": admin})
+        token.approve(voting_escrow, 10 ** 22, {"from": acct})
+        voting_escrow.create_lock(10 ** 22, chain.time() + 4 * YEAR - WEEK, {"from": acct})
+
+    for i in range(config["type_count"]):
+        gauge_controller.add_type(f"Type {i}", 10 ** 18, {"from": admin})
+
+    gauges = []
+    for i in range(config["gauge_count"]):
+        gauge = LiquidityGauge.deploy(lp_token, minter, admin, {"from": admin})
+        gauge_controller.add_gauge(gauge, i % config["type_count"], {"from": admin})
+        gauges.append(gauge)
+
+    return {
+        "gauge_controller": gauge_controller,
+        "gauges": gauges,
+        "lp_token": lp_token,
+        "minter": minter,
+        "users": users,
+    }
+
+
+def run_rounds(system, config, seed=SEED):
+    """
+    Run the `test_scalability` rounds, returning the gas used per action type and
+    the wall time of each round.
+    """
+    gauge_controller = system["gauge_controller"]
+    gauges = system["gauges"]
+    lp_token = system["lp_token"]
+    minter = system["minter"]
+    users = system["users"]
+    gauge_count = config["gauge_count"]
+
+    # same distribution as the `uint[GAUGE_COUNT]` strategy used in the test
+    actions = deque(random.Random(seed).sample(range(gauge_count + 1), gauge_count))
+    action_accounts = deque(users)
+    last_voted = deque(users)
+    balances = {i: [0] * len(users) for i in gauges}
+
+    gas = {i.name: [] for i in ActionEnum if i != ActionEnum.noop}
+    round_times = []
+
+    for i in range(config["rounds"]):
+        last_voted.rotate()
+        actions.rotate()
+        chain.sleep(config["round_interval"])
+
+        start = time.perf_counter()
+        for gauge, action in zip(gauges, actions):
+            action = ActionEnum.get_action(action, gauge_count)
+
+            action_accounts.rotate()
+            acct = action_accounts[0]
+            idx = users.index(acct)
+
+            if action == ActionEnum.vote:
+                tx = gauge_controller.vote_for_gauge_weights(gauge, 100, {"from": last_voted[0]})
+
+            elif action == ActionEnum.deposit:
+                lp_token.approve(gauge, 10 ** 17, {"from": acct})
+                tx = gauge.deposit(10 ** 17, {"from": acct})
+                balances[gauge][idx] += 10 ** 17
+
+            elif action == ActionEnum.withdraw:
+                tx = gauge.withdraw(balances[gauge][idx], {"from": acct})
+                balances[gauge][idx] = 0
+
+            elif action == ActionEnum.mint:
+                tx = minter.mint(gauge, {"from": acct})
+
+            else:
+                continue
+            gas[action.name].append(tx.gas_used)
+
+        round_times.append(time.perf_counter() - start)
+        print(f"Round {i}: {round_times[-1]:.2f}s")
+
+    return gas, round_times
+
+
+def benchmark(config, seed=SEED):
+    """
+    Deploy and run a single configuration inside a snapshot, returning the result.
+    """
+    _validate(config)
+    print(f"\nBenchmarking {config}")
+
+    chain.snapshot()
+    try:
+        system = deploy_system(config)
+        gas, round_times = run_rounds(system, config, seed)
+    finally:
+        chain.revert()
+
+    return {
+        "config": config,
+        "gas": {
+            k: {
+                "count": len(v),
+                "mean": int(statistics.mean(v)) if v else None,
+                "median": int(statistics.median(v)) if v else None,
+                "max": max(v) if v else None,
+            }
+            for k, v in gas.items()
+        },
+        "round_time": {"mean": statistics.mean(round_times), "max": max(round_times)},
+    }
+
+
+def _configs(sweep, baseline):
+    # vary one parameter at a time, skipping configurations that were already seen
+    configs = []
+    for key, values in sweep.items():
+        for value in values:
+            config = dict(baseline, **{key: value})
+            if config not in configs:
+                configs.append(config)
+    return configs
+
+
+def write_csv(results, path=RESULTS_CSV):
+    params = list(BASELINE)
+    with open(path, "w", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(
+            params + ["action", "count", "gas_mean", "gas_median", "gas_max", "round_time_mean"]
+        )
+        for result in results:
+            for action, stats in result["gas"].items():
+                writer.writerow(
+                    [result["config"][k] for k in params]
+                    + [action, stats["count"], stats["mean"], stats["median"], stats["max"]]
+                    + [f"{result['round_time']['mean']:.4f}"]
+                )
+
+
+def plot(results, sweep=SWEEP, baseline=BASELINE):
+    """
+    Plot the mean gas per action and mean round time against each swept parameter.
+    """
+    for key in sweep:
+        curve = [
+            i for i in results if all(i["config"][k] == v for k, v in baseline.items() if k != key)
+        ]
+        curve = sorted(curve, key=lambda k: k["config"][key])
+        x = [i["config"][key] for i in curve]
+
+        pylab.figure(figsize=(10, 4))
+        pylab.subplot(1, 2, 1)
+        for action in curve[0]["gas"]:
+            y = [i["gas"][action]["mean"] or float("nan") for i in curve]
+            pylab.plot(x, y, marker="o", label=action)
+        pylab.xlabel(key)
+        pylab.ylabel("Mean gas used")
+        pylab.legend()
+
+        pylab.subplot(1, 2, 2)
+        pylab.plot(x, [i["round_time"]["mean"] for i in curve], marker="o")
+        pylab.xlabel(key)
+        pylab.ylabel("Mean round time (s)")
+
+        pylab.tight_layout()
+        pylab.savefig(PLOT_PNG.format(key))
+        pylab.close()
+
+
+def main(sweep=SWEEP, baseline=BASELINE, seed=SEED):
+    results = [benchmark(i, seed) for i in _configs(sweep, baseline)]
+
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2)
+    write_csv(results)
+    plot(results, sweep, baseline)
+
+    for result in results:
+        gas = ", ".join(f"{k} {v['mean']}" for k, v in result["gas"].items() if v["count"])
+        print(f"{result['config']}:\n  {gas}, {result['round_time']['mean']:.2f}s per round")
+    print(f"\nResults saved to {RESULTS_JSON} and {RESULTS_CSV}")
+
+
+def single(
+    gauge_count=BASELINE["gauge_count"],
+    type_count=BASELINE["type_count"],
+    user_count=BASELINE["user_count"],
+    rounds=BASELINE["rounds"],
+    round_interval=BASELINE["round_interval"],
+):
+    """
+    Benchmark a single configuration, e.g. `brownie run benchmarks/scalability single 100`.
+    """
+    config = {
+        "gauge_count": int(gauge_count),
+        "type_count": int(type_count),
+        "user_count": int(user_count),
+        "rounds": int(rounds),
+        "round_interval": int(round_interval),
+    }
+    result = benchmark(config)
+    print(json.dumps(result, indent=2))
+    return result
@@ -0,0 +1,234 @@
+import json
+from pathlib import Path
+
+from brownie import (
+    ERC20,
+    ERC20CRV,
+    ERC20LP,
+    FeeDistributor,
+    GaugeController,
+    LiquidityGauge,
+    Minter,
+    VotingEscrow,
+    accounts,
+    chain,
+)
+from brownie.exceptions import VirtualMachineError
+
+# this script measures the gas used by checkpoint functions, as a function of the number of
+# weeks since the last checkpoint. each loop over missed weeks is covered:
+#
+#   VotingEscrow.checkpoint                 `_checkpoint`, up to 255 weeks
+#   GaugeController.checkpoint              `_get_total` and `_get_sum`, per gauge type
+#   GaugeController.checkpoint_gauge        `_get_weight`, with the total already up to date
+#   LiquidityGauge.user_checkpoint          `_checkpoint`, up to 500 weeks
+#   FeeDistributor.checkpoint_token         `_checkpoint_token`, up to 20 weeks
+#   FeeDistributor.checkpoint_total_supply  `_checkpoint_total_supply`, up to 20 weeks
+#
+# a case that does not fit within the block gas limit is recorded as `null`.
+#
+# results are compared against `BASELINE_JSON`, and the script fails if any measurement
+# uses more than `THRESHOLD` additional gas. after an intentional change in gas costs,
+# regenerate the baseline with `brownie run benchmarks/staleness update`
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+# parameters for each case - every combination is measured
+CASES = {
+    "VotingEscrow.checkpoint": {"weeks": [1, 4, 16, 52, 104, 208]},
+    "GaugeController.checkpoint": {"weeks": [1, 4, 16, 52], "types": [1, 5, 10]},
+    "GaugeController.checkpoint_gauge": {"weeks": [1, 4, 16, 52], "gauges": [1, 10, 50]},
+    "LiquidityGauge.user_checkpoint": {"weeks": [1, 4, 16, 52], "types": [1, 5]},
+    "FeeDistributor.checkpoint_token": {"weeks": [1, 4, 10, 20]},
+    "FeeDistributor.checkpoint_total_supply": {"weeks": [1, 4, 10, 20]},
+}
+
+BASELINE_JSON = Path(__file__).parent.joinpath("staleness-baseline.json")
+RESULTS_JSON = "staleness-benchmark.json"
+
+# maximum allowed increase in gas, relative to the baseline
+THRESHOLD = 0.02
+
+
+def deploy_system(types, gauges):
+    """
+    Deploy the DAO with `types` gauge types and `gauges` gauges distributed evenly
+    across them. Every checkpoint is updated at the start of a week.
+    """
+    admin, user = accounts[:2]
+
+    # align to the start of a week so that every run loops over the same number of weeks
+    chain.sleep(WEEK - chain.time() % WEEK + 3600)
+
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": admin}
+    )
+    gauge_controller = GaugeController.deploy(token, voting_escrow, {"from": admin})
+    minter = Minter.deploy(token, gauge_controller, {"from": admin})
+    lp_token = ERC20LP.deploy("Curve LP token", "usdCrv", 18, 10 ** 9, {"from": admin})
+    fee_token = ERC20.deploy("Fee Token", "FEE", 18, {"from": admin})
+    fee_distributor = FeeDistributor.deploy(
+        voting_escrow, chain.time(), fee_token, admin, admin, {"from": admin}
+    )
+    token.set_minter(minter, {"from": admin})
+
+    for i in range(types):
+        gauge_controller.add_type(f"Type {i}", 10 ** 18, {"from": admin})
+    contracts = []
+    for i in range(gauges):
+        gauge = LiquidityGauge.deploy(lp_token, minter, admin, {"from": admin})
+        gauge_controller.add_gauge(gauge, i % types, 10 ** 18, {"from": admin})
+        contracts.append(gauge)
+
+    # a lock and a vote, so that slope changes are scheduled
+    token.transfer(user, 10 ** 24, {"from": admin})
+    token.approve(voting_escrow, 10 ** 24, {"from": user})
+    voting_escrow.create_lock(10 ** 24, chain.time() + 4 * YEAR - WEEK, {"from": user})
+    gauge_controller.vote_for_gauge_weights(contracts[0], 10000, {"from": user})
+
+    lp_token.transfer(user, 10 ** 21, {"from": admin})
+    lp_token.approve(contracts[0], 10 ** 21, {"from": user})
+    contracts[0].deposit(10 ** 21, {"from": user})
+
+    fee_token._mint_for_testing(10 ** 24, {"from": admin})
+
+    # bring everything up to date
+    voting_escrow.checkpoint({"from": admin})
+    gauge_controller.checkpoint({"from": admin})
+    fee_distributor.checkpoint_token({"from": admin})
+    fee_distributor.checkpoint_total_supply({"from": admin})
+
+    return {
+        "admin": admin,
+        "user": user,
+        "voting_escrow": voting_escrow,
+        "gauge_controller": gauge_controller,
+        "gauges": contracts,
+        "fee_distributor": fee_distributor,
+        "fee_token": fee_token,
+    }
+
+
+def _voting_escrow_checkpoint(system):
+    return system["voting_escrow"].checkpoint({"from": system["admin"]})
+
+
+def _gauge_controller_checkpoint(system):
+    return system["gauge_controller"].checkpoint({"from": system["admin"]})
+
+
+def _gauge_controller_checkpoint_gauge(system):
+    # update the total first, so only `_get_weight` loops over the missed weeks
+    system["gauge_controller"].checkpoint({"from": system["admin"]})
+    gauge = system["gauges"][0]
+    return system["gauge_controller"].checkpoint_gauge(gauge, {"from": system["admin"]})
+
+
+def _liquidity_gauge_user_checkpoint(system):
+    user = system["user"]
+    return system["gauges"][0].user_checkpoint(user, {"from": user})
+
+
+def _fee_distributor_checkpoint_token(system):
+    system["fee_token"].transfer(system["fee_distributor"], 10 ** 24, {"from": system["admin"]})
+    return system["fee_distributor"].checkpoint_token({"from": system["admin"]})
+
+
+def _fee_distributor_checkpoint_total_supply(system):
+    # update the voting escrow first, so only the distributor loops over the missed weeks
+    system["voting_escrow"].checkpoint({"from": system["admin"]})
+    return system["fee_distributor"].checkpoint_total_supply({"from": system["admin"]})
+
+
+ACTIONS = {
+    "VotingEscrow.checkpoint": _voting_escrow_checkpoint,
+    "GaugeController.checkpoint": _gauge_controller_checkpoint,
+    "GaugeController.checkpoint_gauge": _gauge_controller_checkpoint_gauge,
+    "LiquidityGauge.user_checkpoint": _liquidity_gauge_user_checkpoint,
+    "FeeDistributor.checkpoint_token": _fee_distributor_checkpoint_token,
+    "FeeDistributor.checkpoint_total_supply": _fee_distributor_checkpoint_total_supply,
+}
+
+
+def _key(name, weeks, types, gauges):
+    return f"{name}[weeks={weeks},types={types},gauges={gauges}]"
+
+
+def measure(cases=CASES):
+    """
+    Measure the gas used by each case, returning a dict of {key: gas used}.
+    """
+    results = {}
+    chain.snapshot()
+    for name, params in cases.items():
+        for types in params.get("types", [1]):
+            for gauges in params.get("gauges", [1]):
+                for weeks in params["weeks"]:
+                    system = deploy_system(types, gauges)
+                    chain.sleep(weeks * WEEK)
+                    key = _key(name, weeks, types, gauges)
+                    try:
+                        results[key] = ACTIONS[name](system).gas_used
+                    except (ValueError, VirtualMachineError):
+                        # exceeds the block gas limit
+                        results[key] = None
+                    print(f"{key}: {results[key]}")
+                    chain.revert()
+
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Compare `results` against `baseline`, returning a list of regressions.
+    """
+    regressions = []
+    for key, gas_used in results.items():
+        if key not in baseline:
+            print(f"{key}: {gas_used} (no baseline)")
+            continue
+        if gas_used is None or baseline[key] is None:
+            # a case only regresses by no longer fitting within the block gas limit
+            status = "REGRESSION" if gas_used is None and baseline[key] is not None else "ok"
+            print(f"{key}: {gas_used} (vs {baseline[key]}) {status}")
+            if status == "REGRESSION":
+                regressions.append(key)
+            continue
+        change = (gas_used - baseline[key]) / baseline[key]
+        status = "REGRESSION" if change > threshold else "ok"
+        print(f"{key}: {gas_used} ({change:+.2%} vs {baseline[key]}) {status}")
+        if change > threshold:
+            regressions.append(key)
+
+    return regressions
+
+
+def main(threshold=THRESHOLD):
+    results = measure()
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+
+    with BASELINE_JSON.open() as fp:
+        baseline = json.load(fp)
+
+    print()
+    regressions = compare(results, baseline, float(threshold))
+    if regressions:
+        raise ValueError(
+            f"{len(regressions)} measurements exceed the baseline by more than "
+            f"{float(threshold):.0%}: {', '.join(regressions)}"
+        )
+    print(f"\nNo gas regressions beyond {float(threshold):.0%}")
+
+
+def update():
+    """
+    Measure every case and store the result as the new baseline.
+    """
+    results = measure()
+    with BASELINE_JSON.open("w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+    print(f"\nBaseline saved to {BASELINE_JSON}")
@@ -0,0 +1,52 @@
+import json
+
+from brownie import accounts, chain
+
+from scripts.benchmarks.controller_setup import deploy_gauge_controller
+
+# this script measures the gas used by `vote_for_gauge_weights` as the number of gauge types
+# grows. one gauge is added per type. the total weight is only recomputed from every type by
+# the first checkpoint of each week, which is measured separately - later votes in the same
+# week apply the change in the sum of their type to the total.
+#
+# run with `brownie run benchmarks/vote_types` in a development network
+
+WEEK = 86400 * 7
+
+# number of gauge types
+TYPES = [1, 5, 10, 25, 50, 100]
+
+RESULTS_JSON = "vote-types-benchmark.json"
+
+
+def deploy_system(types):
+    admin, voter = accounts[:2]
+    # one gauge of each type
+    gauge_controller, gauges = deploy_gauge_controller(types, types, 10 ** 18, (voter,))
+
+    return gauge_controller, gauges, admin, voter
+
+
+def measure(types=TYPES):
+    """
+    Measure the gas used by a vote and by the first checkpoint of a week, for each
+    number of gauge types in `types`, returning a dict of {types: {function: gas}}.
+    """
+    results = {}
+    for count in types:
+        gauge_controller, gauges, admin, voter = deploy_system(count)
+
+        chain.sleep(WEEK)
+        checkpoint = gauge_controller.checkpoint({"from": admin}).gas_used
+        vote = gauge_controller.vote_for_gauge_weights(gauges[-1], 5000, {"from": voter}).gas_used
+
+        results[count] = {"vote_for_gauge_weights": vote, "weekly checkpoint": checkpoint}
+        print(f"{count} types: {vote} per vote, {checkpoint} for the first checkpoint of a week")
+
+    return results
+
+
+def main():
+    results = measure()
+    with open(RESULTS_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
@@ -6,6 +6,8 @@ import requests
 from brownie import ETH_ADDRESS, ZERO_ADDRESS, Contract, accounts
 from brownie.network.gas.strategies import GasNowScalingStrategy
 
+from scripts.address_list import MAX_LENGTH, encode_addresses
+
 warnings.filterwarnings("ignore")
 
 # This script is used to claim fees from all pool contracts
@@ -90,6 +92,9 @@ SYNTH_BURNERS = [
 ]
 
 
+# fixed length of the address arrays taken by `withdraw_many` and `burn_many`
+MANY_LENGTH = 20
+
 _rate_cache = {}
 gas_strategy = GasNowScalingStrategy(initial_speed="slow", max_speed="fast")
 
@@ -163,6 +168,28 @@ def _get_admin_balances(pool, coin_list):
     return admin_balances
 
 
+def _batch_call(proxy, name, addresses, tx_params, estimate=False):
+    # the padded `_many` functions are cheaper for up to 20 addresses, decoding a list
+    # costs 1-2% more gas at that size. lists are only used for larger batches, where
+    # the `_many` functions would need several transactions, and only when the proxy
+    # has been upgraded to provide them
+    if len(addresses) > MANY_LENGTH and hasattr(proxy, f"{name}_list"):
+        fn, args = getattr(proxy, f"{name}_list"), encode_addresses(addresses)
+    else:
+        fn, args = getattr(proxy, f"{name}_many"), _pad(addresses)
+    if estimate:
+        return fn.estimate_gas(args, tx_params)
+    return fn(args, tx_params)
+
+
+def _pad(addresses):
+    return addresses + [ZERO_ADDRESS] * (MANY_LENGTH - len(addresses))
+
+
+def _max_batch(proxy, name):
+    return MAX_LENGTH if hasattr(proxy, f"{name}_list") else MANY_LENGTH
+
+
 def get_pending():
     pool_list = _get_pool_list()
     pending = {}
@@ -192,23 +219,28 @@ def main(acct=CALLER, claim_threshold=CLAIM_THRESHOLD):
 
     # withdraw pool fees to pool proxy
     to_claim = []
-    for i in range(len(pool_list)):
+    for i, (pool, coin_list) in enumerate(pool_list.items()):
 
         # check claimable amount
         sys.stdout.write(f"\rQuerying pending fee amounts ({i}/{len(pool_list)})...")
         sys.stdout.flush()
-        claimable = _get_admin_balances(pool_list[i])
+        claimable = _get_admin_balances(pool, coin_list)
         if sum(claimable) >= claim_threshold:
-            to_claim.append(pool_list[i])
+            to_claim.append(pool)
 
-        if i == len(pool_list) - 1 or len(to_claim) == 20:
-            to_claim += [ZERO_ADDRESS] * (20 - len(to_claim))
-            proxy.withdraw_many(to_claim, {"from": acct, "gas_price": gas_strategy})
-            to_claim = []
+    max_claim = _max_batch(proxy, "withdraw")
+    for i in range(0, len(to_claim), max_claim):
+        _batch_call(
+            proxy,
+            "withdraw",
+            to_claim[i : i + max_claim],
+            {"from": acct, "gas_price": gas_strategy},
+        )
 
     # call burners to convert fee tokens to 3CRV
     burn_start = 0
     to_burn = []
+    max_burn = _max_batch(proxy, "burn")
     for i in range(len(COINS)):
         # no point in burning if we have a zero balance
         if COINS[i] == ETH_ADDRESS:
@@ -217,14 +249,16 @@ def main(acct=CALLER, claim_threshold=CLAIM_THRESHOLD):
         elif Contract(COINS[i]).balanceOf(proxy) > 0:
             to_burn.append(COINS[i])
 
-        to_burn_padded = to_burn + [ZERO_ADDRESS] * (20 - len(to_burn))
+        if not to_burn:
+            continue
 
         # estimate gas to decide when to burn - some of the burners are gas guzzlers
         if (
             i == len(COINS) - 1
-            or proxy.burn_many.estimate_gas(to_burn_padded, {"from": acct}) > 2000000
+            or len(to_burn) == max_burn
+            or _batch_call(proxy, "burn", to_burn, {"from": acct}, estimate=True) > 2000000
         ):
-            tx = proxy.burn_many(to_burn_padded, {"from": acct, "gas_price": gas_strategy})
+            tx = _batch_call(proxy, "burn", to_burn, {"from": acct, "gas_price": gas_strategy})
             to_burn = []
             if not burn_start:
                 # record the timestamp of the first tx - need to
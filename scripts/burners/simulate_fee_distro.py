@@ -3,6 +3,9 @@ from pathlib import Path
 
 from brownie import Contract, FeeDistributor, accounts, chain
 
+# user points and weeks looked at by each claim
+MAX_ITERATIONS = 100
+
 
 def main():
     alice = accounts[0]
@@ -33,13 +36,10 @@ def main():
     for c, acct in enumerate(data):
         print(f"Claiming, {c}/{len(data)}")
 
-        # ensure we claim up to the user's max epoch, some accounts require multiple claims
-        max_epoch = voting_escrow.user_point_epoch(acct)
-        epoch = 0
-
-        while epoch < max_epoch:
-            distributor.claim({"from": acct})
-            epoch = distributor.user_epoch_of(acct)
+        # some accounts require multiple claims, the distributor reports how many
+        calls = distributor.claim_calls(acct, MAX_ITERATIONS)
+        for i in range(calls):
+            distributor.claim_partial(acct, MAX_ITERATIONS, {"from": acct})
 
     amount = fee_token.balanceOf(distributor)
     print(f"Remaining fee balance: ${amount/1e18:,.2f}")
@@ -13,6 +13,7 @@ from brownie import (
 )
 
 from . import deployment_config as config
+from .deploy_graph import DeploymentGraph, Ref
 
 # TODO set weights!
 
@@ -65,11 +66,28 @@ def live_part_two():
     )
 
 
+def live_part_two_parallel():
+    admin, _ = config.get_live_admin()
+    with open(config.DEPLOYMENTS_JSON) as fp:
+        deployments = json.load(fp)
+    token = ERC20CRV.at(deployments["ERC20CRV"])
+    voting_escrow = VotingEscrow.at(deployments["VotingEscrow"])
+
+    deploy_part_two_parallel(
+        admin, token, voting_escrow, config.REQUIRED_CONFIRMATIONS, config.DEPLOYMENTS_JSON,
+    )
+
+
 def development():
     token, voting_escrow = deploy_part_one(accounts[0])
     deploy_part_two(accounts[0], token, voting_escrow)
 
 
+def development_parallel():
+    token, voting_escrow = deploy_part_one(accounts[0])
+    deploy_part_two_parallel(accounts[0], token, voting_escrow)
+
+
 def deploy_part_one(admin, confs=1, deployments_json=None):
     token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin, "required_confs": confs})
     voting_escrow = VotingEscrow.deploy(
@@ -128,3 +146,83 @@ def deploy_part_two(admin, token, voting_escrow, confs=1, deployments_json=None)
         with open(deployments_json, "w") as fp:
             json.dump(deployments, fp)
         print(f"Deployment addresses saved to {deployments_json}")
+
+
+def build_part_two_graph(admin, token, voting_escrow, confs=1):
+    """
+    Describe the second deployment stage as a `DeploymentGraph`.
+
+    Gauges only depend on `Minter`, and each `add_gauge` only depends on its gauge
+    and the gauge types, so these steps are broadcast together rather than in sequence.
+    """
+    graph = DeploymentGraph(admin, confs)
+    graph.add_existing("ERC20CRV", token)
+    graph.add_existing("VotingEscrow", voting_escrow)
+
+    graph.add_deploy("GaugeController", GaugeController, Ref("ERC20CRV"), Ref("VotingEscrow"))
+    type_steps = []
+    for name, weight in GAUGE_TYPES:
+        graph.add_call(f"add_type:{name}", Ref("GaugeController"), "add_type", name, weight)
+        type_steps.append(f"add_type:{name}")
+
+    graph.add_deploy("PoolProxy", PoolProxy, admin, admin, admin)
+    graph.add_deploy("Minter", Minter, Ref("ERC20CRV"), Ref("GaugeController"))
+    graph.add_call("set_minter", Ref("ERC20CRV"), "set_minter", Ref("Minter"))
+
+    for name, (lp_token, weight) in POOL_TOKENS.items():
+        graph.add_deploy(f"LiquidityGauge:{name}", LiquidityGauge, lp_token, Ref("Minter"), admin)
+        graph.add_call(
+            f"add_gauge:{name}",
+            Ref("GaugeController"),
+            "add_gauge",
+            Ref(f"LiquidityGauge:{name}"),
+            0,
+            weight,
+            after=type_steps,
+        )
+
+    for (name, (lp_token, reward_claim, reward_token, weight),) in REWARD_POOL_TOKENS.items():
+        graph.add_deploy(
+            f"LiquidityGaugeReward:{name}",
+            LiquidityGaugeReward,
+            lp_token,
+            Ref("Minter"),
+            reward_claim,
+            reward_token,
+            admin,
+        )
+        graph.add_call(
+            f"add_gauge:{name}",
+            Ref("GaugeController"),
+            "add_gauge",
+            Ref(f"LiquidityGaugeReward:{name}"),
+            0,
+            weight,
+            after=type_steps,
+        )
+
+    return graph
+
+
+def deploy_part_two_parallel(admin, token, voting_escrow, confs=1, deployments_json=None):
+    graph = build_part_two_graph(admin, token, voting_escrow, confs)
+    results = graph.run()
+    graph.report()
+
+    deployments = {
+        "ERC20CRV": token.address,
+        "VotingEscrow": voting_escrow.address,
+        "GaugeController": results["GaugeController"].address,
+        "Minter": results["Minter"].address,
+        "LiquidityGauge": {k: results[f"LiquidityGauge:{k}"].address for k in POOL_TOKENS},
+        "LiquidityGaugeReward": {
+            k: results[f"LiquidityGaugeReward:{k}"].address for k in REWARD_POOL_TOKENS
+        },
+        "PoolProxy": results["PoolProxy"].address,
+    }
+    if deployments_json is not None:
+        with open(deployments_json, "w") as fp:
+            json.dump(deployments, fp)
+        print(f"Deployment addresses saved to {deployments_json}")
+
+    return deployments
@@ -0,0 +1,202 @@
+"""
+Dependency-Graph Deployer
+=========================
+Describes a deployment as a graph of named steps and broadcasts every step whose
+dependencies are satisfied at the same time, using locally managed nonces.
+
+Steps only wait on confirmations when a later step consumes their result. Every
+in-flight transaction is polled together, so the confirmation time of each step does
+not include the time spent waiting on others. Once the graph has run, `report`
+compares the observed wall time (the critical path) against the time a strictly
+serial deployment would have spent waiting on confirmations.
+"""
+
+import time
+
+# seconds between polls of the in-flight transactions
+POLL_INTERVAL = 1
+
+
+class Ref:
+    """
+    Placeholder for the result of another step, resolved when the step is broadcast.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Ref('{self.name}')"
+
+
+class _Step:
+    def __init__(self, name, target, fn_name, args, after):
+        self.name = name
+        self.target = target
+        self.fn_name = fn_name
+        self.args = args
+        self.deps = [i.name for i in (target,) + args if isinstance(i, Ref)]
+        self.deps += [i for i in after if i not in self.deps]
+
+        self.tx = None
+        self.broadcast_at = None
+        self.confirmed_at = None
+
+
+class DeploymentGraph:
+    """
+    Collection of deployment steps executed in dependency order.
+
+    Arguments
+    ---------
+    sender : Account
+        Account that broadcasts every transaction in the graph
+    confs : int
+        Number of confirmations to wait for before a result is made available
+    """
+
+    def __init__(self, sender, confs=1):
+        self.sender = sender
+        self.confs = confs
+        self.results = {}
+        self._steps = {}
+        self._start = None
+        self._finish = None
+
+    def add_existing(self, name, contract):
+        """
+        Make an already deployed contract available to later steps as `Ref(name)`.
+        """
+        self._check_name(name)
+        self.results[name] = contract
+
+    def add_deploy(self, name, container, *args, after=()):
+        """
+        Add a step deploying `container` with constructor `args`.
+        """
+        self._check_name(name)
+        self._steps[name] = _Step(name, container, None, args, after)
+
+    def add_call(self, name, target, fn_name, *args, after=()):
+        """
+        Add a step calling `fn_name` on `target`, which is usually a `Ref`.
+
+        Use `after` to order steps that depend on each other only through contract
+        state, e.g. `add_gauge` requiring a prior `add_type`.
+        """
+        self._check_name(name)
+        self._steps[name] = _Step(name, target, fn_name, args, after)
+
+    def run(self):
+        """
+        Execute the graph, returning a dict of step name -> deployed contract or receipt.
+        """
+        for step in self._steps.values():
+            for dep in step.deps:
+                if dep not in self._steps and dep not in self.results:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dep}'")
+
+        self._start = time.time()
+        nonce = self.sender.nonce
+        pending = list(self._steps.values())
+        inflight = []
+
+        while pending or inflight:
+            ready = [i for i in pending if all(x in self.results for x in i.deps)]
+            for step in ready:
+                pending.remove(step)
+                try:
+                    self._broadcast(step, nonce)
+                except Exception as exc:
+                    # the nonce was not used, so any later transaction would stall. let the
+                    # transactions already in flight confirm before giving up
+                    self._wait(inflight, inflight)
+                    raise ValueError(f"Step '{step.name}' failed to broadcast: {exc}") from exc
+                inflight.append(step)
+                nonce += 1
+
+            if not inflight:
+                raise ValueError(f"Dependency cycle in steps: {', '.join(i.name for i in pending)}")
+
+            # only block on results that a remaining step is waiting for
+            required = set(x for i in pending for x in i.deps)
+            to_confirm = [i for i in inflight if i.name in required] or inflight
+            self._wait(inflight, to_confirm)
+            for step in [i for i in inflight if i.confirmed_at is not None]:
+                self._confirm(step)
+                inflight.remove(step)
+
+        self._finish = time.time()
+        return self.results
+
+    def report(self):
+        """
+        Print the critical-path and serial wall times and return them as a dict.
+        """
+        latency = {k: v.confirmed_at - v.broadcast_at for k, v in self._steps.items()}
+        path = {}
+        for name in sorted(self._steps, key=lambda k: self._steps[k].confirmed_at):
+            deps = [path[i] for i in self._steps[name].deps if i in path]
+            path[name] = latency[name] + max(deps, default=0)
+
+        stats = {
+            "steps": len(self._steps),
+            "wall_time": self._finish - self._start,
+            "critical_path": max(path.values(), default=0),
+            "serial_time": sum(latency.values()),
+            "gas_used": sum(self._gas_used(i) for i in self._steps.values()),
+        }
+        print(
+            f"{stats['steps']} steps deployed in {stats['wall_time']:.1f}s "
+            f"(critical path {stats['critical_path']:.1f}s, "
+            f"serial estimate {stats['serial_time']:.1f}s). Total gas used: {stats['gas_used']}"
+        )
+        return stats
+
+    def _check_name(self, name):
+        if name in self._steps or name in self.results:
+            raise ValueError(f"Duplicate step name: '{name}'")
+
+    def _resolve(self, value):
+        if isinstance(value, Ref):
+            return self.results[value.name]
+        return value
+
+    def _broadcast(self, step, nonce):
+        args = [self._resolve(i) for i in step.args]
+        tx_params = {"from": self.sender, "nonce": nonce, "required_confs": 0}
+        if step.fn_name is None:
+            fn = step.target.deploy
+        else:
+            fn = getattr(self._resolve(step.target), step.fn_name)
+
+        step.broadcast_at = time.time()
+        step.tx = fn(*args, tx_params)
+
+    def _wait(self, inflight, steps):
+        # poll every in-flight transaction until all of `steps` are confirmed, recording
+        # the time at which each one is first seen confirmed
+        while True:
+            for step in inflight:
+                if step.confirmed_at is not None:
+                    continue
+                # a status of -2 means the transaction was dropped
+                if step.tx.confirmations >= self.confs or step.tx.status == -2:
+                    step.confirmed_at = time.time()
+            if all(i.confirmed_at is not None for i in steps):
+                return
+            time.sleep(POLL_INTERVAL)
+
+    def _confirm(self, step):
+        step.tx.wait(self.confs)
+        if step.tx.status != 1:
+            raise ValueError(f"Step '{step.name}' failed: {step.tx.revert_msg}")
+
+        if step.fn_name is None:
+            self.results[step.name] = step.target.at(step.tx.contract_address)
+        else:
+            self.results[step.name] = step.tx
+
+    @staticmethod
+    def _gas_used(step):
+        return step.tx.gas_used if step.tx is not None else 0
@@ -22,6 +22,8 @@ from brownie import (
 from web3 import middleware
 from web3.gas_strategies.time_based import fast_gas_price_strategy as gas_strategy
 
+from .deployment_cache import DeploymentCache
+
 USE_STRATEGIES = False  # Needed for the ganache-cli tester which doesn't like middlewares
 POA = True
 
@@ -39,16 +41,8 @@ ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
 CONFS = 1
 
-
-def repeat(f, *args):
-    """
-    Repeat when geth is not broadcasting (unaccounted error)
-    """
-    while True:
-        try:
-            return f(*args)
-        except KeyError:
-            continue
+# completed steps are cached here, so that an interrupted deployment can be resumed
+DEPLOYMENTS_JSON = "deployments-testnet.json"
 
 
 def save_abi(contract, name):
@@ -56,30 +50,21 @@ def save_abi(contract, name):
         json.dump(contract.abi, f)
 
 
-def deploy_erc20s_and_pool(deployer):
-    coin_a = repeat(ERC20.deploy, "Coin A", "USDA", 18, {"from": deployer, "required_confs": CONFS})
-    repeat(
-        coin_a._mint_for_testing, 10 ** 9 * 10 ** 18, {"from": deployer, "required_confs": CONFS},
-    )
-    coin_b = repeat(ERC20.deploy, "Coin B", "USDB", 18, {"from": deployer, "required_confs": CONFS})
-    repeat(
-        coin_b._mint_for_testing, 10 ** 9 * 10 ** 18, {"from": deployer, "required_confs": CONFS},
-    )
+def deploy_erc20s_and_pool(deployer, cache, prefix="pool"):
+    tx_params = {"from": deployer, "required_confs": CONFS}
 
-    lp_token = repeat(
-        ERC20LP.deploy, "Some pool", "cPool", 18, 0, {"from": deployer, "required_confs": CONFS},
-    )
+    coin_a = cache.deploy(f"{prefix}:coin_a", ERC20, "Coin A", "USDA", 18, tx_params)
+    cache.call(f"{prefix}:coin_a:mint", coin_a._mint_for_testing, 10 ** 9 * 10 ** 18, tx_params)
+    coin_b = cache.deploy(f"{prefix}:coin_b", ERC20, "Coin B", "USDB", 18, tx_params)
+    cache.call(f"{prefix}:coin_b:mint", coin_b._mint_for_testing, 10 ** 9 * 10 ** 18, tx_params)
+
+    lp_token = cache.deploy(f"{prefix}:lp_token", ERC20LP, "Some pool", "cPool", 18, 0, tx_params)
     save_abi(lp_token, "lp_token")
-    pool = repeat(
-        CurvePool.deploy,
-        [coin_a, coin_b],
-        lp_token,
-        100,
-        4 * 10 ** 6,
-        {"from": deployer, "required_confs": CONFS},
+    pool = cache.deploy(
+        f"{prefix}:pool", CurvePool, [coin_a, coin_b], lp_token, 100, 4 * 10 ** 6, tx_params
     )
     save_abi(pool, "curve_pool")
-    repeat(lp_token.set_minter, pool, {"from": deployer, "required_confs": CONFS})
+    cache.call(f"{prefix}:lp_token:set_minter", lp_token.set_minter, pool, tx_params)
 
     # registry = repeat(
     #     Registry.deploy, [ZERO_ADDRESS] * 4, {"from": deployer, "required_confs": CONFS}
@@ -87,23 +72,28 @@ def deploy_erc20s_and_pool(deployer):
     # save_abi(registry, "registry")
 
     for account in DISTRIBUTION_ADDRESSES:
-        repeat(
+        cache.call(
+            f"{prefix}:coin_a:transfer:{account}",
             coin_a.transfer,
             account,
             DISTRIBUTION_AMOUNT,
-            {"from": deployer, "required_confs": CONFS},
+            tx_params,
         )
-        repeat(
+        cache.call(
+            f"{prefix}:coin_b:transfer:{account}",
             coin_b.transfer,
             account,
             DISTRIBUTION_AMOUNT,
-            {"from": deployer, "required_confs": CONFS},
+            tx_params,
         )
 
-    repeat(
-        pool.commit_transfer_ownership, ARAGON_AGENT, {"from": deployer, "required_confs": CONFS},
+    cache.call(
+        f"{prefix}:pool:commit_transfer_ownership",
+        pool.commit_transfer_ownership,
+        ARAGON_AGENT,
+        tx_params,
     )
-    repeat(pool.apply_transfer_ownership, {"from": deployer, "required_confs": CONFS})
+    cache.call(f"{prefix}:pool:apply_transfer_ownership", pool.apply_transfer_ownership, tx_params)
 
     # repeat(
     #     registry.commit_transfer_ownership,
@@ -125,195 +115,196 @@ def main():
             web3.middleware_onion.inject(middleware.geth_poa_middleware, layer=0)
 
     deployer = accounts.at(DEPLOYER)
+    tx_params = {"from": deployer, "required_confs": CONFS}
+    cache = DeploymentCache(DEPLOYMENTS_JSON)
 
     # deploy pools and gauges
 
-    coin_a = repeat(ERC20.deploy, "Coin A", "USDA", 18, {"from": deployer, "required_confs": CONFS})
-    repeat(
-        coin_a._mint_for_testing, 10 ** 9 * 10 ** 18, {"from": deployer, "required_confs": CONFS},
-    )
-    coin_b = repeat(ERC20.deploy, "Coin B", "USDB", 18, {"from": deployer, "required_confs": CONFS})
-    repeat(
-        coin_b._mint_for_testing, 10 ** 9 * 10 ** 18, {"from": deployer, "required_confs": CONFS},
-    )
+    coin_a = cache.deploy("coin_a", ERC20, "Coin A", "USDA", 18, tx_params)
+    cache.call("coin_a:mint", coin_a._mint_for_testing, 10 ** 9 * 10 ** 18, tx_params)
+    coin_b = cache.deploy("coin_b", ERC20, "Coin B", "USDB", 18, tx_params)
+    cache.call("coin_b:mint", coin_b._mint_for_testing, 10 ** 9 * 10 ** 18, tx_params)
 
-    lp_token = repeat(
-        ERC20LP.deploy, "Some pool", "cPool", 18, 0, {"from": deployer, "required_confs": CONFS},
-    )
+    lp_token = cache.deploy("lp_token", ERC20LP, "Some pool", "cPool", 18, 0, tx_params)
     save_abi(lp_token, "lp_token")
-    pool = repeat(
-        CurvePool.deploy,
-        [coin_a, coin_b],
-        lp_token,
-        100,
-        4 * 10 ** 6,
-        {"from": deployer, "required_confs": CONFS},
-    )
+    pool = cache.deploy("pool", CurvePool, [coin_a, coin_b], lp_token, 100, 4 * 10 ** 6, tx_params)
     save_abi(pool, "curve_pool")
-    repeat(lp_token.set_minter, pool, {"from": deployer, "required_confs": CONFS})
+    cache.call("lp_token:set_minter", lp_token.set_minter, pool, tx_params)
 
-    repeat(
+    cache.call(
+        "coin_a:transfer",
         coin_a.transfer,
         "0x6cd85bbb9147b86201d882ae1068c67286855211",
         DISTRIBUTION_AMOUNT,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
-    repeat(
+    cache.call(
+        "coin_b:transfer",
         coin_b.transfer,
         "0x6cd85bbb9147b86201d882ae1068c67286855211",
         DISTRIBUTION_AMOUNT,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
 
-    contract = repeat(
-        CurveRewards.deploy, lp_token, coin_a, {"from": accounts[0], "required_confs": CONFS},
-    )
-    repeat(
-        contract.setRewardDistribution, accounts[0], {"from": accounts[0], "required_confs": CONFS},
-    )
-    repeat(
-        coin_a.transfer, contract, 100e18, {"from": accounts[0], "required_confs": CONFS},
+    rewards_params = {"from": accounts[0], "required_confs": CONFS}
+    contract = cache.deploy("rewards", CurveRewards, lp_token, coin_a, rewards_params)
+    cache.call(
+        "rewards:setRewardDistribution",
+        contract.setRewardDistribution,
+        accounts[0],
+        rewards_params,
     )
+    cache.call("rewards:fund", coin_a.transfer, contract, 100e18, rewards_params)
 
-    liquidity_gauge_rewards = repeat(
-        LiquidityGaugeReward.deploy,
+    liquidity_gauge_rewards = cache.deploy(
+        "liquidity_gauge_rewards",
+        LiquidityGaugeReward,
         lp_token,
         "0xbE45e0E4a72aEbF9D08F93E64701964d2CC4cF96",
         contract,
         coin_a,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
 
-    coins = deploy_erc20s_and_pool(deployer)
+    coins = deploy_erc20s_and_pool(deployer, cache)
 
     lp_token = coins[0]
     coin_a = coins[1]
 
-    token = repeat(
-        ERC20CRV.deploy, "Curve DAO Token", "CRV", 18, {"from": deployer, "required_confs": CONFS},
-    )
+    token = cache.deploy("token_crv", ERC20CRV, "Curve DAO Token", "CRV", 18, tx_params)
     save_abi(token, "token_crv")
 
-    escrow = repeat(
-        VotingEscrow.deploy,
-        token,
-        "Vote-escrowed CRV",
-        "veCRV",
-        "veCRV_0.99",
-        {"from": deployer, "required_confs": CONFS},
+    escrow = cache.deploy(
+        "voting_escrow", VotingEscrow, token, "Vote-escrowed CRV", "veCRV", "veCRV_0.99", tx_params,
     )
     save_abi(escrow, "voting_escrow")
 
-    repeat(
-        escrow.changeController, ARAGON_AGENT, {"from": deployer, "required_confs": CONFS},
+    cache.call(
+        "voting_escrow:changeController", escrow.changeController, ARAGON_AGENT, tx_params,
     )
 
     for account in DISTRIBUTION_ADDRESSES:
-        repeat(
+        cache.call(
+            f"token_crv:transfer:{account}",
             token.transfer,
             account,
             DISTRIBUTION_AMOUNT,
-            {"from": deployer, "required_confs": CONFS},
+            tx_params,
         )
 
-    gauge_controller = repeat(
-        GaugeController.deploy, token, escrow, {"from": deployer, "required_confs": CONFS},
-    )
+    gauge_controller = cache.deploy("gauge_controller", GaugeController, token, escrow, tx_params)
     save_abi(gauge_controller, "gauge_controller")
 
-    minter = repeat(
-        Minter.deploy, token, gauge_controller, {"from": deployer, "required_confs": CONFS},
-    )
+    minter = cache.deploy("minter", Minter, token, gauge_controller, tx_params)
     save_abi(minter, "minter")
 
-    liquidity_gauge = repeat(
-        LiquidityGauge.deploy, lp_token, minter, {"from": deployer, "required_confs": CONFS},
-    )
+    liquidity_gauge = cache.deploy("liquidity_gauge", LiquidityGauge, lp_token, minter, tx_params)
     save_abi(liquidity_gauge, "liquidity_gauge")
 
-    contract = repeat(
-        CurveRewards.deploy, lp_token, coin_a, {"from": accounts[0], "required_confs": CONFS},
-    )
-    repeat(
-        contract.setRewardDistribution, accounts[0], {"from": accounts[0], "required_confs": CONFS},
-    )
-    repeat(
-        coin_a.transfer, contract, 100e18, {"from": accounts[0], "required_confs": CONFS},
+    contract = cache.deploy("dao:rewards", CurveRewards, lp_token, coin_a, rewards_params)
+    cache.call(
+        "dao:rewards:setRewardDistribution",
+        contract.setRewardDistribution,
+        accounts[0],
+        rewards_params,
     )
+    cache.call("dao:rewards:fund", coin_a.transfer, contract, 100e18, rewards_params)
 
-    liquidity_gauge_rewards = repeat(
-        LiquidityGaugeReward.deploy,
+    liquidity_gauge_rewards = cache.deploy(
+        "dao:liquidity_gauge_rewards",
+        LiquidityGaugeReward,
         lp_token,
         minter,
         contract,
         coin_a,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
 
-    repeat(token.set_minter, minter, {"from": deployer, "required_confs": CONFS})
-    repeat(
-        gauge_controller.add_type, b"Liquidity", {"from": deployer, "required_confs": CONFS},
+    cache.call("token_crv:set_minter", token.set_minter, minter, tx_params)
+    cache.call(
+        "gauge_controller:add_type:Liquidity", gauge_controller.add_type, b"Liquidity", tx_params,
     )
-    repeat(
+    cache.call(
+        "gauge_controller:change_type_weight:0",
         gauge_controller.change_type_weight,
         0,
         10 ** 18,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
-    repeat(
+    cache.call(
+        "gauge_controller:add_gauge:liquidity_gauge",
         gauge_controller.add_gauge,
         liquidity_gauge,
         0,
         10 ** 18,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
 
-    repeat(
-        gauge_controller.add_type, b"LiquidityRewards", {"from": deployer, "required_confs": CONFS},
+    cache.call(
+        "gauge_controller:add_type:LiquidityRewards",
+        gauge_controller.add_type,
+        b"LiquidityRewards",
+        tx_params,
     )
-    repeat(
+    cache.call(
+        "gauge_controller:change_type_weight:1",
         gauge_controller.change_type_weight,
         1,
         10 ** 18,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
-    repeat(
+    cache.call(
+        "gauge_controller:add_gauge:liquidity_gauge_rewards",
         gauge_controller.add_gauge,
         liquidity_gauge_rewards,
         1,
         10 ** 18,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
 
-    repeat(
+    cache.call(
+        "gauge_controller:commit_transfer_ownership",
         gauge_controller.commit_transfer_ownership,
         ARAGON_AGENT,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
     )
-    repeat(
-        gauge_controller.apply_transfer_ownership, {"from": deployer, "required_confs": CONFS},
+    cache.call(
+        "gauge_controller:apply_transfer_ownership",
+        gauge_controller.apply_transfer_ownership,
+        tx_params,
     )
-    repeat(
-        escrow.commit_transfer_ownership, ARAGON_AGENT, {"from": deployer, "required_confs": CONFS},
+    cache.call(
+        "voting_escrow:commit_transfer_ownership",
+        escrow.commit_transfer_ownership,
+        ARAGON_AGENT,
+        tx_params,
     )
-    repeat(escrow.apply_transfer_ownership, {"from": deployer, "required_confs": CONFS})
+    cache.call("voting_escrow:apply_transfer_ownership", escrow.apply_transfer_ownership, tx_params)
 
-    repeat(PoolProxy.deploy, {"from": deployer, "required_confs": CONFS})
+    cache.deploy("pool_proxy", PoolProxy, tx_params)
 
-    vesting = repeat(
-        VestingEscrow.deploy,
+    # the start time changes on every run, so it is excluded from the cache key
+    vesting = cache.deploy(
+        "vesting",
+        VestingEscrow,
         token,
         time.time() + 300,
         "1628364267",
         False,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
+        cache_args=(token, "1628364267", False),
     )
     save_abi(vesting, "vesting")
 
-    repeat(token.approve, vesting, 1000e18, {"from": deployer, "required_confs": CONFS})
-    repeat(
+    cache.call("token_crv:approve:vesting", token.approve, vesting, 1000e18, tx_params)
+    cache.call(
+        "vesting:fund",
         vesting.fund,
         VESTING_ADDRESSES + ["0x0000000000000000000000000000000000000000"] * 9,
         [1000e18] + [0] * 9,
-        {"from": deployer, "required_confs": CONFS},
+        tx_params,
+    )
+
+    print(
+        f"Deployment complete! {cache.executed} steps executed, {cache.skipped} reused from cache"
     )
@@ -0,0 +1,118 @@
+"""
+Deployment Cache
+================
+Persists the result of each deployment step to a JSON file so that an interrupted
+deployment can be resumed without redeploying contracts that already exist.
+
+Each step is keyed by name and by the arguments it was called with. On a rerun, a
+cached deployment is reused only if the code at its address still matches the
+compiled bytecode, and a cached call is skipped only if its transaction succeeded.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from brownie import chain, web3
+from web3.exceptions import TransactionNotFound
+
+# maximum number of attempts for a single step, and initial delay between them
+MAX_ATTEMPTS = 5
+BACKOFF_SECONDS = 2
+
+
+def repeat(f, *args, attempts=MAX_ATTEMPTS, delay=BACKOFF_SECONDS):
+    """
+    Repeat when geth is not broadcasting (unaccounted error), backing off exponentially
+    """
+    for i in range(attempts):
+        try:
+            return f(*args)
+        except KeyError:
+            if i == attempts - 1:
+                raise
+            time.sleep(delay * 2 ** i)
+
+
+def _codehash(bytecode):
+    return web3.keccak(hexstr=bytecode).hex() if bytecode not in ("", "0x") else None
+
+
+class DeploymentCache:
+    """
+    Step cache stored in a JSON file, namespaced by chain ID.
+
+    Arguments
+    ---------
+    path : str
+        Path to the JSON file. It is created if it does not exist.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._data = {}
+        if self.path.exists():
+            with self.path.open() as fp:
+                self._data = json.load(fp)
+        self._steps = self._data.setdefault(str(chain.id), {})
+        self.skipped = 0
+        self.executed = 0
+
+    def deploy(self, name, container, *args, cache_args=None):
+        """
+        Deploy `container`, or return the cached deployment for this step.
+
+        The final item in `args` must be the transaction parameters dict. Use `cache_args`
+        to key the step on a subset of the arguments, e.g. when one is a timestamp.
+        """
+        args, tx_params = args[:-1], args[-1]
+        key = self._key(args if cache_args is None else cache_args)
+        expected = _codehash(container._build["deployedBytecode"])
+
+        entry = self._steps.get(name)
+        if entry and entry["key"] == key and entry["codehash"] == expected:
+            if _codehash(web3.eth.getCode(entry["address"]).hex()) == expected:
+                self.skipped += 1
+                return container.at(entry["address"])
+
+        contract = repeat(container.deploy, *args, tx_params)
+        self._store(name, {"key": key, "address": contract.address, "codehash": expected})
+        return contract
+
+    def call(self, name, fn, *args):
+        """
+        Call a contract method `fn`, unless the same call already succeeded.
+
+        As with `deploy`, the final item in `args` is the transaction parameters dict.
+        """
+        key = self._key((fn._address, fn.abi["name"]) + args[:-1])
+
+        entry = self._steps.get(name)
+        if entry and entry["key"] == key:
+            try:
+                receipt = web3.eth.getTransactionReceipt(entry["txid"])
+            except TransactionNotFound:
+                receipt = None
+            if receipt is not None and receipt["status"] == 1:
+                self.skipped += 1
+                return None
+
+        tx = repeat(fn, *args)
+        self._store(name, {"key": key, "txid": tx.txid})
+        return tx
+
+    def address(self, name):
+        """
+        Return the cached address of a deployment step, or None.
+        """
+        return self._steps.get(name, {}).get("address")
+
+    def _key(self, args):
+        return web3.keccak(text=json.dumps([str(i) for i in args])).hex()
+
+    def _store(self, name, entry):
+        # written after every step so an interruption loses at most one step
+        self.executed += 1
+        self._steps[name] = entry
+        with self.path.open("w") as fp:
+            json.dump(self._data, fp, indent=4, sort_keys=True)
@@ -10,6 +10,7 @@ from web3 import middleware
 from web3.gas_strategies.time_based import fast_gas_price_strategy as gas_strategy
 
 LP_VESTING_JSON = "scripts/early-users.json"
+FACTORY_VESTING_JSON = "scripts/factory-vestings.json"
 DEPLOYMENTS_JSON = "deployments.json"
 REQUIRED_CONFIRMATIONS = 3
 
@@ -78,6 +79,11 @@ FACTORY_ESCROWS = [
     },
 ]
 
+# `VestingEscrowSimple` contracts to be deployed from a factory via `vest_factory_escrows`
+# recipients and amounts are loaded from `FACTORY_VESTING_JSON`, as {address: amount}
+FACTORY_VESTING_DURATION = 2 * YEAR
+FACTORY_VESTING_CAN_DISABLE = True
+
 
 def get_live_admin():
     # Admin and funding admin account objects used for in a live environment
@@ -0,0 +1,104 @@
+"""
+Deployment Gas Planner
+======================
+Runs a deployment entry point against a throwaway local chain and reports the gas
+used by every deployment and call, without broadcasting anything to a live network.
+
+By default the `development` stage of `deploy_dao` is estimated. Other entry points
+are passed as `module:function`, e.g. from `brownie console --network mainnet-fork`:
+
+    >>> run("deployment/plan_gas", args=("burners.deploy_burners_fee_distro:main",))
+
+The JSON report omits addresses and transaction hashes, so reports generated from
+different versions of a script can be compared with a plain diff.
+"""
+
+import importlib
+import json
+
+from brownie import chain, history, rpc, web3
+
+# gas prices (in gwei) used to project the total cost of the deployment
+GAS_PRICES = [10, 25, 50, 100, 200, 500]
+
+# steps using more than this fraction of the block gas limit are flagged
+BLOCK_LIMIT_WARNING = 0.8
+
+REPORT_JSON = "gas-plan.json"
+
+
+def main(entry_point="deployment.deploy_dao:development", report_json=REPORT_JSON):
+    """
+    Estimate the gas cost of `entry_point`, given as `module:function` relative to
+    the `scripts` folder.
+    """
+    if not rpc.is_active():
+        raise ValueError("The planner must be run on a local or forked development network")
+
+    module_name, fn_name = entry_point.split(":")
+    fn = getattr(importlib.import_module(f"scripts.{module_name}"), fn_name)
+
+    chain.snapshot()
+    start = len(history)
+    try:
+        fn()
+        txs = list(history)[start:]
+    finally:
+        chain.revert()
+
+    report = build_report(entry_point, txs, web3.eth.getBlock("latest")["gasLimit"])
+    print_report(report)
+
+    with open(report_json, "w") as fp:
+        json.dump(report, fp, indent=2, sort_keys=True)
+    print(f"\nReport saved to {report_json}")
+
+    return report
+
+
+def build_report(entry_point, txs, block_gas_limit):
+    steps = []
+    for i, tx in enumerate(txs):
+        is_deploy = tx.contract_address is not None
+        steps.append(
+            {
+                "index": i,
+                "type": "deploy" if is_deploy else "call",
+                "contract": tx.contract_name,
+                "function": "constructor" if is_deploy else tx.fn_name,
+                "gas_used": tx.gas_used,
+                "block_fraction": round(tx.gas_used / block_gas_limit, 4),
+                "near_block_limit": tx.gas_used > block_gas_limit * BLOCK_LIMIT_WARNING,
+                "status": int(tx.status),
+            }
+        )
+
+    total_gas = sum(i["gas_used"] for i in steps)
+    return {
+        "entry_point": entry_point,
+        "block_gas_limit": block_gas_limit,
+        "total_gas": total_gas,
+        "deploy_gas": sum(i["gas_used"] for i in steps if i["type"] == "deploy"),
+        "call_gas": sum(i["gas_used"] for i in steps if i["type"] == "call"),
+        "cost_eth": {str(i): total_gas * i / 10 ** 9 for i in GAS_PRICES},
+        "steps": steps,
+    }
+
+
+def print_report(report):
+    print(f"\nGas plan for {report['entry_point']}:")
+    for step in report["steps"]:
+        flag = "  <-- near block gas limit" if step["near_block_limit"] else ""
+        if not step["status"]:
+            flag = "  <-- reverted"
+        print(
+            f"  {step['index']:>3} {step['type']:<6} {step['contract']}.{step['function']}: "
+            f"{step['gas_used']:,}{flag}"
+        )
+
+    print(
+        f"\nTotal gas: {report['total_gas']:,} "
+        f"(deployments {report['deploy_gas']:,}, calls {report['call_gas']:,})"
+    )
+    for gwei, cost in report["cost_eth"].items():
+        print(f"  at {gwei:>3} gwei: {cost:.4f} ETH")
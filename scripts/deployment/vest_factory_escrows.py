@@ -0,0 +1,120 @@
+import json
+
+from brownie import ERC20CRV, VestingEscrowFactory, VestingEscrowSimple, accounts, chain, history
+
+from . import deployment_config as config
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+YEAR = 86400 * 365
+
+# must match `MAX_BATCH_SIZE` in `VestingEscrowFactory`
+BATCH_SIZE = 32
+
+
+def live(factory_name="employees"):
+    """
+    Deploy vesting contracts from a factory in a live environment.
+    """
+    admin, _ = config.get_live_admin()
+
+    with open(config.DEPLOYMENTS_JSON) as fp:
+        deployments = json.load(fp)
+    with open(config.FACTORY_VESTING_JSON) as fp:
+        recipients = json.load(fp)
+
+    factory = VestingEscrowFactory.at(deployments["VestingEscrowFactory"][factory_name])
+    token = ERC20CRV.at(deployments["ERC20CRV"])
+    start_time = token.future_epoch_time_write.call()
+
+    provision(
+        admin,
+        factory,
+        token,
+        recipients,
+        config.FACTORY_VESTING_DURATION,
+        config.FACTORY_VESTING_CAN_DISABLE,
+        start_time,
+        config.REQUIRED_CONFIRMATIONS,
+    )
+
+
+def development(count=200):
+    """
+    Deploy `count` vesting contracts in a development environment, comparing the gas
+    cost of batched and individual deployments.
+    """
+    admin = accounts[0]
+    token = ERC20CRV.deploy("Curve DAO Token", "CRV", 18, {"from": admin})
+    target = VestingEscrowSimple.deploy({"from": admin})
+    factory = VestingEscrowFactory.deploy(target, admin, {"from": admin})
+
+    recipients = {accounts.add().address: 10 ** 18 * (i + 1) for i in range(int(count))}
+    token.transfer(factory, sum(recipients.values()), {"from": admin})
+    start_time = chain.time() + 3600
+
+    # deploy one at a time inside a snapshot to measure the baseline
+    chain.snapshot()
+    start_idx = len(history)
+    for recipient, amount in recipients.items():
+        factory.deploy_vesting_contract(
+            token, recipient, amount, True, 2 * YEAR, start_time, {"from": admin}
+        )
+    single_gas = sum(i.gas_used for i in history[start_idx:])
+    chain.revert()
+
+    escrows = provision(admin, factory, token, recipients, 2 * YEAR, True, start_time, 1)
+    sanity_check(token, escrows, recipients)
+    print(f"Individual deployments: {single_gas // len(recipients)} gas per escrow")
+
+
+def provision(admin, factory, token, recipients, duration, can_disable, start_time, confs):
+    """
+    Deploy a `VestingEscrowSimple` for each item in `recipients`, a dict of
+    {address: amount}, using batched calls to `deploy_many_vesting_contracts`.
+    """
+    total_amount = sum(recipients.values())
+    if token.balanceOf(factory) < total_amount:
+        raise ValueError(f"Insufficient balance in factory {factory.address}")
+
+    items = list(recipients.items())
+    # estimated before any tokens leave the factory, for comparison with the batched cost
+    single_gas = factory.deploy_vesting_contract.estimate_gas(
+        token, items[0][0], items[0][1], can_disable, duration, start_time, {"from": admin}
+    )
+
+    escrows = {}
+    gas_used = 0
+    for i in range(0, len(items), BATCH_SIZE):
+        batch = items[i : i + BATCH_SIZE]
+        zeros = BATCH_SIZE - len(batch)
+        tx = factory.deploy_many_vesting_contracts(
+            token,
+            [x[0] for x in batch] + [ZERO_ADDRESS] * zeros,
+            [x[1] for x in batch] + [0] * zeros,
+            can_disable,
+            duration,
+            start_time,
+            {"from": admin, "required_confs": confs},
+        )
+        # contracts are created in the same order as the recipients
+        escrows.update(zip([x[0] for x in batch], tx.new_contracts))
+        gas_used += tx.gas_used
+        print(f"{min(i + BATCH_SIZE, len(items))}/{len(items)} vesting contracts deployed...")
+
+    print(
+        f"Deployed {len(escrows)} vesting contracts in {-(-len(items) // BATCH_SIZE)} "
+        f"transactions. Total gas used: {gas_used}\n"
+        f"Batched: {gas_used // len(escrows)} gas per escrow, "
+        f"estimated individual deployment: {single_gas} gas per escrow"
+    )
+
+    return escrows
+
+
+def sanity_check(token, escrows, recipients):
+    for recipient, amount in recipients.items():
+        escrow = VestingEscrowSimple.at(escrows[recipient])
+        if escrow.initial_locked(recipient) != amount or token.balanceOf(escrow) != amount:
+            raise ValueError(f"Incorrect vested amount for {recipient} in {escrow.address}")
+
+    print("Sanity check passed!")
@@ -0,0 +1,95 @@
+from functools import lru_cache
+
+# helpers computing the epoch hints taken by `VotingEscrow.balanceOfAtHinted`,
+# `VotingEscrow.totalSupplyAtHinted`, `FeeDistributor.ve_for_at_hinted` and
+# `FeeDistributor.checkpoint_total_supply_hinted`
+#
+# each hint is the last epoch of a point history whose block number (or timestamp)
+# is not greater than the target. off-chain, the binary search only costs view calls.
+# hints may go stale once new points are added, in which case the contract falls back
+# to its own binary search - the result is the same either way
+
+WEEK = 86400 * 7
+
+# index of the timestamp and block number within a `Point` struct
+TS = 2
+BLK = 3
+
+
+def last_epoch(get_point, key, value, max_epoch):
+    """
+    Find the last epoch in `[0, max_epoch]` whose point has `point[key] <= value`.
+
+    The binary search used by the contracts - epoch 0 is returned when no other
+    epoch matches, even if its own point does not.
+
+    Arguments
+    ---------
+    get_point : callable
+        Returns the point at an epoch.
+    key : int
+        Index of the point field to compare, `TS` or `BLK`.
+    value : int
+        Timestamp or block number to find.
+    max_epoch : int
+        Last epoch of the point history.
+    """
+    _min = 0
+    _max = max_epoch
+    while _min < _max:
+        _mid = (_min + _max + 1) // 2
+        if get_point(_mid)[key] <= value:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+def _points(voting_escrow, user=None):
+    if user is None:
+        return lru_cache(maxsize=None)(lambda i: tuple(voting_escrow.point_history(i)))
+    return lru_cache(maxsize=None)(lambda i: tuple(voting_escrow.user_point_history(user, i)))
+
+
+def block_epoch(voting_escrow, block):
+    """
+    Hint for `_epoch` in `balanceOfAtHinted`, and `_epoch_hint` in `totalSupplyAtHinted`.
+    """
+    return last_epoch(_points(voting_escrow), BLK, block, voting_escrow.epoch())
+
+
+def user_block_epoch(voting_escrow, user, block):
+    """
+    Hint for `_user_epoch` in `VotingEscrow.balanceOfAtHinted`.
+    """
+    max_epoch = voting_escrow.user_point_epoch(user)
+    return last_epoch(_points(voting_escrow, user), BLK, block, max_epoch)
+
+
+def user_timestamp_epoch(voting_escrow, user, timestamp):
+    """
+    Hint for `_user_epoch` in `FeeDistributor.ve_for_at_hinted`.
+    """
+    max_epoch = voting_escrow.user_point_epoch(user)
+    return last_epoch(_points(voting_escrow, user), TS, timestamp, max_epoch)
+
+
+def total_supply_epochs(fee_distributor, voting_escrow, timestamp):
+    """
+    Hints for `FeeDistributor.checkpoint_total_supply_hinted`, called at `timestamp`.
+
+    Returns a list of 20 epochs, one for each week from the distributor's `time_cursor`.
+    Weeks after `timestamp` are not checkpointed, and their hints are zero.
+    """
+    get_point = _points(voting_escrow)
+    max_epoch = voting_escrow.epoch()
+    week = fee_distributor.time_cursor()
+
+    epochs = []
+    for i in range(20):
+        if week > timestamp // WEEK * WEEK:
+            epochs.append(0)
+        else:
+            epochs.append(last_epoch(get_point, TS, week, max_epoch))
+        week += WEEK
+    return epochs
@@ -0,0 +1,97 @@
+from brownie import Contract, accounts, chain
+
+# This script fills the weekly data of the gauge controller after a long
+# period without checkpoints. Filling many weeks within a single vote or
+# checkpoint can cost more gas than fits in a block, so the backlog is
+# filled with `catch_up` and `catch_up_gauge` over several transactions.
+# All of the transactions within the script may be executed by any account
+# at any time.
+
+WEEK = 86400 * 7
+
+# the account you wish to perform transactions from
+CALLER = accounts.add()
+
+GAUGE_CONTROLLER = "0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB"
+
+# maximum number of weeks filled by one transaction
+MAX_WEEKS = 50
+
+# the number of weeks is halved until a transaction is estimated below this limit
+TX_GAS_LIMIT = 5_000_000
+
+
+def stale_weeks(last_time, timestamp):
+    """
+    Number of weeks to fill for data last scheduled at `last_time`.
+
+    Data is filled up to the week following `timestamp`. A `last_time` of zero
+    means nothing was ever scheduled, and there is nothing to fill.
+    """
+    if last_time == 0 or last_time > timestamp:
+        return 0
+    return (timestamp - last_time) // WEEK + 1
+
+
+def get_pending(gauge_controller, timestamp=None):
+    """
+    Get the number of weeks to fill for the data common to all gauges, and for
+    each gauge with missed weeks.
+
+    Returns
+    -------
+    int
+        Weeks to fill for the type sums, type weights and the total weight.
+    dict
+        Weeks to fill for each gauge, as {gauge: weeks}.
+    """
+    if timestamp is None:
+        timestamp = chain.time()
+
+    n_types = gauge_controller.n_gauge_types()
+    common = stale_weeks(gauge_controller.time_total(), timestamp)
+    for i in range(n_types):
+        common = max(
+            common,
+            stale_weeks(gauge_controller.time_sum(i), timestamp),
+            stale_weeks(gauge_controller.time_type_weight(i), timestamp),
+        )
+
+    gauges = {}
+    for i in range(gauge_controller.n_gauges()):
+        gauge = gauge_controller.gauges(i)
+        weeks = stale_weeks(gauge_controller.time_weight(gauge), timestamp)
+        if weeks:
+            gauges[gauge] = weeks
+
+    return common, gauges
+
+
+def _fill(fn, args, weeks, acct, max_weeks, gas_limit):
+    # fill `weeks` weeks, in as few transactions as fit within `gas_limit`
+    step = min(weeks, max_weeks)
+    while weeks > 0:
+        while step > 1 and fn.estimate_gas(*args, step, {"from": acct}) > gas_limit:
+            step //= 2
+        fn(*args, step, {"from": acct})
+        weeks -= step
+        step = min(weeks, step)
+
+
+def main(
+    acct=CALLER, gauge_controller=GAUGE_CONTROLLER, max_weeks=MAX_WEEKS, gas_limit=TX_GAS_LIMIT
+):
+    gauge_controller = Contract(gauge_controller)
+
+    common, gauges = get_pending(gauge_controller)
+    print(f"{common} weeks to fill for all gauges, {len(gauges)} gauges with missed weeks")
+
+    if common:
+        _fill(gauge_controller.catch_up, (), common, acct, max_weeks, gas_limit)
+    for gauge, weeks in gauges.items():
+        print(f"Filling {weeks} weeks for {gauge}")
+        _fill(gauge_controller.catch_up_gauge, (gauge,), weeks, acct, max_weeks, gas_limit)
+
+    common, gauges = get_pending(gauge_controller)
+    assert common == 0 and not gauges
+    print("Gauge controller is up to date")
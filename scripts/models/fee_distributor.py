@@ -0,0 +1,311 @@
+"""
+FeeDistributor Reference Model
+==============================
+An exact pure-Python model of `contracts/FeeDistributor.vy`, coupled to a
+`VotingEscrowModel`.
+
+Every state-changing method takes the `timestamp` and `block` of the transaction,
+as checkpointing the total supply also checkpoints the voting escrow. Integer math
+follows the contract exactly, so results can be compared with the contract for
+equality. Failed assertions raise `Revert`.
+
+The fee token is modelled only through the distributor's own balance. Tokens sent
+to the distributor are added with `receive`, and claimed amounts are returned.
+"""
+
+from scripts.models.voting_escrow import Point, Revert, _int128, _sub
+
+WEEK = 7 * 86400
+TOKEN_CHECKPOINT_DEADLINE = 86400
+MAX_CLAIM_ITERATIONS = 500
+
+
+class FeeDistributorModel:
+    """
+    Model of a `FeeDistributor` for `voting_escrow`, deployed with `start_time`.
+    """
+
+    def __init__(self, voting_escrow, start_time, admin):
+        t = start_time // WEEK * WEEK
+        self.voting_escrow = voting_escrow
+        self.start_time = t
+        self.time_cursor = t
+        self.last_token_time = t
+        self.time_cursor_of = {}
+        self.user_epoch_of = {}
+        self.tokens_per_week = {}
+        self.ve_supply = {}
+        self.token_last_balance = 0
+        self.admin = admin
+        self.can_checkpoint_token = False
+        self.is_killed = False
+
+        # balance of the fee token held by the distributor
+        self.token_balance = 0
+
+    def receive(self, amount):
+        """
+        Transfer `amount` fee tokens to the distributor, without a checkpoint.
+        """
+        self.token_balance += amount
+
+    def _can_checkpoint(self, timestamp):
+        return self.can_checkpoint_token and timestamp > (
+            self.last_token_time + TOKEN_CHECKPOINT_DEADLINE
+        )
+
+    def _checkpoint_token(self, timestamp):
+        to_distribute = _sub(self.token_balance, self.token_last_balance)
+        self.token_last_balance = self.token_balance
+
+        t = self.last_token_time
+        since_last = timestamp - t
+        self.last_token_time = timestamp
+        this_week = t // WEEK * WEEK
+
+        for i in range(20):
+            next_week = this_week + WEEK
+            if timestamp < next_week:
+                if since_last == 0 and timestamp == t:
+                    amount = to_distribute
+                else:
+                    amount = to_distribute * (timestamp - t) // since_last
+                self.tokens_per_week[this_week] = self.tokens_per_week.get(this_week, 0) + amount
+                break
+            else:
+                if since_last == 0 and next_week == t:
+                    amount = to_distribute
+                else:
+                    amount = to_distribute * (next_week - t) // since_last
+                self.tokens_per_week[this_week] = self.tokens_per_week.get(this_week, 0) + amount
+            t = next_week
+            this_week = next_week
+
+    def checkpoint_token(self, sender, timestamp):
+        if sender != self.admin and not self._can_checkpoint(timestamp):
+            raise Revert(None)
+        self._checkpoint_token(timestamp)
+
+    def _find_timestamp_epoch(self, timestamp):
+        ve = self.voting_escrow
+        _min = 0
+        _max = ve.epoch
+        for i in range(128):
+            if _min >= _max:
+                break
+            _mid = (_min + _max + 2) // 2
+            if ve.get_point(_mid).ts <= timestamp:
+                _min = _mid
+            else:
+                _max = _mid - 1
+        return _min
+
+    def _find_timestamp_user_epoch(self, user, timestamp, max_user_epoch):
+        ve = self.voting_escrow
+        _min = 0
+        _max = max_user_epoch
+        for i in range(128):
+            if _min >= _max:
+                break
+            _mid = (_min + _max + 2) // 2
+            if ve.get_user_point(user, _mid).ts <= timestamp:
+                _min = _mid
+            else:
+                _max = _mid - 1
+        return _min
+
+    def ve_for_at(self, user, timestamp):
+        ve = self.voting_escrow
+        max_user_epoch = ve.get_user_point_epoch(user)
+        epoch = self._find_timestamp_user_epoch(user, timestamp, max_user_epoch)
+        pt = ve.get_user_point(user, epoch)
+        return max(pt.bias - pt.slope * _int128(_sub(timestamp, pt.ts)), 0)
+
+    def _checkpoint_total_supply(self, timestamp, block):
+        ve = self.voting_escrow
+        t = self.time_cursor
+        rounded_timestamp = timestamp // WEEK * WEEK
+        ve.checkpoint(timestamp, block)
+
+        for i in range(20):
+            if t > rounded_timestamp:
+                break
+            else:
+                pt = ve.get_point(self._find_timestamp_epoch(t))
+                dt = 0
+                if t > pt.ts:
+                    # if the point is at 0 epoch, it can actually be earlier than the first deposit
+                    dt = _int128(t - pt.ts)
+                self.ve_supply[t] = max(pt.bias - pt.slope * dt, 0)
+            t += WEEK
+
+        self.time_cursor = t
+
+    def checkpoint_total_supply(self, timestamp, block):
+        self._checkpoint_total_supply(timestamp, block)
+
+    def _claim(self, addr, _last_token_time, max_iterations=50):
+        ve = self.voting_escrow
+        to_distribute = 0
+
+        max_user_epoch = ve.get_user_point_epoch(addr)
+        _start_time = self.start_time
+
+        if max_user_epoch == 0:
+            # no lock = no fees
+            return 0, False
+
+        week_cursor = self.time_cursor_of.get(addr, 0)
+        if week_cursor == 0:
+            # need to do the initial binary search
+            user_epoch = self._find_timestamp_user_epoch(addr, _start_time, max_user_epoch)
+        else:
+            user_epoch = self.user_epoch_of.get(addr, 0)
+
+        if user_epoch == 0:
+            user_epoch = 1
+
+        user_point = ve.get_user_point(addr, user_epoch)
+
+        if week_cursor == 0:
+            week_cursor = (user_point.ts + WEEK - 1) // WEEK * WEEK
+
+        if week_cursor >= _last_token_time:
+            return 0, False
+
+        if week_cursor < _start_time:
+            week_cursor = _start_time
+        old_user_point = Point()
+
+        # iterate over weeks
+        remaining = True
+        for i in range(max_iterations):
+            if week_cursor >= _last_token_time:
+                remaining = False
+                break
+
+            if week_cursor >= user_point.ts and user_epoch <= max_user_epoch:
+                user_epoch += 1
+                old_user_point = user_point
+                if user_epoch > max_user_epoch:
+                    user_point = Point()
+                else:
+                    user_point = ve.get_user_point(addr, user_epoch)
+            else:
+                dt = _int128(_sub(week_cursor, old_user_point.ts))
+                balance_of = max(old_user_point.bias - dt * old_user_point.slope, 0)
+                if balance_of == 0 and user_epoch > max_user_epoch:
+                    remaining = False
+                    break
+                if balance_of > 0:
+                    supply = self.ve_supply.get(week_cursor, 0)
+                    if supply == 0:
+                        raise Revert("division by zero")
+                    to_distribute += balance_of * self.tokens_per_week.get(week_cursor, 0) // supply
+
+                week_cursor += WEEK
+
+        if remaining:
+            # check if the next iteration would have stopped
+            if week_cursor >= _last_token_time:
+                remaining = False
+            elif user_epoch > max_user_epoch:
+                dt = _int128(_sub(week_cursor, old_user_point.ts))
+                if old_user_point.bias - dt * old_user_point.slope <= 0:
+                    remaining = False
+
+        user_epoch = min(max_user_epoch, user_epoch - 1)
+        self.user_epoch_of[addr] = user_epoch
+        self.time_cursor_of[addr] = week_cursor
+
+        return to_distribute, remaining
+
+    def _prepare_claim(self, timestamp, block):
+        if self.is_killed:
+            raise Revert(None)
+
+        if timestamp >= self.time_cursor:
+            self._checkpoint_total_supply(timestamp, block)
+
+        last_token_time = self.last_token_time
+
+        if self._can_checkpoint(timestamp):
+            self._checkpoint_token(timestamp)
+            last_token_time = timestamp
+
+        return last_token_time // WEEK * WEEK
+
+    def claim(self, addr, timestamp, block):
+        """
+        Claim fees for `addr`, returning the amount transferred.
+        """
+        last_token_time = self._prepare_claim(timestamp, block)
+        amount, remaining = self._claim(addr, last_token_time)
+        if amount != 0:
+            self.token_balance = _sub(self.token_balance, amount)
+            self.token_last_balance = _sub(self.token_last_balance, amount)
+        return amount
+
+    def claim_partial(self, addr, max_iterations, timestamp, block):
+        """
+        Claim fees for `addr`, looking at up to `max_iterations` points and weeks.
+        Returns the amount transferred, and whether more remains to be claimed.
+        """
+        if max_iterations < 2:
+            raise Revert(None)
+        last_token_time = self._prepare_claim(timestamp, block)
+        amount, remaining = self._claim(
+            addr, last_token_time, min(max_iterations, MAX_CLAIM_ITERATIONS)
+        )
+        if amount != 0:
+            self.token_balance = _sub(self.token_balance, amount)
+            self.token_last_balance = _sub(self.token_last_balance, amount)
+        return amount, remaining
+
+    def claim_many(self, receivers, timestamp, block):
+        """
+        Claim fees for up to 20 addresses, stopping at the first `None`. Returns a
+        list of the amounts transferred to each receiver.
+        """
+        if len(receivers) > 20:
+            raise ValueError("Cannot claim for more than 20 receivers")
+
+        last_token_time = self._prepare_claim(timestamp, block)
+        amounts = []
+        for addr in receivers:
+            if addr is None:
+                break
+            amount, remaining = self._claim(addr, last_token_time)
+            self.token_balance = _sub(self.token_balance, amount)
+            amounts.append(amount)
+
+        self.token_last_balance = _sub(self.token_last_balance, sum(amounts))
+        return amounts
+
+    def burn(self, amount, timestamp):
+        """
+        Receive the caller's entire fee token balance of `amount`, and checkpoint if allowed.
+        """
+        if self.is_killed:
+            raise Revert(None)
+
+        if amount != 0:
+            self.token_balance += amount
+            if self._can_checkpoint(timestamp):
+                self._checkpoint_token(timestamp)
+
+    def toggle_allow_checkpoint_token(self, sender):
+        if sender != self.admin:
+            raise Revert(None)
+        self.can_checkpoint_token = not self.can_checkpoint_token
+
+    def kill_me(self, sender):
+        """
+        Kill the distributor, returning the balance sent to the emergency return address.
+        """
+        if sender != self.admin:
+            raise Revert(None)
+        self.is_killed = True
+        amount = self.token_balance
+        self.token_balance = 0
+        return amount
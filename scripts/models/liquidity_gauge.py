@@ -0,0 +1,232 @@
+"""
+LiquidityGauge Simulator
+========================
+An exact integer model of `contracts/gauges/LiquidityGauge.vy`, including the
+boost applied by `_update_liquidity_limit`, and of the `ERC20CRV` rate schedule.
+
+The gauge is driven by a `relative_weight(t)` callable, returning the gauge's
+relative weight (normalized to 1e18) for the week containing `t`, and by an object
+exposing `balanceOf(addr, t)` and `totalSupply(t)` for voting power. Both a
+`VotingEscrowModel` and a deployed `VotingEscrow` satisfy this interface.
+
+Every state-changing method takes the `timestamp` of the transaction. Use
+`claimable_all` to evaluate the claimable CRV for many users at once.
+"""
+
+from scripts.models.voting_escrow import Revert
+
+YEAR = 86400 * 365
+WEEK = 604800
+
+TOKENLESS_PRODUCTION = 40
+BOOST_WARMUP = 2 * 7 * 86400
+
+INITIAL_RATE = 274_815_283 * 10 ** 18 // YEAR
+RATE_REDUCTION_TIME = YEAR
+RATE_REDUCTION_COEFFICIENT = 1189207115002721024
+RATE_DENOMINATOR = 10 ** 18
+INFLATION_DELAY = 86400
+
+
+class CRVRateModel:
+    """
+    Model of the `ERC20CRV` mining parameters for a token deployed at `timestamp`.
+    """
+
+    def __init__(self, timestamp):
+        self.start_epoch_time = timestamp + INFLATION_DELAY - RATE_REDUCTION_TIME
+        self.mining_epoch = -1
+        self.rate = 0
+
+    def _update_mining_parameters(self):
+        self.start_epoch_time += RATE_REDUCTION_TIME
+        self.mining_epoch += 1
+        if self.rate == 0:
+            self.rate = INITIAL_RATE
+        else:
+            self.rate = self.rate * RATE_DENOMINATOR // RATE_REDUCTION_COEFFICIENT
+
+    def future_epoch_time_write(self, timestamp):
+        if timestamp >= self.start_epoch_time + RATE_REDUCTION_TIME:
+            self._update_mining_parameters()
+        return self.start_epoch_time + RATE_REDUCTION_TIME
+
+
+class LiquidityGaugeModel:
+    """
+    Model of a `LiquidityGauge` deployed at `timestamp`.
+
+    Arguments
+    ---------
+    crv : CRVRateModel
+        Rate schedule of the CRV token. Shared between gauges using the same token.
+    relative_weight : callable | int
+        Gauge relative weight as a function of time, or a constant weight.
+    voting_escrow : object
+        Source of voting power, with `balanceOf(addr, t)` and `totalSupply(t)`.
+    timestamp : int
+        Timestamp of the gauge deployment.
+    """
+
+    def __init__(self, crv, relative_weight, voting_escrow, timestamp):
+        if not callable(relative_weight):
+            weight = relative_weight
+            relative_weight = lambda t: weight  # noqa: E731
+
+        self.crv = crv
+        self.relative_weight = relative_weight
+        self.voting_escrow = voting_escrow
+
+        self.balanceOf = {}
+        self.totalSupply = 0
+        self.working_balances = {}
+        self.working_supply = 0
+
+        self.period = 0
+        self.period_timestamp = [timestamp]
+        self.integrate_inv_supply = [0]
+        self.integrate_inv_supply_of = {}
+        self.integrate_checkpoint_of = {}
+        self.integrate_fraction = {}
+
+        self.inflation_rate = crv.rate
+        self.future_epoch_time = crv.future_epoch_time_write(timestamp)
+        self.is_killed = False
+
+    def _checkpoint(self, addr, timestamp):
+        _period = self.period
+        _period_time = self.period_timestamp[_period]
+        _integrate_inv_supply = self.integrate_inv_supply[_period]
+        rate = self.inflation_rate
+        new_rate = rate
+        prev_future_epoch = self.future_epoch_time
+        if prev_future_epoch >= _period_time:
+            self.future_epoch_time = self.crv.future_epoch_time_write(timestamp)
+            new_rate = self.crv.rate
+            self.inflation_rate = new_rate
+
+        _working_balance = self.working_balances.get(addr, 0)
+        _working_supply = self.working_supply
+
+        if self.is_killed:
+            rate = 0
+
+        if timestamp > _period_time:
+            prev_week_time = _period_time
+            week_time = min((_period_time + WEEK) // WEEK * WEEK, timestamp)
+
+            for i in range(500):
+                dt = week_time - prev_week_time
+                w = self.relative_weight(prev_week_time // WEEK * WEEK)
+
+                if _working_supply > 0:
+                    if prev_future_epoch >= prev_week_time and prev_future_epoch < week_time:
+                        _integrate_inv_supply += (
+                            rate * w * (prev_future_epoch - prev_week_time) // _working_supply
+                        )
+                        rate = new_rate
+                        _integrate_inv_supply += (
+                            rate * w * (week_time - prev_future_epoch) // _working_supply
+                        )
+                    else:
+                        _integrate_inv_supply += rate * w * dt // _working_supply
+
+                if week_time == timestamp:
+                    break
+                prev_week_time = week_time
+                week_time = min(week_time + WEEK, timestamp)
+
+        _period += 1
+        self.period = _period
+        self.period_timestamp.append(timestamp)
+        self.integrate_inv_supply.append(_integrate_inv_supply)
+
+        self.integrate_fraction[addr] = (
+            self.integrate_fraction.get(addr, 0)
+            + _working_balance
+            * (_integrate_inv_supply - self.integrate_inv_supply_of.get(addr, 0))
+            // 10 ** 18
+        )
+        self.integrate_inv_supply_of[addr] = _integrate_inv_supply
+        self.integrate_checkpoint_of[addr] = timestamp
+
+    def _update_liquidity_limit(self, addr, balance, supply, timestamp):
+        voting_balance = self.voting_escrow.balanceOf(addr, timestamp)
+        voting_total = self.voting_escrow.totalSupply(timestamp)
+
+        lim = balance * TOKENLESS_PRODUCTION // 100
+        if voting_total > 0 and timestamp > self.period_timestamp[0] + BOOST_WARMUP:
+            lim += supply * voting_balance // voting_total * (100 - TOKENLESS_PRODUCTION) // 100
+
+        lim = min(balance, lim)
+        old_bal = self.working_balances.get(addr, 0)
+        self.working_balances[addr] = lim
+        self.working_supply = self.working_supply + lim - old_bal
+
+    def user_checkpoint(self, addr, timestamp):
+        self._checkpoint(addr, timestamp)
+        self._update_liquidity_limit(addr, self.balanceOf.get(addr, 0), self.totalSupply, timestamp)
+
+    def deposit(self, addr, value, timestamp):
+        self._checkpoint(addr, timestamp)
+
+        if value != 0:
+            _balance = self.balanceOf.get(addr, 0) + value
+            self.balanceOf[addr] = _balance
+            self.totalSupply += value
+
+            self._update_liquidity_limit(addr, _balance, self.totalSupply, timestamp)
+
+    def withdraw(self, addr, value, timestamp):
+        if value > self.balanceOf.get(addr, 0):
+            raise Revert("uint256 underflow")
+        self._checkpoint(addr, timestamp)
+
+        _balance = self.balanceOf.get(addr, 0) - value
+        self.balanceOf[addr] = _balance
+        self.totalSupply -= value
+
+        self._update_liquidity_limit(addr, _balance, self.totalSupply, timestamp)
+
+    def claimable_tokens(self, addr, timestamp):
+        """
+        Total CRV earned by `addr` at `timestamp`. Minted amounts are not modelled,
+        so this equals `integrate_fraction` on the contract.
+        """
+        self._checkpoint(addr, timestamp)
+        return self.integrate_fraction[addr]
+
+    def claimable_all(self, addrs, timestamp):
+        """
+        Evaluate `claimable_tokens` for every address in `addrs` at once.
+
+        The global integral is updated with a single checkpoint, then every user
+        integral is evaluated as one vectorized operation. Returns a numpy array
+        of python integers, in the same order as `addrs`.
+        """
+        import numpy as np  # Requires numpy
+
+        self._checkpoint(None, timestamp)
+        for values in (self.integrate_fraction, self.integrate_inv_supply_of):
+            del values[None]
+        del self.integrate_checkpoint_of[None]
+        _integrate_inv_supply = self.integrate_inv_supply[self.period]
+
+        def _array(values):
+            return np.array([values.get(i, 0) for i in addrs], dtype=object)
+
+        working_balances = _array(self.working_balances)
+        fractions = _array(self.integrate_fraction)
+        inv_supply_of = _array(self.integrate_inv_supply_of)
+
+        return fractions + working_balances * (_integrate_inv_supply - inv_supply_of) // 10 ** 18
+
+    def boost(self, addr):
+        """
+        Current boost of `addr`, normalized to 1e18 (between 1.0 and 2.5).
+        """
+        balance = self.balanceOf.get(addr, 0)
+        if balance == 0:
+            return 10 ** 18
+        unboosted = balance * TOKENLESS_PRODUCTION // 100
+        return self.working_balances.get(addr, 0) * 10 ** 18 // unboosted
@@ -0,0 +1,412 @@
+"""
+VotingEscrow Reference Model
+============================
+An exact pure-Python model of `contracts/VotingEscrow.vy`.
+
+Every state-changing method takes the `timestamp` and `block` of the transaction,
+and every view depending on the current block takes them as well. Integer math
+follows the contract exactly, including rounding, so results can be compared
+with the contract for equality. Failed assertions raise `Revert` with the same
+reason string (or dev revert comment) as the contract.
+
+Token transfers and smart wallet checks are not modelled.
+"""
+
+WEEK = 7 * 86400
+MAXTIME = 4 * 365 * 86400
+MULTIPLIER = 10 ** 18
+
+DEPOSIT_FOR_TYPE = 0
+CREATE_LOCK_TYPE = 1
+INCREASE_LOCK_AMOUNT = 2
+INCREASE_UNLOCK_TIME = 3
+
+INT128_MAX = 2 ** 127 - 1
+
+
+class Revert(Exception):
+    """
+    Raised when the same call would revert on the contract.
+    """
+
+    def __init__(self, revert_msg):
+        super().__init__(revert_msg)
+        self.revert_msg = revert_msg
+
+
+def _int128(value):
+    # `convert(value, int128)` reverts when the value does not fit
+    if not -INT128_MAX - 1 <= value <= INT128_MAX:
+        raise Revert("int128 overflow")
+    return value
+
+
+def _sub(a, b):
+    # uint256 subtraction reverts on underflow
+    if b > a:
+        raise Revert("uint256 underflow")
+    return a - b
+
+
+def _div(a, b):
+    # vyper integer division rounds toward zero
+    return abs(a) // abs(b) * (1 if (a >= 0) == (b >= 0) else -1)
+
+
+class Point:
+    __slots__ = ("bias", "slope", "ts", "blk")
+
+    def __init__(self, bias=0, slope=0, ts=0, blk=0):
+        self.bias = bias
+        self.slope = slope
+        self.ts = ts
+        self.blk = blk
+
+    def copy(self):
+        return Point(self.bias, self.slope, self.ts, self.blk)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __iter__(self):
+        return iter((self.bias, self.slope, self.ts, self.blk))
+
+    def __repr__(self):
+        return f"Point(bias={self.bias}, slope={self.slope}, ts={self.ts}, blk={self.blk})"
+
+
+class LockedBalance:
+    __slots__ = ("amount", "end")
+
+    def __init__(self, amount=0, end=0):
+        self.amount = amount
+        self.end = end
+
+    def copy(self):
+        return LockedBalance(self.amount, self.end)
+
+    def __iter__(self):
+        return iter((self.amount, self.end))
+
+
+class VotingEscrowModel:
+    """
+    Model of a `VotingEscrow` deployed at `timestamp` in `block`.
+    """
+
+    def __init__(self, timestamp, block):
+        self.supply = 0
+        self.epoch = 0
+        self.locked = {}
+        self.point_history = {0: Point(ts=timestamp, blk=block)}
+        self.user_point_history = {}
+        self.user_point_epoch = {}
+        self.slope_changes = {}
+
+    # storage getters, returning empty values for unset keys like the contract
+
+    def get_locked(self, addr):
+        return self.locked.get(addr, LockedBalance()).copy()
+
+    def get_point(self, epoch):
+        return self.point_history.get(epoch, Point()).copy()
+
+    def get_user_point(self, addr, epoch):
+        return self.user_point_history.get(addr, {}).get(epoch, Point()).copy()
+
+    def get_user_point_epoch(self, addr):
+        return self.user_point_epoch.get(addr, 0)
+
+    def get_slope_change(self, t):
+        return self.slope_changes.get(t, 0)
+
+    def get_last_user_slope(self, addr):
+        return self.get_user_point(addr, self.get_user_point_epoch(addr)).slope
+
+    def locked__end(self, addr):
+        return self.get_locked(addr).end
+
+    # state changing methods
+
+    def _checkpoint(self, addr, old_locked, new_locked, timestamp, block):
+        u_old = Point()
+        u_new = Point()
+        old_dslope = 0
+        new_dslope = 0
+        _epoch = self.epoch
+
+        if addr is not None:
+            if old_locked.end > timestamp and old_locked.amount > 0:
+                u_old.slope = _div(old_locked.amount, MAXTIME)
+                u_old.bias = u_old.slope * _int128(old_locked.end - timestamp)
+            if new_locked.end > timestamp and new_locked.amount > 0:
+                u_new.slope = _div(new_locked.amount, MAXTIME)
+                u_new.bias = u_new.slope * _int128(new_locked.end - timestamp)
+
+            old_dslope = self.get_slope_change(old_locked.end)
+            if new_locked.end != 0:
+                if new_locked.end == old_locked.end:
+                    new_dslope = old_dslope
+                else:
+                    new_dslope = self.get_slope_change(new_locked.end)
+
+        last_point = Point(ts=timestamp, blk=block)
+        if _epoch > 0:
+            last_point = self.get_point(_epoch)
+        last_checkpoint = last_point.ts
+        initial_last_point = last_point.copy()
+        block_slope = 0
+        if timestamp > last_point.ts:
+            block_slope = MULTIPLIER * (block - last_point.blk) // (timestamp - last_point.ts)
+
+        t_i = last_checkpoint // WEEK * WEEK
+        for i in range(255):
+            t_i += WEEK
+            d_slope = 0
+            if t_i > timestamp:
+                t_i = timestamp
+            else:
+                d_slope = self.get_slope_change(t_i)
+            last_point.bias -= last_point.slope * _int128(t_i - last_checkpoint)
+            last_point.slope += d_slope
+            if last_point.bias < 0:
+                last_point.bias = 0
+            if last_point.slope < 0:
+                last_point.slope = 0
+            last_checkpoint = t_i
+            last_point.ts = t_i
+            last_point.blk = (
+                initial_last_point.blk + block_slope * (t_i - initial_last_point.ts) // MULTIPLIER
+            )
+            _epoch += 1
+            if t_i == timestamp:
+                last_point.blk = block
+                break
+            else:
+                self.point_history[_epoch] = last_point.copy()
+
+        self.epoch = _epoch
+
+        if addr is not None:
+            last_point.slope += u_new.slope - u_old.slope
+            last_point.bias += u_new.bias - u_old.bias
+            if last_point.slope < 0:
+                last_point.slope = 0
+            if last_point.bias < 0:
+                last_point.bias = 0
+
+        self.point_history[_epoch] = last_point
+
+        if addr is not None:
+            if old_locked.end > timestamp:
+                old_dslope += u_old.slope
+                if new_locked.end == old_locked.end:
+                    old_dslope -= u_new.slope
+                self.slope_changes[old_locked.end] = old_dslope
+
+            if new_locked.end > timestamp:
+                if new_locked.end > old_locked.end:
+                    new_dslope -= u_new.slope
+                    self.slope_changes[new_locked.end] = new_dslope
+
+            user_epoch = self.get_user_point_epoch(addr) + 1
+            self.user_point_epoch[addr] = user_epoch
+            u_new.ts = timestamp
+            u_new.blk = block
+            self.user_point_history.setdefault(addr, {})[user_epoch] = u_new
+
+    def _deposit_for(self, addr, value, unlock_time, locked_balance, timestamp, block):
+        _locked = locked_balance.copy()
+        self.supply += value
+        old_locked = _locked.copy()
+        _locked.amount += _int128(value)
+        if unlock_time != 0:
+            _locked.end = unlock_time
+        self.locked[addr] = _locked.copy()
+
+        self._checkpoint(addr, old_locked, _locked, timestamp, block)
+
+    def checkpoint(self, timestamp, block):
+        self._checkpoint(None, LockedBalance(), LockedBalance(), timestamp, block)
+
+    def deposit_for(self, addr, value, timestamp, block):
+        _locked = self.get_locked(addr)
+
+        if value == 0:
+            raise Revert("dev: need non-zero value")
+        if _locked.amount <= 0:
+            raise Revert("No existing lock found")
+        if _locked.end <= timestamp:
+            raise Revert("Cannot add to expired lock. Withdraw")
+
+        self._deposit_for(addr, value, 0, _locked, timestamp, block)
+
+    def create_lock(self, addr, value, unlock_time, timestamp, block):
+        unlock_time = unlock_time // WEEK * WEEK
+        _locked = self.get_locked(addr)
+
+        if value == 0:
+            raise Revert("dev: need non-zero value")
+        if _locked.amount != 0:
+            raise Revert("Withdraw old tokens first")
+        if unlock_time <= timestamp:
+            raise Revert("Can only lock until time in the future")
+        if unlock_time > timestamp + MAXTIME:
+            raise Revert("Voting lock can be 4 years max")
+
+        self._deposit_for(addr, value, unlock_time, _locked, timestamp, block)
+
+    def increase_amount(self, addr, value, timestamp, block):
+        _locked = self.get_locked(addr)
+
+        if value == 0:
+            raise Revert("dev: need non-zero value")
+        if _locked.amount <= 0:
+            raise Revert("No existing lock found")
+        if _locked.end <= timestamp:
+            raise Revert("Cannot add to expired lock. Withdraw")
+
+        self._deposit_for(addr, value, 0, _locked, timestamp, block)
+
+    def increase_unlock_time(self, addr, unlock_time, timestamp, block):
+        _locked = self.get_locked(addr)
+        unlock_time = unlock_time // WEEK * WEEK
+
+        if _locked.end <= timestamp:
+            raise Revert("Lock expired")
+        if _locked.amount <= 0:
+            raise Revert("Nothing is locked")
+        if unlock_time <= _locked.end:
+            raise Revert("Can only increase lock duration")
+        if unlock_time > timestamp + MAXTIME:
+            raise Revert("Voting lock can be 4 years max")
+
+        self._deposit_for(addr, 0, unlock_time, _locked, timestamp, block)
+
+    def withdraw(self, addr, timestamp, block):
+        """
+        Withdraw all tokens for `addr`, returning the withdrawn amount.
+        """
+        _locked = self.get_locked(addr)
+        if timestamp < _locked.end:
+            raise Revert("The lock didn't expire")
+        value = _locked.amount
+
+        old_locked = _locked.copy()
+        _locked.end = 0
+        _locked.amount = 0
+        self.locked[addr] = _locked.copy()
+        self.supply -= value
+
+        self._checkpoint(addr, old_locked, _locked, timestamp, block)
+        return value
+
+    # views
+
+    def find_block_epoch(self, block, max_epoch):
+        _min = 0
+        _max = max_epoch
+        for i in range(128):
+            if _min >= _max:
+                break
+            _mid = (_min + _max + 1) // 2
+            if self.get_point(_mid).blk <= block:
+                _min = _mid
+            else:
+                _max = _mid - 1
+        return _min
+
+    def balanceOf(self, addr, t):
+        _epoch = self.get_user_point_epoch(addr)
+        if _epoch == 0:
+            return 0
+        last_point = self.get_user_point(addr, _epoch)
+        last_point.bias -= last_point.slope * _int128(_sub(t, last_point.ts))
+        return max(last_point.bias, 0)
+
+    def balanceOfAt(self, addr, block, current_timestamp, current_block):
+        """
+        Voting power of `addr` at `block`, when called in `current_block`.
+        """
+        if block > current_block:
+            raise Revert("")
+
+        _min = 0
+        _max = self.get_user_point_epoch(addr)
+        for i in range(128):
+            if _min >= _max:
+                break
+            _mid = (_min + _max + 1) // 2
+            if self.get_user_point(addr, _mid).blk <= block:
+                _min = _mid
+            else:
+                _max = _mid - 1
+
+        upoint = self.get_user_point(addr, _min)
+
+        max_epoch = self.epoch
+        _epoch = self.find_block_epoch(block, max_epoch)
+        point_0 = self.get_point(_epoch)
+        if _epoch < max_epoch:
+            point_1 = self.get_point(_epoch + 1)
+            d_block = _sub(point_1.blk, point_0.blk)
+            d_t = _sub(point_1.ts, point_0.ts)
+        else:
+            d_block = _sub(current_block, point_0.blk)
+            d_t = _sub(current_timestamp, point_0.ts)
+        block_time = point_0.ts
+        if d_block != 0:
+            block_time += d_t * _sub(block, point_0.blk) // d_block
+
+        upoint.bias -= upoint.slope * _int128(_sub(block_time, upoint.ts))
+        return max(upoint.bias, 0)
+
+    def supply_at(self, point, t):
+        last_point = point.copy()
+        t_i = last_point.ts // WEEK * WEEK
+        for i in range(255):
+            t_i += WEEK
+            d_slope = 0
+            if t_i > t:
+                t_i = t
+            else:
+                d_slope = self.get_slope_change(t_i)
+            last_point.bias -= last_point.slope * _int128(_sub(t_i, last_point.ts))
+            if t_i == t:
+                break
+            last_point.slope += d_slope
+            last_point.ts = t_i
+
+        return max(last_point.bias, 0)
+
+    def totalSupply(self, t):
+        return self.supply_at(self.get_point(self.epoch), t)
+
+    def totalSupplyAt(self, block, current_timestamp, current_block):
+        """
+        Total voting power at `block`, when called in `current_block`.
+        """
+        if block > current_block:
+            raise Revert("")
+        _epoch = self.epoch
+        target_epoch = self.find_block_epoch(block, _epoch)
+
+        point = self.get_point(target_epoch)
+        dt = 0
+        if target_epoch < _epoch:
+            point_next = self.get_point(target_epoch + 1)
+            if point.blk != point_next.blk:
+                dt = (
+                    _sub(block, point.blk)
+                    * (point_next.ts - point.ts)
+                    // (point_next.blk - point.blk)
+                )
+        else:
+            if point.blk != current_block:
+                dt = (
+                    _sub(block, point.blk)
+                    * _sub(current_timestamp, point.ts)
+                    // _sub(current_block, point.blk)
+                )
+
+        return self.supply_at(point, point.ts + dt)
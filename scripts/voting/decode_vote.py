@@ -3,6 +3,8 @@ import warnings
 from brownie import Contract
 from hexbytes import HexBytes
 
+from .evm_script import decode_calls
+
 warnings.filterwarnings("ignore")
 
 # this script is used to decode an ownership vote - one originating
@@ -17,20 +19,12 @@ def main(vote_id=VOTE_ID):
 
     script = HexBytes(aragon.getVote(vote_id)["script"])
 
-    idx = 4
-    while idx < len(script):
-        target = Contract(script[idx : idx + 20])
-        idx += 20
-        length = int(script[idx : idx + 4].hex(), 16)
-        idx += 4
-        calldata = script[idx : idx + length]
-        idx += length
-        fn, inputs = target.decode_input(calldata)
-        if calldata[:4].hex() == "0xb61d27f6":
-            agent_target = Contract(inputs[0])
-            fn, inputs = agent_target.decode_input(inputs[2])
+    for call in decode_calls(script):
+        target = Contract(call["target"])
+        fn, inputs = target.decode_input(call["calldata"])
+        if call["agent"] is not None:
             print(
-                f"Call via agent ({target}):\n ├─ To: {agent_target}\n"
+                f"Call via agent ({Contract(call['agent'])}):\n ├─ To: {target}\n"
                 f" ├─ Function: {fn}\n └─ Inputs: {inputs}\n"
             )
         else:
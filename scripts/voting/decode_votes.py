@@ -0,0 +1,131 @@
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import Contract, web3
+from hexbytes import HexBytes
+
+from .evm_script import decode_calls
+
+warnings.filterwarnings("ignore")
+
+# this script is used to decode many ownership votes at once - ones originating
+# from 0xe478de485ad2fe566d49342cbd03e49ed7db3356
+#
+# vote IDs may be given as a range ("20-29"), a comma-separated list ("3,7,12") or both
+
+VOTING = "0xe478de485ad2fe566d49342cbd03e49ed7db3356"
+VOTE_IDS = "20-29"
+
+# decoded scripts are cached by hash, so unchanged votes are not decoded again
+CACHE_JSON = "decoded-votes-cache.json"
+OUTPUT_JSON = "decoded-votes.json"
+
+# number of concurrent RPC / explorer requests
+WORKERS = 8
+
+_contracts = {}
+
+
+def parse_vote_ids(vote_ids):
+    result = []
+    for item in str(vote_ids).split(","):
+        if "-" in item:
+            start, end = item.split("-")
+            result.extend(range(int(start), int(end) + 1))
+        else:
+            result.append(int(item))
+    return sorted(set(result))
+
+
+def _get_contract(address):
+    # ABI lookups are shared between all votes
+    address = web3.toChecksumAddress(address)
+    if address not in _contracts:
+        _contracts[address] = Contract(address)
+    return _contracts[address]
+
+
+def _resolve_all(executor, addresses):
+    # each unknown address is fetched by exactly one worker
+    addresses = set(web3.toChecksumAddress(i) for i in addresses)
+    list(executor.map(_get_contract, [i for i in addresses if i not in _contracts]))
+
+
+def _decode_calls(executor, script):
+    calls = decode_calls(script)
+    _resolve_all(executor, [i["target"] for i in calls])
+
+    decoded = []
+    for call in calls:
+        fn, inputs = _get_contract(call["target"]).decode_input(call["calldata"])
+        agent = web3.toChecksumAddress(call["agent"]) if call["agent"] else None
+        decoded.append(
+            {
+                "agent": agent,
+                "target": web3.toChecksumAddress(call["target"]),
+                "function": fn,
+                "inputs": inputs,
+            }
+        )
+
+    return decoded
+
+
+def _to_json(value):
+    if isinstance(value, dict):
+        return {k: _to_json(v) for k, v in value.items()}
+    if isinstance(value, bytes):
+        return HexBytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(i) for i in value]
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def decode_votes(vote_ids, cache_json=CACHE_JSON):
+    try:
+        with open(cache_json) as fp:
+            cache = json.load(fp)
+    except FileNotFoundError:
+        cache = {}
+
+    aragon = Contract(VOTING)
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        votes = dict(zip(vote_ids, executor.map(aragon.getVote, vote_ids)))
+
+        result = {}
+        for vote_id, vote in votes.items():
+            script = HexBytes(vote["script"])
+            script_hash = web3.keccak(script).hex()
+            if script_hash not in cache:
+                cache[script_hash] = _to_json(_decode_calls(executor, script))
+            result[vote_id] = {
+                "script_hash": script_hash,
+                "executed": vote["executed"],
+                "yea": str(vote["yea"]),
+                "nay": str(vote["nay"]),
+                "voting_power": str(vote["votingPower"]),
+                "calls": cache[script_hash],
+            }
+
+    with open(cache_json, "w") as fp:
+        json.dump(cache, fp, indent=2)
+
+    return result
+
+
+def main(vote_ids=VOTE_IDS, output_json=OUTPUT_JSON):
+    vote_ids = parse_vote_ids(vote_ids)
+    result = decode_votes(vote_ids)
+
+    with open(output_json, "w") as fp:
+        json.dump(result, fp, indent=2)
+
+    for vote_id, vote in result.items():
+        print(f"Vote {vote_id}: {len(vote['calls'])} calls")
+        for call in vote["calls"]:
+            via = f" (via agent {call['agent']})" if call["agent"] else ""
+            print(f" ├─ {call['target']}{via}: {call['function']}")
+    print(f"\nDecoded {len(result)} votes, saved to {output_json}")
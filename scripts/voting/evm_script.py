@@ -0,0 +1,228 @@
+"""
+Aragon EVM Script Codec
+=======================
+Encodes and decodes Aragon `CallsScript` (spec id 1) payloads without requiring
+`Contract` objects. Calls made via the Aragon agent's `execute` method, and votes
+created through a forwarder, are unwrapped into nested calls when decoding.
+
+Run `brownie run voting/evm_script benchmark` to time the codec.
+"""
+
+import time
+from functools import lru_cache
+
+from eth_utils import keccak
+
+try:
+    from eth_abi import decode as decode_abi
+    from eth_abi import encode as encode_abi
+except ImportError:
+    from eth_abi import decode_abi, encode_abi
+
+SPEC_ID = b"\x00\x00\x00\x01"
+
+AGENT_EXECUTE_SIGNATURE = "execute(address,uint256,bytes)"
+NEW_VOTE_SIGNATURE = "newVote(bytes,string,bool,bool)"
+
+
+@lru_cache(maxsize=None)
+def selector(signature):
+    """
+    Return the 4 byte function selector for a signature, e.g. `transfer(address,uint256)`.
+    """
+    return keccak(text=signature.replace(" ", ""))[:4]
+
+
+@lru_cache(maxsize=None)
+def _signature_types(signature):
+    # split the argument types of a signature, respecting nested tuples
+    args = signature[signature.index("(") + 1 : signature.rindex(")")]
+    types = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(args):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            types.append(args[start:i].strip())
+            start = i + 1
+    if args.strip():
+        types.append(args[start:].strip())
+    return tuple(types)
+
+
+def encode_call(signature, *args):
+    """
+    ABI encode a call to `signature` with the given arguments.
+    """
+    return selector(signature) + encode_abi(_signature_types(signature), args)
+
+
+def decode_call(signature, calldata):
+    """
+    Decode calldata for a known signature, returning a tuple of the arguments.
+    """
+    if bytes(calldata[:4]) != selector(signature):
+        raise ValueError(f"Calldata does not match selector for '{signature}'")
+    return tuple(decode_abi(_signature_types(signature), bytes(calldata[4:])))
+
+
+def _to_bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def _to_address_bytes(address):
+    address = _to_bytes(address)
+    if len(address) != 20:
+        raise ValueError(f"Invalid address length: {len(address)}")
+    return address
+
+
+def encode_script(calls):
+    """
+    Encode a list of `(target, calldata)` into a spec id 1 `CallsScript`.
+    """
+    parts = [SPEC_ID]
+    for target, calldata in calls:
+        parts.append(_to_address_bytes(target))
+        calldata = _to_bytes(calldata)
+        parts.append(len(calldata).to_bytes(4, "big"))
+        parts.append(calldata)
+    return b"".join(parts)
+
+
+def decode_script(script):
+    """
+    Decode a spec id 1 `CallsScript` into a list of `(target, calldata)`.
+
+    Targets are returned as lowercase hex strings, calldata as `bytes`.
+    """
+    view = memoryview(_to_bytes(script))
+    if view[:4] != SPEC_ID:
+        raise ValueError(f"Unsupported EVM script spec id: 0x{bytes(view[:4]).hex()}")
+
+    calls = []
+    idx = 4
+    end = len(view)
+    while idx < end:
+        if idx + 24 > end:
+            raise ValueError("EVM script is truncated")
+        target = "0x" + view[idx : idx + 20].hex()
+        length = int.from_bytes(view[idx + 20 : idx + 24], "big")
+        idx += 24
+        if idx + length > end:
+            raise ValueError("EVM script is truncated")
+        calls.append((target, view[idx : idx + length].tobytes()))
+        idx += length
+    return calls
+
+
+def encode_agent_call(target, calldata, value=0):
+    """
+    Encode calldata for the agent's `execute(address,uint256,bytes)` method.
+    """
+    calldata = _to_bytes(calldata)
+    padding = -len(calldata) % 32
+    return b"".join(
+        [
+            selector(AGENT_EXECUTE_SIGNATURE),
+            bytes(12),
+            _to_address_bytes(target),
+            value.to_bytes(32, "big"),
+            (96).to_bytes(32, "big"),
+            len(calldata).to_bytes(32, "big"),
+            calldata,
+            bytes(padding),
+        ]
+    )
+
+
+def decode_agent_call(calldata):
+    """
+    Decode calldata for the agent's `execute` method into `(target, value, calldata)`.
+
+    Returns `None` if the calldata is not an `execute` call.
+    """
+    view = memoryview(_to_bytes(calldata))
+    if len(view) < 132 or view[:4] != selector(AGENT_EXECUTE_SIGNATURE):
+        return None
+
+    target = "0x" + view[16:36].hex()
+    value = int.from_bytes(view[36:68], "big")
+    offset = 4 + int.from_bytes(view[68:100], "big")
+    length = int.from_bytes(view[offset : offset + 32], "big")
+    return target, value, view[offset + 32 : offset + 32 + length].tobytes()
+
+
+def encode_agent_script(agent, actions):
+    """
+    Encode a script where each `(target, calldata)` in `actions` is executed via `agent`.
+    """
+    return encode_script([(agent, encode_agent_call(target, data)) for target, data in actions])
+
+
+def wrap_forwarder(voting, script, metadata=""):
+    """
+    Wrap `script` in a second script that creates a new vote on `voting`.
+
+    The result is passed to a forwarder's `forward` method, as required by the emergency DAO.
+    """
+    calldata = encode_call(NEW_VOTE_SIGNATURE, _to_bytes(script), metadata, False, False)
+    return encode_script([(voting, calldata)])
+
+
+def decode_calls(script):
+    """
+    Decode a script into a list of dicts, unwrapping agent and forwarded vote calls.
+
+    Each dict has the keys `target`, `calldata`, `agent` (the agent address for
+    calls made via `execute`, otherwise `None`) and `value`. Calls to `newVote`
+    additionally include the decoded inner script under `script`.
+    """
+    result = []
+    new_vote = selector(NEW_VOTE_SIGNATURE)
+    for target, calldata in decode_script(script):
+        call = {"target": target, "calldata": calldata, "agent": None, "value": 0}
+        agent_call = decode_agent_call(calldata)
+        if agent_call is not None:
+            call["agent"] = target
+            call["target"], call["value"], call["calldata"] = agent_call
+        elif calldata[:4] == new_vote:
+            inner_script = decode_call(NEW_VOTE_SIGNATURE, calldata)[0]
+            call["script"] = decode_calls(inner_script)
+        result.append(call)
+    return result
+
+
+def benchmark(action_count=500, iterations=100):
+    """
+    Time encoding and decoding of an agent script with `action_count` actions.
+    """
+    action_count = int(action_count)
+    agent = "0x40907540d8a6c65c637785e8f8b742ae6b0b9968"
+    target = "0x2f50d538606fa9edd2b11e2446beb18c9d5846bb"
+    calldata = encode_call("add_gauge(address,int128,uint256)", target, 0, 10 ** 18)
+    actions = [(target, calldata)] * action_count
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        script = encode_agent_script(agent, actions)
+    encode_time = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        decode_calls(script)
+    decode_time = (time.perf_counter() - start) / iterations
+
+    print(
+        f"{action_count} actions, {len(script)} bytes:\n"
+        f"  encode: {encode_time * 10 ** 6:,.0f}us ({encode_time * 10 ** 6 / action_count:.2f}us "
+        f"per action)\n"
+        f"  decode: {decode_time * 10 ** 6:,.0f}us ({decode_time * 10 ** 6 / action_count:.2f}us "
+        f"per action)"
+    )
+    return encode_time, decode_time
@@ -5,6 +5,8 @@ import requests
 from brownie import Contract, accounts, chain
 from brownie.convert import to_address
 
+from .evm_script import encode_agent_script, encode_call, wrap_forwarder
+
 warnings.filterwarnings("ignore")
 
 # this script is used to prepare, simulate and broadcast votes within Curve's DAO
@@ -49,6 +51,9 @@ SENDER = accounts.at("0x9B44473E223f8a3c047AD86f387B80402536B029", force=True)
 # use the following:
 # [("0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB", "add_gauge", "0xFA712...", 0, 0),]
 #
+# the function may also be given as a full signature, e.g. "add_gauge(address,int128,uint256)",
+# in which case the calldata is encoded without fetching the contract ABI
+#
 # commonly used addresses:
 # GaugeController - 0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB
 # GaugeProxy - 0x519AFB566c05E00cfB9af73496D00217A630e4D5
@@ -63,37 +68,44 @@ ACTIONS = [
 DESCRIPTION = "A description of the vote."
 
 
-def prepare_evm_script():
-    agent = Contract(TARGET["agent"])
-    evm_script = "0x00000001"
+def prepare_evm_script(actions=None, target=None):
+    if actions is None:
+        actions = ACTIONS
+    if target is None:
+        target = TARGET
 
-    for address, fn_name, *args in ACTIONS:
-        contract = Contract(address)
-        fn = getattr(contract, fn_name)
-        calldata = fn.encode_input(*args)
-        agent_calldata = agent.execute.encode_input(address, 0, calldata)[2:]
-        length = hex(len(agent_calldata) // 2)[2:].zfill(8)
-        evm_script = f"{evm_script}{agent.address[2:]}{length}{agent_calldata}"
+    calls = []
+    for address, fn_name, *args in actions:
+        if "(" in fn_name:
+            calldata = encode_call(fn_name, *args)
+        else:
+            fn = getattr(Contract(address), fn_name)
+            calldata = bytes.fromhex(fn.encode_input(*args)[2:])
+        calls.append((address, calldata))
 
-    return evm_script
+    return "0x" + encode_agent_script(target["agent"], calls).hex()
 
 
-def make_vote(sender=SENDER):
-    text = json.dumps({"text": DESCRIPTION})
-    response = requests.post("https://ipfs.infura.io:5001/api/v0/add", files={"file": text})
-    ipfs_hash = response.json()["Hash"]
-    print(f"ipfs hash: {ipfs_hash}")
+def make_vote(sender=SENDER, actions=None, target=None, pin_description=True):
+    if target is None:
+        target = TARGET
 
-    aragon = Contract(TARGET["voting"])
-    evm_script = prepare_evm_script()
-    if TARGET.get("forwarder"):
+    if pin_description:
+        text = json.dumps({"text": DESCRIPTION})
+        response = requests.post("https://ipfs.infura.io:5001/api/v0/add", files={"file": text})
+        ipfs_hash = response.json()["Hash"]
+        print(f"ipfs hash: {ipfs_hash}")
+    else:
+        ipfs_hash = None
+
+    aragon = Contract(target["voting"])
+    evm_script = prepare_evm_script(actions, target)
+    if target.get("forwarder"):
         # the emergency DAO only allows new votes via a forwarder contract
         # so we have to wrap the call in another layer of evm script
-        vote_calldata = aragon.newVote.encode_input(evm_script, DESCRIPTION, False, False)[2:]
-        length = hex(len(vote_calldata) // 2)[2:].zfill(8)
-        evm_script = f"0x00000001{aragon.address[2:]}{length}{vote_calldata}"
-        print(f"Target: {TARGET['forwarder']}\nEVM script: {evm_script}")
-        tx = Contract(TARGET["forwarder"]).forward(evm_script, {"from": sender})
+        evm_script = "0x" + wrap_forwarder(aragon.address, evm_script, DESCRIPTION).hex()
+        print(f"Target: {target['forwarder']}\nEVM script: {evm_script}")
+        tx = Contract(target["forwarder"]).forward(evm_script, {"from": sender})
     else:
         print(f"Target: {aragon.address}\nEVM script: {evm_script}")
         tx = aragon.newVote(evm_script, f"ipfs:{ipfs_hash}", False, False, {"from": sender})
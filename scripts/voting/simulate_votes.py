@@ -0,0 +1,145 @@
+import json
+import warnings
+
+from brownie import Contract, chain, history
+from brownie.convert import to_address
+
+from .new_vote import TARGET, make_vote
+
+warnings.filterwarnings("ignore")
+
+# this script simulates many candidate votes against a forked mainnet. the chain is
+# snapshotted once, and every proposal is created, voted on, executed and then reverted.
+# use it to compare alternative `ACTIONS` lists before broadcasting one of them with
+# `new_vote.make_vote`.
+
+# proposals to simulate, as {name: actions} - actions use the same format as in `new_vote`
+PROPOSALS = {
+    # "name": [("target", "fn_name", *args), ...],
+}
+
+# JSON list of addresses considered when selecting voters, used by `local_holders`
+HOLDERS_JSON = "vote-holders.json"
+
+REPORT_JSON = "vote-simulations.json"
+
+GAUGE_CONTROLLER = "0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB"
+GAUGE_PROXY = "0x519AFB566c05E00cfB9af73496D00217A630e4D5"
+POOL_PROXY = "0xeCb456EA5365865EbAb8a2661B0c503410e9B347"
+
+
+def local_holders(target, holders_json=HOLDERS_JSON):
+    """
+    Default voting weight provider.
+
+    Reads candidate addresses from `holders_json` and weights them by their balance of
+    the voting token on the local chain, at the current block. Returns a list of
+    `(address, percent of supply)` sorted by weight, largest first.
+    """
+    with open(holders_json) as fp:
+        addresses = [to_address(i) for i in json.load(fp)]
+
+    token = Contract(target["token"])
+    total_supply = token.totalSupply()
+    weights = [(i, token.balanceOf(i) * 100 / total_supply) for i in addresses]
+    return sorted(weights, key=lambda k: k[1], reverse=True)
+
+
+def _select_voters(holders, quorum):
+    # take the largest holders until there is enough weight to pass the vote
+    voters = []
+    weight = 0
+    for address, share in holders:
+        if weight >= quorum + 5:
+            break
+        voters.append(address)
+        weight += share
+
+    if weight < quorum + 5:
+        raise ValueError(f"Voter weight of {weight:.2f}% is insufficient for quorum of {quorum}%")
+    return voters
+
+
+def _read_state():
+    # read the DAO-owned state that votes are expected to modify
+    controller = Contract(GAUGE_CONTROLLER)
+    state = {"GaugeController.admin": controller.admin()}
+
+    for i in range(controller.n_gauge_types()):
+        name = controller.gauge_type_names(i)
+        state[f"GaugeController.type_weight[{name}]"] = controller.get_type_weight(i)
+    for i in range(controller.n_gauges()):
+        gauge = controller.gauges(i)
+        state[f"GaugeController.gauge_type[{gauge}]"] = controller.gauge_types(gauge)
+        state[f"GaugeController.gauge_weight[{gauge}]"] = controller.get_gauge_weight(gauge)
+
+    for name, address in [("PoolProxy", POOL_PROXY), ("GaugeProxy", GAUGE_PROXY)]:
+        proxy = Contract(address)
+        for attr in ("ownership_admin", "emergency_admin", "parameter_admin"):
+            if hasattr(proxy, attr):
+                state[f"{name}.{attr}"] = getattr(proxy, attr)()
+    if hasattr(Contract(POOL_PROXY), "burner_kill"):
+        state["PoolProxy.burner_kill"] = Contract(POOL_PROXY).burner_kill()
+
+    return state
+
+
+def _diff(before, after):
+    keys = sorted(set(before) | set(after))
+    return {
+        k: {"before": str(before.get(k)), "after": str(after.get(k))}
+        for k in keys
+        if before.get(k) != after.get(k)
+    }
+
+
+def simulate_proposal(actions, target, voters):
+    start = len(history)
+    before = _read_state()
+
+    vote_id = make_vote(voters[0], actions, target, pin_description=False)
+    aragon = Contract(target["voting"])
+    for acct in voters:
+        aragon.vote(vote_id, True, False, {"from": acct})
+
+    chain.sleep(86400 * 7)
+    tx = aragon.executeVote(vote_id, {"from": voters[0]})
+
+    return {
+        "vote_id": vote_id,
+        "execute_gas": tx.gas_used,
+        "total_gas": sum(i.gas_used for i in history[start:]),
+        "state_diff": _diff(before, _read_state()),
+    }
+
+
+def main(proposals=PROPOSALS, target=TARGET, holder_provider=local_holders):
+    voters = _select_voters(holder_provider(target), target["quorum"])
+
+    # every proposal starts from the same snapshot
+    chain.snapshot()
+    results = {}
+    for name, actions in proposals.items():
+        try:
+            results[name] = simulate_proposal(actions, target, voters)
+        except Exception as e:
+            results[name] = {"error": repr(e)}
+        finally:
+            chain.revert()
+
+    with open(REPORT_JSON, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name}: FAILED - {result['error']}")
+            continue
+        print(
+            f"{name}: executeVote gas {result['execute_gas']:,}, "
+            f"total gas {result['total_gas']:,}, {len(result['state_diff'])} state changes"
+        )
+        for key, value in result["state_diff"].items():
+            print(f"  {key}: {value['before']} -> {value['after']}")
+
+    print(f"\nResults saved to {REPORT_JSON}")
+    return results
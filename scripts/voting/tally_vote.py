@@ -0,0 +1,216 @@
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import Contract, chain
+from brownie.convert import to_address
+
+warnings.filterwarnings("ignore")
+
+# this script tallies a DAO vote offline, at the vote's snapshot block
+#
+# voting power for every voter is calculated in a single pass using a python port of
+# `VotingEscrow.balanceOfAt`, instead of querying `balanceOfAt` once per voter. only
+# the point histories are fetched from the chain, concurrently. the result uses the
+# same integer math as Aragon, so `support` and `quorum` match what the vote will see.
+
+VOTING = "0xe478de485ad2fe566d49342cbd03e49ed7db3356"
+VOTE_ID = 0
+
+# JSON file of voters - either {address: true (yea) / false (nay)}, or a list of
+# addresses which are all assumed to vote yea
+VOTERS_JSON = "vote-voters.json"
+OUTPUT_JSON = "vote-tally.json"
+
+# number of concurrent RPC requests
+WORKERS = 8
+
+# Aragon stores percentages with 18 decimals
+PCT_BASE = 10 ** 18
+
+EMPTY_POINT = (0, 0, 0, 0)
+
+
+def block_epoch(get_point, block, max_epoch):
+    """
+    Port of `VotingEscrow.find_block_epoch`. `get_point(i)` returns `point_history(i)`.
+    """
+    _min = 0
+    _max = max_epoch
+    while _min < _max:
+        _mid = (_min + _max + 1) // 2
+        if get_point(_mid)[3] <= block:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+def block_time(point_0, point_1, block):
+    """
+    Estimate the timestamp of `block` in the same way as `VotingEscrow.balanceOfAt`.
+
+    `point_0` is the global point at the epoch returned by `block_epoch`, `point_1` is
+    the following point - or the current `(ts, blk)` when `point_0` is the latest epoch.
+    """
+    d_block = point_1[3] - point_0[3]
+    d_t = point_1[2] - point_0[2]
+    if d_block == 0:
+        return point_0[2]
+    return point_0[2] + d_t * (block - point_0[3]) // d_block
+
+
+def balance_at(user_points, block, timestamp):
+    """
+    Port of the user part of `VotingEscrow.balanceOfAt`.
+
+    `user_points` is the user's point history, including the empty point at index 0.
+    `timestamp` is the estimated time of `block`, as returned by `block_time`.
+    """
+    _min = 0
+    _max = len(user_points) - 1
+    while _min < _max:
+        _mid = (_min + _max + 1) // 2
+        if user_points[_mid][3] <= block:
+            _min = _mid
+        else:
+            _max = _mid - 1
+
+    bias, slope, ts, _ = user_points[_min]
+    # int128 math in the contract, `block_time - ts` is converted before multiplying
+    bias -= slope * (timestamp - ts)
+    return max(bias, 0)
+
+
+def is_value_pct(value, total, pct):
+    """
+    Port of `Voting._isValuePct`.
+    """
+    if total == 0:
+        return False
+    return value * PCT_BASE // total > pct
+
+
+def _pct(value, total):
+    return value * PCT_BASE // total if total else 0
+
+
+def fetch_point_histories(voting_escrow, voters, executor):
+    """
+    Fetch the full point history of each address in `voters`.
+
+    Returns a dict of {address: [point, ...]}, where index 0 is always the empty point.
+    """
+    epochs = list(executor.map(voting_escrow.user_point_epoch, voters))
+    requests = [(addr, i) for addr, epoch in zip(voters, epochs) for i in range(1, epoch + 1)]
+    points = executor.map(lambda k: tuple(voting_escrow.user_point_history(*k)), requests)
+
+    histories = {addr: [EMPTY_POINT] for addr in voters}
+    for (addr, _), point in zip(requests, points):
+        histories[addr].append(point)
+    return histories
+
+
+def snapshot_time(voting_escrow, block):
+    """
+    Estimate the timestamp of `block`, as used by `VotingEscrow.balanceOfAt`.
+    """
+    head = chain[-1]
+    if block > head.number:
+        raise ValueError(f"Block {block} is in the future")
+
+    cache = {}
+
+    def get_point(i):
+        if i not in cache:
+            cache[i] = tuple(voting_escrow.point_history(i))
+        return cache[i]
+
+    max_epoch = voting_escrow.epoch()
+    epoch = block_epoch(get_point, block, max_epoch)
+    if epoch < max_epoch:
+        point_1 = get_point(epoch + 1)
+    else:
+        point_1 = (0, 0, head.timestamp, head.number)
+    return block_time(get_point(epoch), point_1, block)
+
+
+def voting_powers(voting_escrow, voters, block):
+    """
+    Calculate the voting power of each address in `voters` at `block`.
+
+    Equivalent to calling `voting_escrow.balanceOfAt(voter, block)` for every voter.
+    """
+    voters = [to_address(i) for i in voters]
+    timestamp = snapshot_time(voting_escrow, block)
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        histories = fetch_point_histories(voting_escrow, voters, executor)
+
+    return {addr: balance_at(histories[addr], block, timestamp) for addr in voters}
+
+
+def tally(vote, powers, choices):
+    """
+    Tally `powers` ({address: voting power}) according to `choices` ({address: bool}).
+
+    `vote` is the result of `Voting.getVote`. Percentages are returned with 18 decimals,
+    and the vote passes under the same conditions as `Voting.canExecute`.
+    """
+    yea = sum(powers[addr] for addr, support in choices.items() if support)
+    nay = sum(powers[addr] for addr, support in choices.items() if not support)
+    voting_power = vote["votingPower"]
+
+    return {
+        "snapshot_block": vote["snapshotBlock"],
+        "voters": len(choices),
+        "yea": yea,
+        "nay": nay,
+        "voting_power": voting_power,
+        "support": _pct(yea, yea + nay),
+        "quorum": _pct(yea, voting_power),
+        "support_required": vote["supportRequired"],
+        "min_accept_quorum": vote["minAcceptQuorum"],
+        "passes": is_value_pct(yea, yea + nay, vote["supportRequired"])
+        and is_value_pct(yea, voting_power, vote["minAcceptQuorum"]),
+    }
+
+
+def load_voters(voters_json=VOTERS_JSON):
+    with open(voters_json) as fp:
+        voters = json.load(fp)
+    if isinstance(voters, list):
+        return {to_address(i): True for i in voters}
+    return {to_address(k): bool(v) for k, v in voters.items()}
+
+
+def main(vote_id=VOTE_ID, voting=VOTING, voters_json=VOTERS_JSON, output_json=OUTPUT_JSON):
+    aragon = Contract(voting)
+    voting_escrow = Contract(aragon.token())
+    vote = aragon.getVote(vote_id)
+    choices = load_voters(voters_json)
+
+    powers = voting_powers(voting_escrow, list(choices), vote["snapshotBlock"])
+    result = tally(vote, powers, choices)
+
+    with open(output_json, "w") as fp:
+        json.dump(
+            {
+                "vote_id": int(vote_id),
+                **{k: v if isinstance(v, bool) else str(v) for k, v in result.items()},
+                "powers": {k: str(v) for k, v in powers.items()},
+            },
+            fp,
+            indent=2,
+        )
+
+    print(
+        f"Vote {vote_id} at block {result['snapshot_block']}, {result['voters']} voters:\n"
+        f"  yea: {result['yea'] / 10 ** 18:,.2f}, nay: {result['nay'] / 10 ** 18:,.2f}\n"
+        f"  support: {result['support'] * 100 / PCT_BASE:.2f}% "
+        f"(required > {result['support_required'] * 100 / PCT_BASE:.2f}%)\n"
+        f"  quorum: {result['quorum'] * 100 / PCT_BASE:.2f}% "
+        f"(required > {result['min_accept_quorum'] * 100 / PCT_BASE:.2f}%)\n"
+        f"  {'PASSES' if result['passes'] else 'FAILS'}"
+    )
+    print(f"\nTally saved to {output_json}")
+    return result
@@ -0,0 +1,136 @@
+import hashlib
+import inspect
+import json
+import warnings
+from pathlib import Path
+
+from brownie import accounts, chain, project, web3
+from brownie.network.contract import ProjectContract
+
+# chain states saved after expensive fixture setups
+CACHE_PATH = Path(__file__).parent.parent.joinpath(".chain-cache")
+
+
+class ChainStateCache:
+    """
+    Saves the local chain state after an expensive setup, and restores it on later runs
+    instead of replaying every transaction.
+
+    States are keyed by the setup function's source, the bytecode and address of each
+    contract it depends on, the bytecode of each contract type it deploys, any additional
+    parameters and the keys of earlier cached setups that it builds upon. Saving and
+    restoring requires anvil (`--network anvil`), which supports `anvil_dumpState` and
+    `anvil_loadState`. With any other client, including the default ganache-cli, the
+    setup is always executed and a warning is raised so that the missing cache does not
+    go unnoticed.
+    """
+
+    def __init__(self, path=CACHE_PATH, enabled=True):
+        self.path = Path(path)
+        self.enabled = enabled
+        self._supported = None
+        self.keys = {}
+
+    def is_supported(self):
+        if self._supported is None:
+            response = web3.provider.make_request("anvil_nodeInfo", [])
+            self._supported = "result" in response
+        return self._supported
+
+    def key(self, name, setup, contracts, deploys, params, after):
+        data = [name, inspect.getsource(setup), repr(params)] + [self.keys[i] for i in after]
+        for contract in contracts:
+            data += [contract.address, web3.eth.get_code(contract.address).hex()]
+        for container in deploys:
+            data += [container._name, container.bytecode]
+        return hashlib.sha256(json.dumps(data).encode()).hexdigest()[:24]
+
+    def run(self, name, setup, contracts=(), deploys=(), params=None, after=()):
+        """
+        Execute `setup()`, or restore the chain state from a previous run.
+
+        Arguments
+        ---------
+        name : str
+            Name used to identify the cached state.
+        setup : callable
+            Function performing the setup. May return contracts, accounts, or lists
+            and dicts containing them, which are restored along with the state.
+        contracts : list
+            Contracts used by the setup. Their address and bytecode form part of the key.
+        deploys : list
+            Contract containers deployed by the setup. Their bytecode forms part of the
+            key, so that the cached state is discarded when their source changes.
+        params : Any
+            Additional parameters that the setup depends on, e.g. module constants.
+        after : list
+            Names of cached setups that must run before this one. Restoring a state
+            also restores everything these setups did, so their keys form part of the key.
+        """
+        if not self.enabled:
+            return setup()
+        if not self.is_supported():
+            warnings.warn(
+                f"Chain state for '{name}' is not cached: {web3.clientVersion} does not support "
+                "`anvil_dumpState`, so the setup runs in full. Use `--network anvil` to cache "
+                "it, or `--no-chain-cache` to silence this warning.",
+                stacklevel=2,
+            )
+            return setup()
+
+        self.keys[name] = self.key(name, setup, contracts, deploys, params, after)
+        cache_file = self.path.joinpath(f"{name}-{self.keys[name]}.json")
+        if cache_file.exists():
+            with cache_file.open() as fp:
+                return self._restore(json.load(fp))
+
+        account_count = len(accounts)
+        result = setup()
+
+        state = web3.provider.make_request("anvil_dumpState", [])["result"]
+        self.path.mkdir(exist_ok=True)
+        with cache_file.open("w") as fp:
+            json.dump(
+                {
+                    "state": state,
+                    "time": chain.time(),
+                    "accounts": [i.private_key for i in list(accounts)[account_count:]],
+                    "result": _encode(result),
+                },
+                fp,
+            )
+        return result
+
+    def _restore(self, data):
+        web3.provider.make_request("anvil_loadState", [data["state"]])
+        for private_key in data["accounts"]:
+            accounts.add(private_key)
+        if data["time"] > chain.time():
+            chain.sleep(data["time"] - chain.time())
+        chain.mine()
+        return _decode(data["result"])
+
+
+def _encode(value):
+    if isinstance(value, ProjectContract):
+        return {"_contract": value._name, "address": value.address}
+    if hasattr(value, "address") and hasattr(value, "balance"):
+        return {"_account": value.address}
+    if isinstance(value, (list, tuple)):
+        return [_encode(i) for i in value]
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    return value
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return [_decode(i) for i in value]
+    if isinstance(value, dict):
+        if "_contract" in value:
+            container = project.get_loaded_projects()[0][value["_contract"]]
+            return container.at(value["address"])
+        if "_account" in value:
+            return accounts.at(value["_account"])
+        return {k: _decode(v) for k, v in value.items()}
+    return value
@@ -10,12 +10,47 @@ from brownie import (
     YBurner,
 )
 
+from tests.chain_cache import ChainStateCache
+from tests.gas_profile import GasProfiler
+from tests.scheduling import DurationRecorder, DurationScheduling
+
 YEAR = 365 * 86400
 INITIAL_RATE = 274_815_283
 YEAR_1_SUPPLY = INITIAL_RATE * 10 ** 18 // YEAR * YEAR
 INITIAL_SUPPLY = 1_303_030_303
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-chain-cache",
+        action="store_true",
+        help="Always run expensive fixture setups instead of restoring cached chain states",
+    )
+    parser.addoption(
+        "--record-fork-state",
+        action="store_true",
+        help="Record the mainnet state used by the fork tests, when forking with anvil",
+    )
+    parser.addoption(
+        "--gas-profile",
+        metavar="PATH",
+        help="Write a gas report by contract function to PATH, and an HTML version beside it",
+    )
+
+
+def pytest_configure(config):
+    # durations are recorded by the xdist controller, or the only process in a serial run
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(), "test-durations")
+    if config.getoption("--gas-profile"):
+        config.pluginmanager.register(GasProfiler(config.getoption("--gas-profile")), "gas-profile")
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    return DurationScheduling(config, log)
+
+
 def approx(a, b, precision=1e-10):
     if a == b == 0:
         return True
@@ -33,6 +68,11 @@ def isolation_setup(fn_isolation):
     pass
 
 
+@pytest.fixture(scope="session")
+def chain_cache(request):
+    yield ChainStateCache(enabled=not request.config.getoption("--no-chain-cache"))
+
+
 # helper functions as fixtures
 
 
@@ -18,6 +18,8 @@ from brownie import (
     history,
 )
 
+from scripts.address_list import encode_addresses
+
 BURNERS = {
     LPBurner: ["0x075b1bb99792c9E1041bA13afEf80C91a1e70fB3"],  # sbtcCRV
     BTCBurner: [
@@ -155,11 +157,8 @@ def test_fee_distribution():
         "0x0f9cb53Ebe405d49A0bbdBD291A65Ff571bC83e1", usdn_burner, True, {"from": alice}
     )
 
-    # withdraw pool fees to pool proxy
-    proxy.withdraw_many(pool_list[:20], {"from": alice})
-    proxy.withdraw_many(
-        pool_list[20:] + [ZERO_ADDRESS] * (20 - len(pool_list[20:])), {"from": alice}
-    )
+    # withdraw pool fees to pool proxy, in one call instead of two `withdraw_many` calls
+    proxy.withdraw_list(encode_addresses(pool_list), {"from": alice})
 
     # individually execute the burners for each coin
     for coin in coin_list + [lp_tripool]:
@@ -3,7 +3,10 @@ import requests
 from brownie import Contract
 from brownie.convert import to_address
 
-_holders = {}
+from tests.fork.fork_state import ForkState
+
+_fork_state = ForkState()
+_holders = _fork_state.holders
 
 
 class _MintableTestToken(Contract):
@@ -12,7 +15,7 @@ class _MintableTestToken(Contract):
 
         # get top token holder addresses
         address = self.address
-        if address not in _holders:
+        if address not in _holders and _fork_state.mode != "replay":
             holders = requests.get(
                 f"https://api.ethplorer.io/getTopTokenHolders/{address}",
                 params={"apiKey": "freekey", "limit": 50},
@@ -33,8 +36,10 @@ class _MintableTestToken(Contract):
             self.changeMaxSupply(2 ** 128, {"from": self.owner()})
             self.mint(target, amount, {"from": self.minter()})
             return
+        if _fork_state.can_write_storage and _fork_state.mint(self, target, amount):
+            return
 
-        for address in _holders[self.address].copy():
+        for address in _fork_state.holders_of(self).copy():
             if address == self.address:
                 # don't claim from the treasury - that could cause wierdness
                 continue
@@ -50,6 +55,21 @@ class _MintableTestToken(Contract):
         raise ValueError(f"Insufficient tokens available to mint {self.name()}")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fork_state(request):
+    _fork_state.start(record=request.config.getoption("--record-fork-state"))
+    yield _fork_state
+    if _fork_state.mode == "record":
+        _fork_state.save()
+
+
+@pytest.fixture(autouse=True)
+def record_fork_state(fork_state):
+    yield
+    if fork_state.mode == "record":
+        fork_state.collect()
+
+
 @pytest.fixture(scope="session")
 def MintableTestToken():
     yield _MintableTestToken
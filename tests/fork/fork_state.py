@@ -0,0 +1,227 @@
+import gzip
+import json
+from pathlib import Path
+
+from brownie import Contract, chain, web3
+from brownie.convert import to_address
+from brownie.network.state import _contract_map
+
+# mainnet state touched by the fork tests, recorded for offline replay
+STATE_PATH = Path(__file__).parent.parent.parent.joinpath(".fork-state.json")
+
+# number of storage indexes searched for a token's balance mapping
+MAX_BALANCE_INDEX = 32
+
+
+def _rpc(method, params):
+    response = web3.provider.make_request(method, params)
+    if "error" in response:
+        raise ValueError(f"{method}: {response['error']}")
+    return response["result"]
+
+
+def _balance_key(account, index, layout):
+    # solidity hashes the key before the slot index, vyper the other way around
+    account = bytes.fromhex(account[2:].rjust(64, "0"))
+    index = index.to_bytes(32, "big")
+    if layout == "solidity":
+        return "0x" + bytes(web3.keccak(account + index)).hex()
+    return "0x" + bytes(web3.keccak(index + account)).hex()
+
+
+def _to_word(value):
+    return f"0x{value:064x}"
+
+
+class ForkState:
+    """
+    Records the mainnet state used by the fork tests, and replays it on a local chain.
+
+    Recording happens on an anvil node forked from mainnet, when `start` is called with
+    `record=True`. After every test, the accounts and storage slots that were loaded
+    from the fork are collected, and at the end of the session their values at the fork
+    block are merged into `path` along with the token holder lists. Recordings from
+    different fork blocks cannot be merged.
+
+    Replay happens on a non-forked anvil node when `path` exists. The recorded code,
+    balances, nonces and storage are written into the local chain before any test
+    runs, and the ABIs of every recorded `Contract` are stored in brownie's local
+    database, so the fork tests run without network access.
+
+    On an anvil fork without recording, tokens are minted by writing to their balance
+    slot. On any other client tokens are sourced from mainnet holders.
+    """
+
+    def __init__(self, path=STATE_PATH):
+        self.path = Path(path)
+        self.mode = None
+        self.holders = {}
+        self.balance_slots = {}
+        self._fork_block = None
+        self._recorded = None
+        self._touched = {}
+
+    def start(self, record=False):
+        response = web3.provider.make_request("anvil_nodeInfo", [])
+        if "result" not in response:
+            return
+
+        fork_config = response["result"].get("forkConfig") or {}
+        if fork_config.get("forkUrl"):
+            self.mode = "fork"
+            if record:
+                self.mode = "record"
+                self._fork_block = hex(fork_config["forkBlockNumber"])
+                if self.path.exists():
+                    self._load_recorded()
+        elif self.path.exists():
+            self.mode = "replay"
+            self._load()
+
+    @property
+    def can_write_storage(self):
+        return self.mode is not None
+
+    def holders_of(self, token):
+        """
+        Return the recorded holders of `token`. Raises if nothing was recorded for it.
+        """
+        try:
+            return self.holders[token.address]
+        except KeyError:
+            raise ValueError(
+                f"No holders of {token.address} were recorded in {self.path.name} - "
+                "record the fork state again with `--record-fork-state`"
+            ) from None
+
+    def _load_recorded(self):
+        # keep the state recorded by earlier sessions, which must share the fork block
+        with self.path.open() as fp:
+            self._recorded = json.load(fp)
+
+        if self._recorded["block"] != self._fork_block:
+            raise ValueError(
+                f"{self.path.name} was recorded at block {int(self._recorded['block'], 16)}, "
+                f"but the fork is at block {int(self._fork_block, 16)}. Fork at the recorded "
+                "block, or delete the file to record again from scratch."
+            )
+        self.holders.update(self._recorded["holders"])
+        self.balance_slots.update(self._recorded["balance_slots"])
+
+    def collect(self):
+        """
+        Note every account and storage slot touched so far. Must be called before the
+        chain is reverted, as reverting also discards the state cached from the fork.
+        """
+        dump = _rpc("anvil_dumpState", [])
+        state = json.loads(gzip.decompress(bytes.fromhex(dump[2:])))
+        for address, account in state["accounts"].items():
+            slots = self._touched.setdefault(to_address(address), set())
+            slots.update(int(i, 16) for i in account.get("storage", {}))
+
+    def save(self):
+        """
+        Write the fork block values of every touched account and storage slot to `path`,
+        merged with the state recorded there by earlier sessions.
+        """
+        block = self._fork_block
+        recorded = self._recorded or {"accounts": {}, "abis": {}}
+        accounts = recorded["accounts"]
+        for address, slots in sorted(self._touched.items()):
+            account = {
+                "code": _rpc("eth_getCode", [address, block]),
+                "balance": _rpc("eth_getBalance", [address, block]),
+                "nonce": _rpc("eth_getTransactionCount", [address, block]),
+                "storage": {},
+            }
+            for slot in sorted(slots):
+                value = _rpc("eth_getStorageAt", [address, hex(slot), block])
+                if int(value, 16):
+                    account["storage"][_to_word(slot)] = value
+            if address in accounts:
+                account["storage"] = {**accounts[address]["storage"], **account["storage"]}
+            if account["code"] != "0x" or account["storage"] or int(account["balance"], 16):
+                accounts[address] = account
+
+        abis = recorded["abis"]
+        abis.update(
+            (k, [v._name, v.abi])
+            for k, v in _contract_map.items()
+            if isinstance(v, Contract) and k in accounts
+        )
+
+        with self.path.open("w") as fp:
+            json.dump(
+                {
+                    "block": block,
+                    "timestamp": int(_rpc("eth_getBlockByNumber", [block, False])["timestamp"], 16),
+                    "accounts": accounts,
+                    "abis": abis,
+                    "holders": self.holders,
+                    "balance_slots": self.balance_slots,
+                },
+                fp,
+            )
+
+    def _load(self):
+        with self.path.open() as fp:
+            data = json.load(fp)
+
+        for address, account in data["accounts"].items():
+            _rpc("anvil_setCode", [address, account["code"]])
+            _rpc("anvil_setBalance", [address, account["balance"]])
+            _rpc("anvil_setNonce", [address, account["nonce"]])
+            for slot, value in account["storage"].items():
+                _rpc("anvil_setStorageAt", [address, slot, value])
+
+        for address, (name, abi) in data["abis"].items():
+            Contract.from_abi(name, address, abi)
+
+        self.holders.update(data["holders"])
+        self.balance_slots.update(data["balance_slots"])
+
+        # time dependent logic, e.g. oracle staleness checks, expects the recorded time
+        _rpc("anvil_setTime", [data["timestamp"]])
+        chain.mine()
+
+    def find_balance_slot(self, token, account):
+        """
+        Find the storage index and layout of the balance mapping for `token`, by writing
+        to candidate slots and checking `balanceOf`. Returns None for tokens that
+        do not store balances in a plain mapping, e.g. rebasing tokens or tokens that
+        keep balances in a separate contract.
+        """
+        if token.address in self.balance_slots:
+            return self.balance_slots[token.address]
+
+        balance = token.balanceOf(account)
+        result = None
+        for index in range(MAX_BALANCE_INDEX):
+            for layout in ("solidity", "vyper"):
+                key = _balance_key(account, index, layout)
+                original = _rpc("eth_getStorageAt", [token.address, key, "latest"])
+                _rpc("anvil_setStorageAt", [token.address, key, _to_word(balance + 1)])
+                found = token.balanceOf(account) == balance + 1
+                _rpc("anvil_setStorageAt", [token.address, key, original])
+                if found:
+                    result = [index, layout]
+                    break
+            if result:
+                break
+
+        self.balance_slots[token.address] = result
+        return result
+
+    def mint(self, token, target, amount):
+        """
+        Increase the balance of `target` by writing to the token's balance mapping.
+        Returns False if the balance mapping could not be found.
+        """
+        slot = self.find_balance_slot(token, target)
+        if slot is None:
+            return False
+
+        key = _balance_key(target, *slot)
+        balance = int(_rpc("eth_getStorageAt", [token.address, key, "latest"]), 16)
+        _rpc("anvil_setStorageAt", [token.address, key, _to_word(balance + amount)])
+        return True
@@ -0,0 +1,254 @@
+import html
+import json
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+
+import pytest
+from brownie import chain, history, web3
+
+# number of transactions traced for the opcode breakdown of each function
+TRACE_SAMPLES = 20
+
+CALL_OPS = {"CALL", "CALLCODE", "DELEGATECALL", "STATICCALL", "CREATE", "CREATE2"}
+
+OPCODE_CATEGORIES = {
+    "storage": {"SLOAD", "SSTORE"},
+    "call": CALL_OPS | {"SELFDESTRUCT"},
+    "log": {"LOG0", "LOG1", "LOG2", "LOG3", "LOG4"},
+    "hash": {"SHA3", "KECCAK256"},
+    "memory": {
+        "MLOAD",
+        "MSTORE",
+        "MSTORE8",
+        "MSIZE",
+        "MCOPY",
+        "CALLDATACOPY",
+        "CODECOPY",
+        "RETURNDATACOPY",
+        "EXTCODECOPY",
+    },
+    "account": {"BALANCE", "SELFBALANCE", "EXTCODESIZE", "EXTCODEHASH"},
+}
+CATEGORIES = list(OPCODE_CATEGORIES) + ["compute", "intrinsic"]
+
+_category = {op: k for k, v in OPCODE_CATEGORIES.items() for op in v}
+
+
+def _percentile(values, q):
+    # nearest-rank percentile of a sorted list
+    return values[max(0, -(-len(values) * q // 100) - 1)]
+
+
+def opcode_gas(struct_logs, gas_used):
+    """
+    Break down the gas used by a transaction by opcode category.
+
+    The gas of each step is taken from the change in remaining gas, as the reported
+    `gasCost` of a call includes the gas forwarded to the callee. The cost of a call
+    itself is what remains after subtracting everything spent within the call.
+    Gas not spent on any opcode - the base and calldata cost less refunds - is
+    reported as `intrinsic`.
+
+    Arguments
+    ---------
+    struct_logs : list
+        `structLogs` from `debug_traceTransaction`.
+    gas_used : int
+        Gas used by the transaction.
+
+    Returns
+    -------
+    dict
+        Gas used by each opcode category.
+    """
+    gas = dict.fromkeys(CATEGORIES, 0)
+    # for each active call: the remaining gas before the call, and the gas spent within it
+    frames = []
+
+    for i, step in enumerate(struct_logs):
+        next_step = struct_logs[i + 1] if i + 1 < len(struct_logs) else None
+        if next_step is not None and next_step["depth"] > step["depth"]:
+            frames.append([step["gas"], 0])
+            continue
+
+        if next_step is not None and next_step["depth"] == step["depth"]:
+            cost = step["gas"] - next_step["gas"]
+        else:
+            cost = step["gasCost"]
+        gas[_category.get(step["op"], "compute")] += cost
+        if frames:
+            frames[-1][1] += cost
+
+        if next_step is not None and next_step["depth"] < step["depth"] and frames:
+            gas_before, spent = frames.pop()
+            cost = gas_before - next_step["gas"] - spent
+            gas["call"] += cost
+            if frames:
+                frames[-1][1] += cost + spent
+
+    gas["intrinsic"] = gas_used - sum(gas.values())
+    return gas
+
+
+class GasProfiler:
+    """
+    Aggregates the gas used by every transaction in the test session, by contract
+    and function, and writes a JSON and HTML report.
+
+    Transactions are collected from brownie's `history` before every chain revert or
+    reset, as those remove the reverted transactions from the history. At the same
+    point the first `TRACE_SAMPLES` successful transactions of each function are
+    traced, to break their gas down by opcode category. Tracing requires a client
+    with `debug_traceTransaction`, otherwise the breakdown is omitted.
+
+    When running with xdist, each worker profiles its own transactions and the
+    results are merged by the controller.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.gas_used = defaultdict(list)
+        self.reverts = defaultdict(int)
+        self.opcodes = {}
+        self.traced = defaultdict(int)
+        self._collected = 0
+        self._patched = {}
+
+    def pytest_sessionstart(self, session):
+        for name in ("revert", "reset"):
+            fn = getattr(chain, name)
+            self._patched[name] = fn
+            setattr(chain, name, self._collect_before(fn))
+
+    def _collect_before(self, fn):
+        def wrapped(*args, **kwargs):
+            self.collect()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._collected = len(history)
+
+        return wrapped
+
+    def collect(self):
+        """
+        Record every transaction added to the history since the last collection.
+        """
+        for tx in history.copy()[self._collected :]:
+            if not tx.fn_name or tx.status == -1:
+                # plain transfers and pending transactions
+                continue
+            name = tx._full_name()
+            if not tx.status:
+                self.reverts[name] += 1
+                continue
+            self.gas_used[name].append(tx.gas_used)
+            if web3.supports_traces and self.traced[name] < TRACE_SAMPLES:
+                self._trace(name, tx)
+        self._collected = len(history)
+
+    def _trace(self, name, tx):
+        response = web3.provider.make_request(
+            "debug_traceTransaction",
+            [tx.txid, {"disableStorage": True, "disableMemory": True, "disableStack": True}],
+        )
+        if "result" not in response:
+            return
+        gas = opcode_gas(response["result"]["structLogs"], tx.gas_used)
+        totals = self.opcodes.setdefault(name, dict.fromkeys(CATEGORIES, 0))
+        for key, value in gas.items():
+            totals[key] += value
+        self.traced[name] += 1
+
+    def _merge(self, data):
+        for name, values in data["gas_used"].items():
+            self.gas_used[name].extend(values)
+        for name, count in data["reverts"].items():
+            self.reverts[name] += count
+        for name, gas in data["opcodes"].items():
+            totals = self.opcodes.setdefault(name, dict.fromkeys(CATEGORIES, 0))
+            for key, value in gas.items():
+                totals[key] += value
+        for name, count in data["traced"].items():
+            self.traced[name] += count
+
+    def _data(self):
+        return {
+            "gas_used": dict(self.gas_used),
+            "reverts": dict(self.reverts),
+            "opcodes": self.opcodes,
+            "traced": dict(self.traced),
+        }
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        data = getattr(node, "workeroutput", {}).get("gas_profile")
+        if data:
+            self._merge(data)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        self.collect()
+        for name, fn in self._patched.items():
+            setattr(chain, name, fn)
+
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["gas_profile"] = self._data()
+        elif self.gas_used or self.reverts:
+            report = self.report()
+            with self.path.open("w") as fp:
+                json.dump(report, fp, indent=2, sort_keys=True)
+            self.path.with_suffix(".html").write_text(render_html(report))
+
+    def report(self):
+        """
+        Summarize the collected gas by function.
+
+        Returns
+        -------
+        dict
+            For every `Contract.function`, the number of successful calls and reverts,
+            the min, median, 95th percentile and max gas of successful calls, and the
+            mean gas of each opcode category over the traced calls.
+        """
+        report = {}
+        for name in sorted(set(self.gas_used) | set(self.reverts)):
+            values = sorted(self.gas_used[name])
+            stats = {"calls": len(values), "reverts": self.reverts[name]}
+            if values:
+                stats.update(
+                    min=values[0],
+                    median=int(median(values)),
+                    p95=_percentile(values, 95),
+                    max=values[-1],
+                )
+            if self.traced[name]:
+                stats["opcodes"] = {
+                    k: v // self.traced[name] for k, v in self.opcodes[name].items()
+                }
+            report[name] = stats
+        return report
+
+
+def render_html(report):
+    """
+    Render a gas report as an HTML table, most expensive functions first.
+    """
+    columns = ["calls", "reverts", "min", "median", "p95", "max"]
+    header = "".join(f"<th>{i}</th>" for i in ["function"] + columns + CATEGORIES)
+    rows = []
+    for name, stats in sorted(report.items(), key=lambda k: -k[1].get("max", 0)):
+        opcodes = stats.get("opcodes", {})
+        cells = [html.escape(name)] + [stats.get(i, "") for i in columns]
+        cells += [opcodes.get(i, "") for i in CATEGORIES]
+        rows.append("<tr>" + "".join(f"<td>{i}</td>" for i in cells) + "</tr>")
+
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>Gas profile</title>"
+        "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:2px 8px;text-align:right}"
+        "td:first-child{text-align:left}</style></head><body>\n"
+        f"<h1>Gas profile</h1>\n<table>\n<tr>{header}</tr>\n" + "\n".join(rows) + "\n"
+        "</table>\n<p>Opcode categories are the mean gas per traced call.</p>\n</body></html>\n"
+    )
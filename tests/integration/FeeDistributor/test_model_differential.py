@@ -0,0 +1,165 @@
+import pytest
+from brownie import chain, history
+from brownie.exceptions import VirtualMachineError
+from brownie.test import strategy
+
+from scripts.models.fee_distributor import FeeDistributorModel
+from scripts.models.voting_escrow import Revert, VotingEscrowModel
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+GAS_LIMIT = 4_000_000
+
+
+class StateMachine:
+    """
+    Replay action sequences against both the distributor and the reference model,
+    verifying that claimed amounts, reverts and per-week state match exactly.
+    """
+
+    st_acct = strategy("address", length=5)
+    st_weeks = strategy("uint256", min_value=1, max_value=12)
+    st_amount = strategy("uint256", min_value=10 ** 18, max_value=10 ** 20)
+    st_time = strategy("uint256", min_value=0, max_value=86400 * 3)
+    st_sleep_duration = strategy("uint", min_value=1, max_value=4)
+    st_iterations = strategy("uint256", min_value=0, max_value=10)
+
+    def __init__(self, accounts, voting_escrow, distributor, fee_coin, lock):
+        self.accounts = accounts
+        self.voting_escrow = voting_escrow
+        self.distributor = distributor
+        self.fee_coin = fee_coin
+        self.lock = lock
+
+    def setup(self):
+        deploy_tx = self.voting_escrow.tx
+        self.ve_model = VotingEscrowModel(deploy_tx.timestamp, deploy_tx.block_number)
+        self.ve_model.create_lock(self.accounts[0], *self.lock)
+        self.model = FeeDistributorModel(
+            self.ve_model, self.distributor.start_time(), self.accounts[0]
+        )
+
+    def _execute(self, contract, fn_name, st_acct, model_fn, *args):
+        try:
+            tx = getattr(contract, fn_name)(*args, {"from": st_acct, "gas": GAS_LIMIT})
+        except VirtualMachineError:
+            tx = history[-1]
+            with pytest.raises(Revert):
+                model_fn(tx.timestamp, tx.block_number)
+            return None
+
+        return tx, model_fn(tx.timestamp, tx.block_number)
+
+    def rule_new_lock(self, st_acct, st_amount, st_weeks, st_time):
+        chain.sleep(st_time)
+        end = self.voting_escrow.locked__end(st_acct)
+        if end == 0:
+            until = (chain.time() // WEEK + st_weeks) * WEEK
+            self._execute(
+                self.voting_escrow,
+                "create_lock",
+                st_acct,
+                lambda *tx: self.ve_model.create_lock(st_acct, st_amount, until, *tx),
+                st_amount,
+                until,
+            )
+        elif end < chain.time():
+            self._execute(
+                self.voting_escrow,
+                "withdraw",
+                st_acct,
+                lambda *tx: self.ve_model.withdraw(st_acct, *tx),
+            )
+
+    def rule_claim(self, st_acct, st_time):
+        chain.sleep(st_time)
+        balance = self.fee_coin.balanceOf(st_acct)
+        result = self._execute(
+            self.distributor, "claim", st_acct, lambda *tx: self.model.claim(st_acct, *tx),
+        )
+        if result is not None:
+            assert self.fee_coin.balanceOf(st_acct) - balance == result[1]
+
+    def rule_claim_partial(self, st_acct, st_iterations, st_time):
+        chain.sleep(st_time)
+        balance = self.fee_coin.balanceOf(st_acct)
+        result = self._execute(
+            self.distributor,
+            "claim_partial",
+            st_acct,
+            lambda *tx: self.model.claim_partial(st_acct, st_iterations, *tx),
+            st_acct,
+            st_iterations,
+        )
+        if result is not None:
+            tx, (amount, remaining) = result
+            assert self.fee_coin.balanceOf(st_acct) - balance == amount
+            assert tx.return_value == remaining
+
+    def rule_transfer_fees(self, st_amount, st_time):
+        chain.sleep(st_time)
+        self.fee_coin._mint_for_testing(st_amount, {"from": self.distributor.address})
+        self.model.receive(st_amount)
+
+        if not self.distributor.can_checkpoint_token():
+            self.distributor.toggle_allow_checkpoint_token({"from": self.accounts[0]})
+            self.model.toggle_allow_checkpoint_token(self.accounts[0])
+
+    def rule_checkpoint_token(self, st_acct, st_time):
+        chain.sleep(st_time)
+        self._execute(
+            self.distributor,
+            "checkpoint_token",
+            st_acct,
+            lambda timestamp, block: self.model.checkpoint_token(st_acct, timestamp),
+        )
+
+    def rule_checkpoint_total_supply(self, st_acct, st_time):
+        chain.sleep(st_time)
+        self._execute(
+            self.distributor,
+            "checkpoint_total_supply",
+            st_acct,
+            lambda *tx: self.model.checkpoint_total_supply(*tx),
+        )
+
+    def rule_advance_time(self, st_sleep_duration):
+        chain.sleep(st_sleep_duration * WEEK)
+        chain.mine()
+
+    def invariant_state(self):
+        distributor = self.distributor
+        model = self.model
+
+        assert distributor.time_cursor() == model.time_cursor
+        assert distributor.last_token_time() == model.last_token_time
+        assert distributor.token_last_balance() == model.token_last_balance
+        assert self.fee_coin.balanceOf(distributor) == model.token_balance
+        for acct in self.accounts:
+            assert distributor.time_cursor_of(acct) == model.time_cursor_of.get(acct, 0)
+            assert distributor.user_epoch_of(acct) == model.user_epoch_of.get(acct, 0)
+
+        for week in range(model.start_time, chain[-1].timestamp + WEEK, WEEK):
+            assert distributor.tokens_per_week(week) == model.tokens_per_week.get(week, 0)
+            assert distributor.ve_supply(week) == model.ve_supply.get(week, 0)
+
+
+def test_differential(state_machine, accounts, voting_escrow, fee_distributor, coin_a, token):
+    for acct in accounts[:5]:
+        token.approve(voting_escrow, 2 ** 256 - 1, {"from": acct})
+        token.transfer(acct, 10 ** 18 * 10000000, {"from": accounts[0]})
+
+    amount, unlock_time = 10 ** 18 * 10000000, chain.time() + YEAR * 2
+    tx = voting_escrow.create_lock(amount, unlock_time, {"from": accounts[0]})
+    chain.sleep(WEEK)
+    distributor = fee_distributor()
+
+    state_machine(
+        StateMachine,
+        accounts[:5],
+        voting_escrow,
+        distributor,
+        coin_a,
+        (amount, unlock_time, tx.timestamp, tx.block_number),
+        settings={"max_examples": 20, "stateful_step_count": 30},
+    )
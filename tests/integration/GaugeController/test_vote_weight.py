@@ -1,8 +1,10 @@
 import pytest
-from brownie import chain, history
+from brownie import chain
 from brownie.test import given, strategy
 from hypothesis import settings
 
+from tests.time_travel import sample
+
 WEEK = 86400 * 7
 YEAR = 86400 * 365
 
@@ -84,16 +86,25 @@ def test_gauge_weight_vote(
         bias, duration = slope_data[idx]
         return max(bias * (1 - relative_time * max_duration / duration), 0)
 
-    chain.sleep(WEEK * 4)
-    chain.mine()
+    # compare theoretical weight to actual weights a month apart
+    start_time = chain.time() + WEEK * 4
+    sample_times = list(range(start_time, timestamp + 3 * max_duration // 2, WEEK * 4))
 
-    # advance clock a month at a time and compare theoretical weight to actual weights
-    while history[-1].timestamp < timestamp + 1.5 * max_duration:
+    # advance to the last sample in half year steps - each checkpoint fills in the
+    # weights of every week since the previous one, so the samples are read afterwards
+    while chain.time() < sample_times[-1]:
+        chain.sleep(min(WEEK * 26, sample_times[-1] - chain.time()))
         for i in range(3):
             gauge_controller.checkpoint_gauge(three_gauges[i], {"from": accounts[4]})
 
-        relative_time = (history[-1].timestamp // WEEK * WEEK - timestamp) / max_duration
-        weights = [gauge_controller.gauge_relative_weight(three_gauges[i]) / 1e18 for i in range(3)]
+    sampled_weights = [
+        sample(gauge_controller.gauge_relative_weight, [three_gauges[i]], sample_times)
+        for i in range(3)
+    ]
+
+    for t, *weights in zip(sample_times, *sampled_weights):
+        relative_time = (t // WEEK * WEEK - timestamp) / max_duration
+        weights = [w / 1e18 for w in weights]
 
         if relative_time < 1:
             theoretical_weights = [
@@ -111,9 +122,5 @@ def test_gauge_weight_vote(
         if relative_time != 1:  # XXX 1 is odd: let's look at it separately
             for i in range(3):
                 assert (
-                    abs(weights[i] - theoretical_weights[i])
-                    <= (history[-1].timestamp - timestamp) / WEEK + 1
+                    abs(weights[i] - theoretical_weights[i]) <= (t - timestamp) / WEEK + 1
                 )  # 1 s per week?
-
-        chain.sleep(WEEK * 4)
-        chain.mine()
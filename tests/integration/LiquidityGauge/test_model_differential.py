@@ -0,0 +1,115 @@
+from brownie import chain
+from brownie.test import strategy
+
+from scripts.models.liquidity_gauge import CRVRateModel, LiquidityGaugeModel
+
+WEEK = 86400 * 7
+
+
+class StateMachine:
+    """
+    Replay deposits, withdrawals, locks and votes against both the gauge and the
+    simulator, verifying that working balances and integrals match exactly.
+    """
+
+    st_account = strategy("address", length=5)
+    st_value = strategy("uint64")
+    st_pct = strategy("decimal", min_value="0.01", max_value=1, places=2)
+    st_lock_duration = strategy("uint8", min_value=1)
+    st_weight = strategy("uint", max_value=10000)
+    st_sleep_duration = strategy("uint", min_value=1, max_value=26)
+
+    def __init__(self, accounts, token, voting_escrow, gauge_controller, liquidity_gauge):
+        self.accounts = accounts
+        self.token = token
+        self.voting_escrow = voting_escrow
+        self.gauge_controller = gauge_controller
+        self.liquidity_gauge = liquidity_gauge
+
+    def setup(self):
+        # the deployed contracts are the only source of gauge weights and voting power
+        self.model = LiquidityGaugeModel(
+            CRVRateModel(self.token.tx.timestamp),
+            lambda t: self.gauge_controller.gauge_relative_weight(self.liquidity_gauge, t),
+            self.voting_escrow,
+            self.liquidity_gauge.tx.timestamp,
+        )
+
+    def rule_deposit(self, st_account, st_value):
+        tx = self.liquidity_gauge.deposit(st_value, {"from": st_account})
+        self.model.deposit(st_account, st_value, tx.timestamp)
+
+    def rule_withdraw(self, st_account, st_pct):
+        value = int(self.liquidity_gauge.balanceOf(st_account) * st_pct)
+        tx = self.liquidity_gauge.withdraw(value, {"from": st_account})
+        self.model.withdraw(st_account, value, tx.timestamp)
+
+    def rule_user_checkpoint(self, st_account):
+        tx = self.liquidity_gauge.user_checkpoint(st_account, {"from": st_account})
+        self.model.user_checkpoint(st_account, tx.timestamp)
+
+    def rule_lock_and_vote(self, st_account, st_value, st_lock_duration, st_weight):
+        if self.voting_escrow.locked(st_account)[0] == 0:
+            unlock_time = chain.time() + st_lock_duration * WEEK
+            self.voting_escrow.create_lock(st_value + 1, unlock_time, {"from": st_account})
+        if self.voting_escrow.locked(st_account)[1] > chain.time() + WEEK:
+            self.gauge_controller.vote_for_gauge_weights(
+                self.liquidity_gauge, st_weight, {"from": st_account}
+            )
+
+    def rule_advance_time(self, st_sleep_duration):
+        chain.sleep(st_sleep_duration * WEEK)
+        chain.mine()
+
+    def invariant_state(self):
+        assert self.liquidity_gauge.period() == self.model.period
+        assert self.liquidity_gauge.working_supply() == self.model.working_supply
+        assert self.liquidity_gauge.inflation_rate() == self.model.inflation_rate
+        assert self.liquidity_gauge.future_epoch_time() == self.model.future_epoch_time
+        for acct in self.accounts:
+            assert self.liquidity_gauge.working_balances(acct) == (
+                self.model.working_balances.get(acct, 0)
+            )
+            assert self.liquidity_gauge.integrate_fraction(acct) == (
+                self.model.integrate_fraction.get(acct, 0)
+            )
+
+    def teardown(self):
+        # checkpoint everyone, so that every integral is compared up to the same week
+        chain.sleep(WEEK)
+        for acct in self.accounts:
+            tx = self.liquidity_gauge.user_checkpoint(acct, {"from": acct})
+            self.model.user_checkpoint(acct, tx.timestamp)
+        self.invariant_state()
+
+
+def test_differential(
+    state_machine,
+    accounts,
+    token,
+    voting_escrow,
+    gauge_controller,
+    liquidity_gauge,
+    three_gauges,
+    mock_lp_token,
+):
+    gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(liquidity_gauge, 0, 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[0], 0, 10 ** 18, {"from": accounts[0]})
+
+    for acct in accounts[:5]:
+        if acct != accounts[0]:
+            token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+            mock_lp_token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+        token.approve(voting_escrow, 2 ** 256 - 1, {"from": acct})
+        mock_lp_token.approve(liquidity_gauge, 2 ** 256 - 1, {"from": acct})
+
+    state_machine(
+        StateMachine,
+        accounts[:5],
+        token,
+        voting_escrow,
+        gauge_controller,
+        liquidity_gauge,
+        settings={"max_examples": 10, "stateful_step_count": 30},
+    )
@@ -0,0 +1,114 @@
+import pytest
+from brownie import chain, history
+from brownie.exceptions import VirtualMachineError
+from brownie.test import strategy
+
+from scripts.models.voting_escrow import Revert, VotingEscrowModel
+
+WEEK = 86400 * 7
+GAS_LIMIT = 4_000_000
+
+
+class StateMachine:
+    """
+    Replay action sequences against both the contract and the reference model,
+    verifying that results and reverts match exactly.
+    """
+
+    st_account = strategy("address", length=5)
+    st_value = strategy("uint64")
+    st_lock_duration = strategy("uint8")
+    st_sleep_duration = strategy("uint", min_value=1, max_value=4)
+
+    def __init__(self, accounts, voting_escrow, deploy_tx):
+        self.accounts = accounts
+        self.voting_escrow = voting_escrow
+        self.deploy_tx = deploy_tx
+
+    def setup(self):
+        self.model = VotingEscrowModel(self.deploy_tx.timestamp, self.deploy_tx.block_number)
+        self.blocks = []
+
+    def _execute(self, fn_name, st_account, *args):
+        try:
+            tx = getattr(self.voting_escrow, fn_name)(*args, {"from": st_account, "gas": GAS_LIMIT})
+            revert_msg = None
+        except VirtualMachineError as exc:
+            tx = history[-1]
+            revert_msg = exc.revert_msg
+
+        model_args = ([] if fn_name == "checkpoint" else [st_account]) + list(args)
+        if revert_msg is None:
+            getattr(self.model, fn_name)(*model_args, tx.timestamp, tx.block_number)
+            self.blocks.append(tx.block_number)
+        else:
+            with pytest.raises(Revert) as exc:
+                getattr(self.model, fn_name)(*model_args, tx.timestamp, tx.block_number)
+            assert exc.value.revert_msg == revert_msg
+
+    def rule_create_lock(self, st_account, st_value, st_lock_duration):
+        unlock_time = chain.time() + st_lock_duration * WEEK
+        self._execute("create_lock", st_account, st_value, unlock_time)
+
+    def rule_increase_amount(self, st_account, st_value):
+        self._execute("increase_amount", st_account, st_value)
+
+    def rule_increase_unlock_time(self, st_account, st_lock_duration):
+        unlock_time = chain.time() + st_lock_duration * WEEK
+        self._execute("increase_unlock_time", st_account, unlock_time)
+
+    def rule_withdraw(self, st_account):
+        self._execute("withdraw", st_account)
+
+    def rule_checkpoint(self, st_account):
+        self._execute("checkpoint", st_account)
+
+    def rule_advance_time(self, st_sleep_duration):
+        chain.sleep(st_sleep_duration * WEEK)
+        chain.mine()
+
+    def invariant_state(self):
+        timestamp = chain[-1].timestamp
+        epoch = self.voting_escrow.epoch()
+
+        assert epoch == self.model.epoch
+        assert self.voting_escrow.supply() == self.model.supply
+        assert self.voting_escrow.point_history(epoch) == tuple(self.model.get_point(epoch))
+        assert self.voting_escrow.totalSupply(timestamp) == self.model.totalSupply(timestamp)
+        for acct in self.accounts:
+            assert self.voting_escrow.balanceOf(acct, timestamp) == self.model.balanceOf(
+                acct, timestamp
+            )
+
+    def teardown(self):
+        # checkpoint so that every recorded block precedes the latest point
+        blocks = self.blocks.copy()
+        self._execute("checkpoint", self.accounts[0])
+        current = (chain[-1].timestamp, chain[-1].number)
+
+        for block in blocks:
+            assert self.voting_escrow.totalSupplyAt(block) == self.model.totalSupplyAt(
+                block, *current
+            )
+            for acct in self.accounts:
+                assert self.voting_escrow.balanceOfAt(acct, block) == self.model.balanceOfAt(
+                    acct, block, *current
+                )
+
+
+def test_differential(state_machine, accounts, ERC20, VotingEscrow):
+    token = ERC20.deploy("", "", 18, {"from": accounts[0]})
+    voting_escrow = VotingEscrow.deploy(
+        token, "Voting-escrowed CRV", "veCRV", "veCRV_0.99", {"from": accounts[0]}
+    )
+    for acct in accounts[:5]:
+        token._mint_for_testing(10 ** 40, {"from": acct})
+        token.approve(voting_escrow, 2 ** 256 - 1, {"from": acct})
+
+    state_machine(
+        StateMachine,
+        accounts[:5],
+        voting_escrow,
+        voting_escrow.tx,
+        settings={"max_examples": 20, "stateful_step_count": 30},
+    )
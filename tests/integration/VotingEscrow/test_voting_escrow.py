@@ -1,4 +1,5 @@
 from tests.conftest import approx
+from tests.time_travel import advance
 
 H = 3600
 DAY = 86400
@@ -69,9 +70,7 @@ def test_voting_powers(web3, chain, accounts, token, voting_escrow):
     stages["alice_in_0"] = []
     stages["alice_in_0"].append((web3.eth.blockNumber, chain[-1].timestamp))
     for i in range(7):
-        for _ in range(24):
-            chain.sleep(H)
-            chain.mine()
+        advance(DAY, blocks=24)
         dt = chain[-1].timestamp - t0
         assert approx(
             voting_escrow.totalSupply(), amount // MAXTIME * max(WEEK - 2 * H - dt, 0), TOL,
@@ -120,9 +119,7 @@ def test_voting_powers(web3, chain, accounts, token, voting_escrow):
     # Beginning of week: weight 3
     # End of week: weight 1
     for i in range(7):
-        for _ in range(24):
-            chain.sleep(H)
-            chain.mine()
+        advance(DAY, blocks=24)
         dt = chain[-1].timestamp - t0
         w_total = voting_escrow.totalSupply()
         w_alice = voting_escrow.balanceOf(alice)
@@ -149,9 +146,7 @@ def test_voting_powers(web3, chain, accounts, token, voting_escrow):
 
     stages["alice_in_2"] = []
     for i in range(7):
-        for _ in range(24):
-            chain.sleep(H)
-            chain.mine()
+        advance(DAY, blocks=24)
         dt = chain[-1].timestamp - t0
         w_total = voting_escrow.totalSupply()
         w_alice = voting_escrow.balanceOf(alice)
@@ -0,0 +1,88 @@
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from xdist.scheduler import LoadFileScheduling
+
+# time spent in each test module during previous runs
+DURATIONS_PATH = Path(__file__).parent.parent.joinpath(".test-durations.json")
+
+
+def _module(nodeid):
+    return nodeid.split("::", 1)[0]
+
+
+def load_durations(path=DURATIONS_PATH):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with path.open() as fp:
+        return json.load(fp)
+
+
+class DurationScheduling(LoadFileScheduling):
+    """
+    Distributes test modules between xdist workers, slowest modules first.
+
+    Every module runs on a single worker, so module scoped fixtures are only set up
+    once. Work units are handed out longest-first based on the durations of previous
+    runs, which keeps a slow module from starting last and holding up the session.
+    Modules without a recorded duration are treated as the slowest known module.
+    """
+
+    def __init__(self, config, log=None, path=DURATIONS_PATH):
+        super().__init__(config, log)
+        self.durations = load_durations(path)
+
+    def _duration(self, scope):
+        return self.durations.get(scope, max(self.durations.values(), default=0))
+
+    def _assign_work_unit(self, node):
+        scope = max(self.workqueue, key=self._duration)
+        self.workqueue.move_to_end(scope, last=False)
+        super()._assign_work_unit(node)
+
+
+class DurationRecorder:
+    """
+    Records the time spent in each test module and reports the parallel speedup.
+
+    Durations include fixture setup and teardown. They are merged into `path` at the
+    end of each session and used by `DurationScheduling` on the next parallel run.
+    When running with xdist, the summed module durations approximate a serial run,
+    and are compared against the wall time of the session.
+    """
+
+    def __init__(self, path=DURATIONS_PATH):
+        self.path = Path(path)
+        self.workers = 0
+        self.durations = defaultdict(float)
+        self.start_time = time.time()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodeready(self, node):
+        self.workers += 1
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[_module(report.nodeid)] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.durations:
+            return
+        durations = load_durations(self.path)
+        durations.update((k, round(v, 3)) for k, v in self.durations.items())
+        with self.path.open("w") as fp:
+            json.dump(durations, fp, indent=2, sort_keys=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.workers or not self.durations:
+            return
+        wall_time = time.time() - self.start_time
+        serial_time = sum(self.durations.values())
+        terminalreporter.write_sep("=", "parallel execution")
+        terminalreporter.write_line(
+            f"{len(self.durations)} modules on {self.workers} workers: {wall_time:.1f}s wall "
+            f"time, {serial_time:.1f}s serial - {serial_time / wall_time:.2f}x speedup"
+        )
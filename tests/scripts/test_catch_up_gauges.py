@@ -0,0 +1,51 @@
+import pytest
+
+from scripts.keepers.catch_up_gauges import get_pending, main, stale_weeks
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, chain, gauge_controller, three_gauges, voting_escrow, token):
+    gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_type(b"Insurance", 10 ** 18, {"from": accounts[0]})
+    for i, gauge in enumerate(three_gauges):
+        gauge_controller.add_gauge(gauge, i % 2, 10 ** 18, {"from": accounts[0]})
+
+    token.approve(voting_escrow, 10 ** 24, {"from": accounts[0]})
+    voting_escrow.create_lock(10 ** 24, chain.time() + YEAR, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+
+
+@pytest.mark.parametrize(
+    "last_time,timestamp,weeks",
+    [
+        (0, WEEK * 10, 0),
+        (WEEK * 11, WEEK * 10, 0),
+        (WEEK * 10, WEEK * 10, 1),
+        (WEEK, WEEK * 10 + 1, 10),
+    ],
+)
+def test_stale_weeks(last_time, timestamp, weeks):
+    assert stale_weeks(last_time, timestamp) == weeks
+
+
+def test_get_pending(chain, gauge_controller, three_gauges):
+    assert get_pending(gauge_controller) == (0, {})
+
+    chain.sleep(WEEK * 3)
+    common, gauges = get_pending(gauge_controller)
+    assert common == 3
+    assert gauges == {i.address: 3 for i in three_gauges}
+
+
+def test_main(accounts, chain, gauge_controller, three_gauges):
+    chain.sleep(WEEK * 30)
+    chain.mine()
+
+    main(accounts[0], gauge_controller.address, max_weeks=7)
+
+    assert gauge_controller.time_total() > chain.time()
+    for gauge in three_gauges:
+        assert gauge_controller.time_weight(gauge) > chain.time()
@@ -0,0 +1,17 @@
+import bisect
+
+import pytest
+
+from scripts.epoch_hints import BLK, TS, last_epoch
+
+# point histories of (bias, slope, ts, blk), as stored by the voting escrow
+POINTS = [(0, 0, 100, 10), (5, 1, 200, 20), (4, 1, 200, 20), (3, 1, 300, 25), (0, 0, 700, 31)]
+
+
+@pytest.mark.parametrize("key", [TS, BLK])
+@pytest.mark.parametrize("max_epoch", range(len(POINTS)))
+def test_last_epoch(key, max_epoch):
+    values = [i[key] for i in POINTS[: max_epoch + 1]]
+    for value in range(0, values[-1] + 2):
+        expected = max(bisect.bisect_right(values, value) - 1, 0)
+        assert last_epoch(POINTS.__getitem__, key, value, max_epoch) == expected
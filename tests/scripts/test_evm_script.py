@@ -0,0 +1,96 @@
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from scripts.voting.evm_script import (
+    AGENT_EXECUTE_SIGNATURE,
+    decode_agent_call,
+    decode_calls,
+    decode_script,
+    encode_agent_call,
+    encode_agent_script,
+    encode_call,
+    encode_script,
+    selector,
+    wrap_forwarder,
+)
+
+AGENT = "0x40907540d8a6c65c637785e8f8b742ae6b0b9968"
+VOTING = "0xe478de485ad2fe566d49342cbd03e49ed7db3356"
+
+st_address = st.binary(min_size=20, max_size=20).map(lambda x: "0x" + x.hex())
+st_calls = st.lists(st.tuples(st_address, st.binary(max_size=300)), max_size=20)
+
+
+def test_selector():
+    assert selector("transfer(address,uint256)").hex() == "a9059cbb"
+    assert selector(AGENT_EXECUTE_SIGNATURE).hex() == "b61d27f6"
+
+
+def test_encode_call():
+    calldata = encode_call("add_gauge(address,int128,uint256)", AGENT, 1, 10 ** 18)
+
+    assert len(calldata) == 4 + 32 * 3
+    assert calldata[4:36] == bytes(12) + bytes.fromhex(AGENT[2:])
+    assert int.from_bytes(calldata[36:68], "big") == 1
+    assert int.from_bytes(calldata[68:], "big") == 10 ** 18
+
+
+def test_empty_script():
+    assert encode_script([]) == b"\x00\x00\x00\x01"
+    assert decode_script("0x00000001") == []
+
+
+def test_invalid_spec_id():
+    with pytest.raises(ValueError):
+        decode_script(b"\x00\x00\x00\x02")
+
+
+def test_truncated_script():
+    script = encode_script([(AGENT, b"\x01\x02\x03")])
+
+    with pytest.raises(ValueError):
+        decode_script(script[:-1])
+
+
+def test_not_agent_call():
+    assert decode_agent_call(encode_call("transfer(address,uint256)", AGENT, 1)) is None
+
+
+@given(calls=st_calls)
+@settings(max_examples=200)
+def test_script_round_trip(calls):
+    script = encode_script(calls)
+
+    assert decode_script(script) == calls
+    assert decode_script("0x" + script.hex()) == calls
+
+
+@given(target=st_address, calldata=st.binary(max_size=300), value=st.integers(0, 2 ** 256 - 1))
+@settings(max_examples=200)
+def test_agent_call_round_trip(target, calldata, value):
+    encoded = encode_agent_call(target, calldata, value)
+
+    assert encoded == encode_call(AGENT_EXECUTE_SIGNATURE, target, value, calldata)
+    assert decode_agent_call(encoded) == (target, value, calldata)
+
+
+@given(actions=st_calls)
+@settings(max_examples=100)
+def test_agent_script_round_trip(actions):
+    calls = decode_calls(encode_agent_script(AGENT, actions))
+
+    assert [(i["target"], i["calldata"]) for i in calls] == actions
+    assert all(i["agent"] == AGENT for i in calls)
+
+
+@given(actions=st_calls, metadata=st.text(max_size=50))
+@settings(max_examples=100)
+def test_forwarder_round_trip(actions, metadata):
+    script = encode_agent_script(AGENT, actions)
+    calls = decode_calls(wrap_forwarder(VOTING, script, metadata))
+
+    assert len(calls) == 1
+    assert calls[0]["target"] == VOTING
+    assert calls[0]["agent"] is None
+    assert [(i["target"], i["calldata"]) for i in calls[0]["script"]] == actions
@@ -0,0 +1,188 @@
+import pytest
+from hypothesis import settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, rule
+
+from scripts.models.fee_distributor import FeeDistributorModel
+from scripts.models.voting_escrow import Revert, VotingEscrowModel
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+ACCOUNTS = [f"0x{i:040x}" for i in range(1, 6)]
+ADMIN = ACCOUNTS[0]
+START_TIME = 1600000000
+
+st_account = st.sampled_from(ACCOUNTS)
+st_amount = st.integers(min_value=10 ** 18, max_value=10 ** 20)
+st_weeks = st.integers(min_value=1, max_value=12)
+st_time = st.integers(min_value=0, max_value=86400 * 3)
+st_iterations = st.integers(min_value=2, max_value=10)
+
+
+class ModelStateMachine(RuleBasedStateMachine):
+    """
+    Fuzz the distributor and voting escrow models together. Mirrors the rules of
+    `tests/integration/FeeDistributor/test_distribute_fees_stateful.py`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.timestamp = START_TIME
+        self.block = 1
+        self.voting_escrow = VotingEscrowModel(self.timestamp, self.block)
+        self.voting_escrow.create_lock(
+            ADMIN, 10 ** 25, self.timestamp + YEAR * 2, *self._next_block()
+        )
+        self.timestamp += WEEK
+        self.distributor = FeeDistributorModel(self.voting_escrow, self.timestamp, ADMIN)
+        self.total_fees = 0
+        self.claimed = {i: 0 for i in ACCOUNTS}
+
+    def _next_block(self, sleep=13):
+        self.timestamp += sleep
+        self.block += 1
+        return self.timestamp, self.block
+
+    def _check_active_lock(self, acct):
+        end = self.voting_escrow.locked__end(acct)
+        if end == 0:
+            return False
+        if end < self.timestamp:
+            self.voting_escrow.withdraw(acct, *self._next_block())
+            return False
+        return True
+
+    def _catch_up_total_supply(self):
+        # the total supply is checkpointed at most 20 weeks at a time - after a longer
+        # gap, claiming divides by the zero supply of weeks that were not checkpointed
+        while self.distributor.time_cursor + WEEK * 19 < self.timestamp:
+            self.distributor.checkpoint_total_supply(*self._next_block())
+
+    @initialize(st_amount=st_amount)
+    def initialize_fees(self, st_amount):
+        self.transfer_fees(st_amount, 0)
+
+    @rule(st_account=st_account, st_amount=st_amount, st_weeks=st_weeks, st_time=st_time)
+    def new_lock(self, st_account, st_amount, st_weeks, st_time):
+        timestamp, block = self._next_block(st_time)
+        if not self._check_active_lock(st_account):
+            until = (timestamp // WEEK + st_weeks) * WEEK
+            self.voting_escrow.create_lock(st_account, st_amount, until, *self._next_block())
+
+    @rule(st_account=st_account, st_amount=st_amount, st_time=st_time)
+    def increase_lock_amount(self, st_account, st_amount, st_time):
+        self._next_block(st_time)
+        if self._check_active_lock(st_account):
+            self.voting_escrow.increase_amount(st_account, st_amount, *self._next_block())
+
+    @rule(st_account=st_account, st_time=st_time)
+    def claim(self, st_account, st_time):
+        self._catch_up_total_supply()
+        self.claimed[st_account] += self.distributor.claim(st_account, *self._next_block(st_time))
+
+    @rule(st_accounts=st.lists(st_account, max_size=20), st_time=st_time)
+    def claim_many(self, st_accounts, st_time):
+        self._catch_up_total_supply()
+        amounts = self.distributor.claim_many(st_accounts, *self._next_block(st_time))
+        for acct, amount in zip(st_accounts, amounts):
+            self.claimed[acct] += amount
+
+    @rule(st_account=st_account, st_iterations=st_iterations, st_time=st_time)
+    def claim_partial(self, st_account, st_iterations, st_time):
+        # claim in small steps until nothing remains
+        self._catch_up_total_supply()
+        amount, remaining = self.distributor.claim_partial(
+            st_account, st_iterations, *self._next_block(st_time)
+        )
+        self.claimed[st_account] += amount
+        while remaining:
+            self._catch_up_total_supply()
+            amount, remaining = self.distributor.claim_partial(
+                st_account, st_iterations, *self._next_block()
+            )
+            self.claimed[st_account] += amount
+
+    @rule(st_amount=st_amount, st_time=st_time)
+    def transfer_fees(self, st_amount, st_time):
+        timestamp, block = self._next_block(st_time)
+        self.distributor.receive(st_amount)
+        self.total_fees += st_amount
+        if not self.distributor.can_checkpoint_token:
+            self.distributor.toggle_allow_checkpoint_token(ADMIN)
+            self.distributor.checkpoint_token(ADMIN, timestamp)
+
+    @rule(st_amount=st_amount, st_time=st_time)
+    def burn(self, st_amount, st_time):
+        self.distributor.burn(st_amount, self._next_block(st_time)[0])
+        self.total_fees += st_amount
+
+    @rule(st_account=st_account, st_time=st_time)
+    def checkpoint_token(self, st_account, st_time):
+        try:
+            self.distributor.checkpoint_token(st_account, self._next_block(st_time)[0])
+        except Revert:
+            assert st_account != ADMIN
+
+    @rule(st_time=st_time)
+    def checkpoint_total_supply(self, st_time):
+        self.distributor.checkpoint_total_supply(*self._next_block(st_time))
+
+    @rule(st_weeks=st.integers(min_value=1, max_value=4))
+    def advance_time(self, st_weeks):
+        self.timestamp += st_weeks * WEEK
+
+    @invariant()
+    def balances(self):
+        distributor = self.distributor
+        assert distributor.token_balance + sum(self.claimed.values()) == self.total_fees
+        assert distributor.token_last_balance <= distributor.token_balance
+        assert sum(distributor.tokens_per_week.values()) <= distributor.token_last_balance + sum(
+            self.claimed.values()
+        )
+
+    def teardown(self):
+        # two token checkpoints a week apart distribute everything received so far
+        self.distributor.checkpoint_token(ADMIN, self._next_block()[0])
+        self.timestamp += WEEK * 2
+        self.distributor.checkpoint_token(ADMIN, self._next_block()[0])
+
+        # accounts with a long history may need several claims
+        self._catch_up_total_supply()
+        for i in range(10):
+            for acct in ACCOUNTS:
+                self.claimed[acct] += self.distributor.claim(acct, *self._next_block())
+        self.balances()
+
+        weeks = range(self.distributor.start_time, self.timestamp, WEEK)
+        for acct in ACCOUNTS:
+            expected = 0
+            for week in weeks:
+                supply = self.distributor.ve_supply.get(week, 0)
+                if supply:
+                    tokens = self.distributor.tokens_per_week.get(week, 0)
+                    expected += tokens * self.distributor.ve_for_at(acct, week) // supply
+            assert self.claimed[acct] == expected
+
+        # everything distributed was claimed, except for rounding dust. fees received
+        # over more than 20 weeks without a token checkpoint are never distributed
+        distributed = sum(self.distributor.tokens_per_week.values())
+        assert 0 <= distributed - sum(self.claimed.values()) < 100 * len(weeks)
+
+
+TestModelStateMachine = ModelStateMachine.TestCase
+TestModelStateMachine.settings = settings(max_examples=200, stateful_step_count=50, deadline=None)
+
+
+def test_reverts():
+    voting_escrow = VotingEscrowModel(START_TIME, 1)
+    distributor = FeeDistributorModel(voting_escrow, START_TIME, ADMIN)
+
+    with pytest.raises(Revert):
+        distributor.checkpoint_token(ACCOUNTS[1], START_TIME + WEEK)
+    with pytest.raises(Revert):
+        distributor.toggle_allow_checkpoint_token(ACCOUNTS[1])
+
+    distributor.receive(10 ** 18)
+    assert distributor.kill_me(ADMIN) == 10 ** 18
+    with pytest.raises(Revert):
+        distributor.claim(ADMIN, START_TIME + WEEK, 2)
@@ -0,0 +1,88 @@
+import copy
+import random
+
+import pytest
+
+from scripts.models.liquidity_gauge import (
+    INITIAL_RATE,
+    WEEK,
+    YEAR,
+    CRVRateModel,
+    LiquidityGaugeModel,
+)
+from scripts.models.voting_escrow import MAXTIME, Revert, VotingEscrowModel
+
+ACCOUNTS = [f"0x{i:040x}" for i in range(1, 201)]
+START_TIME = 1600000000
+
+
+@pytest.fixture
+def voting_escrow():
+    return VotingEscrowModel(START_TIME, 1)
+
+
+@pytest.fixture
+def gauge(voting_escrow):
+    return LiquidityGaugeModel(CRVRateModel(START_TIME), 10 ** 18, voting_escrow, START_TIME)
+
+
+def test_rate_schedule():
+    crv = CRVRateModel(START_TIME)
+    assert crv.future_epoch_time_write(START_TIME) == START_TIME + 86400
+    assert crv.rate == 0
+
+    assert crv.future_epoch_time_write(START_TIME + 86400) == START_TIME + 86400 + YEAR
+    assert crv.rate == INITIAL_RATE
+
+    crv.future_epoch_time_write(START_TIME + 86400 + YEAR)
+    assert crv.mining_epoch == 1
+    assert crv.rate < INITIAL_RATE
+
+
+def test_single_user_receives_everything(gauge):
+    gauge.deposit(ACCOUNTS[0], 10 ** 18, START_TIME + 86400)
+    claimable = gauge.claimable_tokens(ACCOUNTS[0], START_TIME + 86400 + WEEK)
+
+    assert INITIAL_RATE * WEEK - claimable < 10 ** 6
+
+
+def test_boost(gauge, voting_escrow):
+    alice, bob = ACCOUNTS[:2]
+    voting_escrow.create_lock(alice, 10 ** 24, START_TIME + MAXTIME, START_TIME, 2)
+
+    gauge.deposit(alice, 10 ** 18, START_TIME)
+    gauge.deposit(bob, 10 ** 18, START_TIME)
+    assert gauge.boost(alice) == gauge.boost(bob) == 10 ** 18
+
+    # the boost only applies after the warmup period
+    gauge.user_checkpoint(alice, START_TIME + 3 * WEEK)
+    gauge.user_checkpoint(bob, START_TIME + 3 * WEEK)
+    assert gauge.boost(alice) == 25 * 10 ** 17
+    assert gauge.boost(bob) == 10 ** 18
+
+
+def test_withdraw_insufficient_balance(gauge):
+    gauge.deposit(ACCOUNTS[0], 10 ** 18, START_TIME)
+    with pytest.raises(Revert):
+        gauge.withdraw(ACCOUNTS[0], 10 ** 18 + 1, START_TIME + 1)
+
+
+def test_claimable_all(gauge, voting_escrow):
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    timestamp = START_TIME
+
+    for i in range(2000):
+        acct = rng.choice(ACCOUNTS)
+        timestamp += rng.randrange(1, 3600)
+        if i % 10 == 0 and voting_escrow.locked__end(acct) == 0:
+            unlock_time = timestamp + rng.randrange(1, 208) * WEEK
+            voting_escrow.create_lock(
+                acct, rng.randrange(1, 10 ** 24), unlock_time, timestamp, i + 2
+            )
+        gauge.deposit(acct, rng.randrange(0, 10 ** 21), timestamp)
+
+    timestamp += 10 * WEEK
+    claimable = copy.deepcopy(gauge).claimable_all(ACCOUNTS, timestamp)
+
+    assert list(claimable) == [gauge.claimable_tokens(i, timestamp) for i in ACCOUNTS]
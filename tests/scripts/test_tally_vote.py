@@ -0,0 +1,78 @@
+import pytest
+
+from scripts.voting.tally_vote import PCT_BASE, is_value_pct, tally, voting_powers
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, chain, token, voting_escrow):
+    for i, acct in enumerate(accounts[:6]):
+        if i:
+            token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+        token.approve(voting_escrow, 2 ** 256 - 1, {"from": acct})
+
+    for i, acct in enumerate(accounts[:5]):
+        voting_escrow.create_lock(
+            10 ** 21 * (i + 1), chain.time() + (i + 1) * YEAR // 2, {"from": acct}
+        )
+        chain.sleep(WEEK * 3 + i * 3600)
+        chain.mine()
+
+
+def test_matches_balance_of_at(accounts, chain, voting_escrow):
+    # checkpoints before and after each sampled block, so users have several points
+    blocks = []
+    for acct in accounts[:3]:
+        blocks.append(chain.height)
+        voting_escrow.increase_amount(10 ** 20, {"from": acct})
+        chain.sleep(WEEK * 2 + 1234)
+        chain.mine()
+    blocks.append(chain.height)
+    voting_escrow.checkpoint({"from": accounts[0]})
+
+    for block in blocks:
+        powers = voting_powers(voting_escrow, accounts[:6], block)
+        for acct in accounts[:6]:
+            assert powers[acct] == voting_escrow.balanceOfAt(acct, block)
+
+
+def test_expired_lock(accounts, chain, voting_escrow):
+    chain.sleep(YEAR)
+    chain.mine()
+    block = chain.height
+    voting_escrow.checkpoint({"from": accounts[0]})
+
+    powers = voting_powers(voting_escrow, accounts[:6], block)
+    assert powers[accounts[0]] == 0
+    for acct in accounts[:6]:
+        assert powers[acct] == voting_escrow.balanceOfAt(acct, block)
+
+
+def test_tally():
+    vote = {
+        "snapshotBlock": 1,
+        "votingPower": 1000,
+        "supportRequired": PCT_BASE // 2,
+        "minAcceptQuorum": PCT_BASE * 3 // 10,
+    }
+    powers = {"a": 300, "b": 200, "c": 100}
+
+    result = tally(vote, powers, {"a": True, "b": False, "c": True})
+    assert result["yea"] == 400
+    assert result["nay"] == 200
+    assert result["support"] == 400 * PCT_BASE // 600
+    assert result["quorum"] == 400 * PCT_BASE // 1000
+    assert result["passes"]
+
+    # Aragon requires percentages to be strictly above the threshold
+    result = tally(vote, powers, {"a": True, "b": False})
+    assert result["quorum"] == vote["minAcceptQuorum"]
+    assert not result["passes"]
+
+
+def test_is_value_pct():
+    assert not is_value_pct(0, 0, 0)
+    assert not is_value_pct(1, 2, PCT_BASE // 2)
+    assert is_value_pct(2, 3, PCT_BASE // 2)
@@ -0,0 +1,112 @@
+import pytest
+from hypothesis import settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, invariant, rule
+
+from scripts.models.voting_escrow import MAXTIME, WEEK, Revert, VotingEscrowModel
+
+ACCOUNTS = [f"0x{i:040x}" for i in range(1, 11)]
+START_TIME = 1600000000
+
+st_account = st.sampled_from(ACCOUNTS)
+st_value = st.integers(min_value=0, max_value=2 ** 64 - 1)
+st_lock_duration = st.integers(min_value=0, max_value=255)
+
+
+class ModelStateMachine(RuleBasedStateMachine):
+    """
+    Fuzz the model alone. Each action is mined in a new block, 13 seconds apart.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.timestamp = START_TIME
+        self.block = 1
+        self.model = VotingEscrowModel(self.timestamp, self.block)
+        self.amounts = {i: 0 for i in ACCOUNTS}
+        self.blocks = []
+
+    def _next_block(self):
+        self.timestamp += 13
+        self.block += 1
+        return self.timestamp, self.block
+
+    def _execute(self, fn, *args):
+        try:
+            fn(*args, *self._next_block())
+        except Revert:
+            return False
+        self.blocks.append(self.block)
+        return True
+
+    @rule(st_account=st_account, st_value=st_value, st_lock_duration=st_lock_duration)
+    def create_lock(self, st_account, st_value, st_lock_duration):
+        unlock_time = self.timestamp + st_lock_duration * WEEK
+        if self._execute(self.model.create_lock, st_account, st_value, unlock_time):
+            self.amounts[st_account] = st_value
+
+    @rule(st_account=st_account, st_value=st_value)
+    def increase_amount(self, st_account, st_value):
+        if self._execute(self.model.increase_amount, st_account, st_value):
+            self.amounts[st_account] += st_value
+
+    @rule(st_account=st_account, st_lock_duration=st_lock_duration)
+    def increase_unlock_time(self, st_account, st_lock_duration):
+        unlock_time = self.timestamp + st_lock_duration * WEEK
+        self._execute(self.model.increase_unlock_time, st_account, unlock_time)
+
+    @rule(st_account=st_account)
+    def withdraw(self, st_account):
+        if self._execute(self.model.withdraw, st_account):
+            self.amounts[st_account] = 0
+
+    @rule()
+    def checkpoint(self):
+        self._execute(self.model.checkpoint)
+
+    @rule(st_weeks=st.integers(min_value=1, max_value=4), st_extra=st.integers(0, WEEK))
+    def advance_time(self, st_weeks, st_extra):
+        self.timestamp += st_weeks * WEEK + st_extra
+
+    @invariant()
+    def supply(self):
+        assert self.model.supply == sum(self.amounts.values())
+
+    @invariant()
+    def current_balances(self):
+        balances = [self.model.balanceOf(i, self.timestamp) for i in ACCOUNTS]
+        for acct, balance in zip(ACCOUNTS, balances):
+            assert balance <= self.amounts[acct] // MAXTIME * MAXTIME
+        assert self.model.totalSupply(self.timestamp) == sum(balances)
+
+    @invariant()
+    def historic_balances(self):
+        if not self.blocks:
+            return
+        block = self.blocks[len(self.blocks) // 2]
+        args = (block, self.timestamp, self.block)
+        total = sum(self.model.balanceOfAt(i, *args) for i in ACCOUNTS)
+        assert self.model.totalSupplyAt(*args) == total
+
+
+TestModelStateMachine = ModelStateMachine.TestCase
+TestModelStateMachine.settings = settings(max_examples=200, stateful_step_count=50, deadline=None)
+
+
+def test_reverts():
+    model = VotingEscrowModel(START_TIME, 1)
+    acct = ACCOUNTS[0]
+
+    with pytest.raises(Revert, match="dev: need non-zero value"):
+        model.create_lock(acct, 0, START_TIME + WEEK * 2, START_TIME, 2)
+    with pytest.raises(Revert, match="Voting lock can be 4 years max"):
+        model.create_lock(acct, 10 ** 18, START_TIME + MAXTIME + WEEK, START_TIME, 2)
+
+    model.create_lock(acct, 10 ** 18, START_TIME + WEEK * 2, START_TIME, 2)
+    with pytest.raises(Revert, match="Withdraw old tokens first"):
+        model.create_lock(acct, 10 ** 18, START_TIME + WEEK * 2, START_TIME, 3)
+    with pytest.raises(Revert, match="The lock didn't expire"):
+        model.withdraw(acct, START_TIME + 13, 3)
+
+    assert model.withdraw(acct, START_TIME + WEEK * 3, 4) == 10 ** 18
+    assert model.balanceOf(acct, START_TIME + WEEK * 3) == 0
@@ -36,33 +36,56 @@ class ActionEnum(IntEnum):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def setup(accounts, gauge_controller, mock_lp_token, minter, token, voting_escrow):
-    # general test setup
-    token.set_minter(minter, {"from": accounts[0]})
-
-    while len(accounts) < USER_COUNT:
-        accounts.add()
-
-    for i in range(len(accounts)):
-        mock_lp_token.transfer(accounts[i], 10 ** 22, {"from": accounts[0]})
-        token.transfer(accounts[i], 10 ** 22, {"from": accounts[0]})
-        token.approve(voting_escrow, 10 ** 22, {"from": accounts[i]})
-        voting_escrow.create_lock(10 ** 22, chain.time() + 86400 * 365 * 2, {"from": accounts[i]})
-
-    for i in range(TYPE_COUNT):
-        gauge_controller.add_type(i, 10 ** 18, {"from": accounts[0]})
+def setup(accounts, chain_cache, gauge_controller, mock_lp_token, minter, token, voting_escrow):
+    # general test setup - the resulting chain state is cached between runs. caching
+    # requires anvil (`brownie test tests/test_scalability.py --network anvil`), with
+    # ganache-cli the 4000 setup transactions are replayed on every run
+    def _setup():
+        token.set_minter(minter, {"from": accounts[0]})
+
+        while len(accounts) < USER_COUNT:
+            accounts.add()
+
+        for i in range(len(accounts)):
+            mock_lp_token.transfer(accounts[i], 10 ** 22, {"from": accounts[0]})
+            token.transfer(accounts[i], 10 ** 22, {"from": accounts[0]})
+            token.approve(voting_escrow, 10 ** 22, {"from": accounts[i]})
+            voting_escrow.create_lock(
+                10 ** 22, chain.time() + 86400 * 365 * 2, {"from": accounts[i]}
+            )
+
+        for i in range(TYPE_COUNT):
+            gauge_controller.add_type(i, 10 ** 18, {"from": accounts[0]})
+
+    chain_cache.run(
+        "scalability-setup",
+        _setup,
+        [gauge_controller, mock_lp_token, minter, token, voting_escrow],
+        params=(USER_COUNT, TYPE_COUNT),
+    )
 
 
 @pytest.fixture(scope="module")
-def gauges(LiquidityGauge, accounts, gauge_controller, mock_lp_token, minter, setup):
+def gauges(LiquidityGauge, accounts, chain_cache, gauge_controller, mock_lp_token, minter, setup):
     # deploy `GAUGE_COUNT` liquidity gauges and return them as a list
-    gauges = []
-    for i in range(GAUGE_COUNT):
-        contract = LiquidityGauge.deploy(mock_lp_token, minter, accounts[0], {"from": accounts[0]})
-        gauge_controller.add_gauge(contract, i % TYPE_COUNT, {"from": accounts[0]})
-        gauges.append(contract)
-
-    yield gauges
+    def _deploy():
+        gauges = []
+        for i in range(GAUGE_COUNT):
+            contract = LiquidityGauge.deploy(
+                mock_lp_token, minter, accounts[0], {"from": accounts[0]}
+            )
+            gauge_controller.add_gauge(contract, i % TYPE_COUNT, {"from": accounts[0]})
+            gauges.append(contract)
+        return gauges
+
+    yield chain_cache.run(
+        "scalability-gauges",
+        _deploy,
+        [gauge_controller, mock_lp_token, minter],
+        [LiquidityGauge],
+        GAUGE_COUNT,
+        after=["scalability-setup"],
+    )
 
 
 @given(st_actions=strategy(f"uint[{GAUGE_COUNT}]", max_value=GAUGE_COUNT, unique=True))
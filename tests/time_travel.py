@@ -0,0 +1,90 @@
+import requests
+from brownie import chain, web3
+
+_anvil = None
+
+
+def _is_anvil():
+    global _anvil
+    if _anvil is None:
+        _anvil = "result" in web3.provider.make_request("anvil_nodeInfo", [])
+    return _anvil
+
+
+def advance(seconds, blocks=1):
+    """
+    Advance the chain by `seconds`, mining `blocks` blocks at equal intervals.
+
+    Equivalent to calling `chain.sleep(seconds // blocks); chain.mine()` once for every
+    block, but with a constant number of RPC calls on clients that can mine many blocks
+    at once (`anvil_mine`). With other clients each block is still mined separately, but
+    the per-block sleep and snapshot calls are avoided.
+
+    Arguments
+    ---------
+    seconds : int
+        Time to advance the chain by.
+    blocks : int
+        Number of blocks to mine. The last block is mined `seconds` from now.
+    """
+    interval = seconds // blocks
+    timestamp = chain.time() + interval * blocks
+    if blocks > 1 and _is_anvil():
+        web3.provider.make_request("anvil_mine", [hex(blocks - 1), hex(interval)])
+        chain.mine(timestamp=timestamp)
+    else:
+        chain.sleep(interval)
+        chain.mine(blocks, timestamp=timestamp)
+
+
+def batch_call(calls, block_identifier="latest"):
+    """
+    Execute many contract calls in a single JSON-RPC batch request.
+
+    Arguments
+    ---------
+    calls : list
+        List of `(method, args)` tuples, e.g. `(voting_escrow.balanceOf, (alice, t))`.
+        Overloaded methods are resolved by the number of arguments.
+    block_identifier : int | str
+        Block to execute every call at.
+
+    Returns
+    -------
+    list
+        Decoded return values, in the same order as `calls`.
+    """
+    if isinstance(block_identifier, int):
+        block_identifier = hex(block_identifier)
+
+    methods = []
+    payload = []
+    for i, (method, args) in enumerate(calls):
+        if hasattr(method, "_get_fn_from_args"):
+            method = method._get_fn_from_args(args)
+        methods.append(method)
+        tx = {"to": method._address, "data": method.encode_input(*args)}
+        payload.append(
+            {"jsonrpc": "2.0", "id": i, "method": "eth_call", "params": [tx, block_identifier]}
+        )
+
+    if not payload:
+        return []
+    response = requests.post(web3.provider.endpoint_uri, json=payload).json()
+
+    results = []
+    for method, result in zip(methods, sorted(response, key=lambda k: k["id"])):
+        if "error" in result:
+            raise ValueError(result["error"])
+        results.append(method.decode_output(result["result"]))
+    return results
+
+
+def sample(method, args, timestamps):
+    """
+    Call `method(*args, t)` for every `t` in `timestamps`, in a single batch request.
+
+    Useful for views taking a timestamp argument, such as `VotingEscrow.balanceOf` or
+    `GaugeController.gauge_relative_weight`.
+    """
+    return batch_call([(method, tuple(args) + (t,)) for t in timestamps])
@@ -1,5 +1,8 @@
+import brownie
 from brownie import ZERO_ADDRESS
 
+from scripts.address_list import encode_addresses
+
 WEEK = 86400 * 7
 
 
@@ -60,3 +63,40 @@ def test_claim_many_same_account(
     fee_distributor.claim_many([alice] * 20, {"from": alice})
 
     assert coin_a.balanceOf(alice) == expected
+
+
+def test_claim_list(alice, bob, charlie, chain, voting_escrow, fee_distributor, coin_a, token):
+    amount = 1000 * 10 ** 18
+
+    for acct in (alice, bob, charlie):
+        token.approve(voting_escrow, amount * 10, {"from": acct})
+        token.transfer(acct, amount, {"from": alice})
+        voting_escrow.create_lock(amount, chain.time() + 8 * WEEK, {"from": acct})
+
+    chain.sleep(WEEK)
+    chain.mine()
+    start_time = int(chain.time())
+    chain.sleep(WEEK * 5)
+
+    fee_distributor = fee_distributor(t=start_time)
+    coin_a._mint_for_testing(10 ** 19, {"from": fee_distributor})
+    fee_distributor.checkpoint_token()
+    chain.sleep(WEEK)
+    fee_distributor.checkpoint_token()
+
+    fee_distributor.claim_list(encode_addresses([alice, bob, charlie]), {"from": alice})
+
+    balances = [coin_a.balanceOf(i) for i in (alice, bob, charlie)]
+    chain.undo()
+
+    fee_distributor.claim_many([alice, bob, charlie] + [ZERO_ADDRESS] * 17, {"from": alice})
+
+    assert balances == [coin_a.balanceOf(i) for i in (alice, bob, charlie)]
+    assert sum(balances) > 0
+
+
+def test_claim_list_invalid(alice, fee_distributor):
+    fee_distributor = fee_distributor()
+
+    with brownie.reverts("dev: invalid address list"):
+        fee_distributor.claim_list(encode_addresses([alice]) + b"\x00", {"from": alice})
@@ -0,0 +1,79 @@
+import brownie
+import pytest
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def distributor(alice, bob, chain, voting_escrow, fee_distributor, coin_a, token):
+    amount = 1000 * 10 ** 18
+    start_time = int(chain.time())
+
+    # a long history of user points, so that claiming takes several calls
+    for acct in (alice, bob):
+        token.approve(voting_escrow, amount * 100, {"from": acct})
+        token.transfer(acct, amount * 50, {"from": alice})
+    voting_escrow.create_lock(amount, chain.time() + 40 * WEEK, {"from": alice})
+    voting_escrow.create_lock(amount, chain.time() + 10 * WEEK, {"from": bob})
+    for i in range(30):
+        chain.sleep(WEEK)
+        voting_escrow.increase_amount(amount, {"from": alice})
+
+    distributor = fee_distributor(t=start_time)
+    coin_a._mint_for_testing(10 ** 22, {"from": distributor})
+    distributor.checkpoint_token()
+    distributor.checkpoint_total_supply()
+    distributor.checkpoint_total_supply()
+    chain.sleep(WEEK)
+    distributor.checkpoint_token()
+
+    yield distributor
+
+
+@pytest.mark.parametrize("max_iterations", [2, 7, 50, 500])
+def test_claim_calls(alice, bob, distributor, max_iterations):
+    for acct in (alice, bob):
+        calls = distributor.claim_calls(acct, max_iterations)
+
+        for i in range(calls - 1):
+            assert distributor.claim_partial(acct, max_iterations, {"from": acct}).return_value
+        assert not distributor.claim_partial(acct, max_iterations, {"from": acct}).return_value
+
+        assert distributor.claim_calls(acct, max_iterations) == 0
+
+
+def test_default_is_claim(alice, distributor):
+    calls = distributor.claim_calls(alice)
+    assert calls == distributor.claim_calls(alice, 50) > 1
+
+    for i in range(calls):
+        distributor.claim({"from": alice})
+
+    assert distributor.claim_calls(alice) == 0
+
+
+@pytest.mark.parametrize("max_iterations", [2, 7, 500])
+def test_same_as_claim(alice, chain, distributor, coin_a, max_iterations):
+    calls = distributor.claim_calls(alice, max_iterations)
+    for i in range(calls):
+        distributor.claim_partial(alice, max_iterations, {"from": alice})
+    amount = coin_a.balanceOf(alice)
+    chain.undo(calls)
+
+    for i in range(distributor.claim_calls(alice)):
+        distributor.claim({"from": alice})
+
+    assert coin_a.balanceOf(alice) == amount > 0
+
+
+def test_no_lock(charlie, distributor):
+    assert distributor.claim_calls(charlie, 10) == 0
+    assert not distributor.claim_partial(charlie, 10, {"from": charlie}).return_value
+
+
+@pytest.mark.parametrize("max_iterations", [0, 1])
+def test_too_few_iterations(alice, distributor, max_iterations):
+    with brownie.reverts():
+        distributor.claim_calls(alice, max_iterations)
+    with brownie.reverts():
+        distributor.claim_partial(alice, max_iterations, {"from": alice})
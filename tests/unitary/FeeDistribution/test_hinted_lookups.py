@@ -0,0 +1,67 @@
+import pytest
+
+from scripts.epoch_hints import total_supply_epochs, user_timestamp_epoch
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def distributors(accounts, chain, fee_distributor, voting_escrow, token):
+    # two identical distributors, to compare hinted and unhinted checkpoints
+    start_time = chain.time()
+    distributors = [fee_distributor(start_time), fee_distributor(start_time)]
+
+    for acct in accounts[:3]:
+        if acct != accounts[0]:
+            token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+        token.approve(voting_escrow, 2 ** 256 - 1, {"from": acct})
+
+    for i, acct in enumerate(accounts[:3]):
+        voting_escrow.create_lock(10 ** 21, chain.time() + WEEK * (i + 5), {"from": acct})
+        chain.sleep(WEEK + 86400 * i)
+    for i in range(4):
+        voting_escrow.increase_amount(10 ** 18, {"from": accounts[i % 3]})
+        chain.sleep(WEEK * 2)
+    chain.mine()
+
+    yield distributors
+
+
+@pytest.fixture(scope="module")
+def distributor(distributors):
+    yield distributors[0]
+
+
+@pytest.mark.parametrize("offset", [0, -1, 1, 10 ** 9])
+def test_ve_for_at(accounts, chain, distributor, voting_escrow, offset):
+    for timestamp in range(distributor.start_time(), chain.time(), 86400 * 3):
+        for acct in accounts[:4]:
+            hint = max(user_timestamp_epoch(voting_escrow, acct, timestamp) + offset, 0)
+            assert distributor.ve_for_at_hinted(acct, timestamp, hint) == distributor.ve_for_at(
+                acct, timestamp
+            )
+
+
+@pytest.mark.parametrize("offset", [0, 1, 10 ** 9])
+def test_checkpoint_total_supply(accounts, chain, distributors, voting_escrow, offset):
+    start_time = distributors[0].start_time()
+    weeks = (chain.time() - start_time) // WEEK + 1
+
+    hints = total_supply_epochs(distributors[1], voting_escrow, chain.time())
+    distributors[0].checkpoint_total_supply({"from": accounts[0]})
+    distributors[1].checkpoint_total_supply_hinted(
+        [i + offset for i in hints], {"from": accounts[0]}
+    )
+
+    for i in range(weeks):
+        week = start_time + i * WEEK
+        assert distributors[1].ve_supply(week) == distributors[0].ve_supply(week)
+    assert distributors[1].time_cursor() == distributors[0].time_cursor()
+
+
+def test_hints_save_gas(accounts, chain, distributors, voting_escrow):
+    hints = total_supply_epochs(distributors[1], voting_escrow, chain.time())
+    tx = distributors[0].checkpoint_total_supply({"from": accounts[0]})
+    tx_hinted = distributors[1].checkpoint_total_supply_hinted(hints, {"from": accounts[0]})
+
+    assert tx_hinted.gas_used < tx.gas_used
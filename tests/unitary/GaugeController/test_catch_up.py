@@ -0,0 +1,97 @@
+import pytest
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+STALE_WEEKS = 12
+
+
+@pytest.fixture(scope="module")
+def controllers(GaugeController, accounts, chain, token, voting_escrow, three_gauges):
+    # two identical controllers, to compare bounded and unbounded checkpoints
+    controllers = [
+        GaugeController.deploy(token, voting_escrow, {"from": accounts[0]}) for i in range(2)
+    ]
+
+    token.approve(voting_escrow, 10 ** 24, {"from": accounts[0]})
+    voting_escrow.create_lock(10 ** 24, chain.time() + YEAR, {"from": accounts[0]})
+    for gauge_controller in controllers:
+        gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+        gauge_controller.add_type(b"Insurance", 2 * 10 ** 18, {"from": accounts[0]})
+        for i, gauge in enumerate(three_gauges):
+            gauge_controller.add_gauge(gauge, i % 2, 10 ** 18, {"from": accounts[0]})
+        gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+
+    yield controllers
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stale(chain, controllers):
+    chain.sleep(STALE_WEEKS * WEEK)
+    chain.mine()
+
+
+def _weeks(chain, gauge_controller, three_gauges):
+    start = gauge_controller.tx.timestamp // WEEK * WEEK
+    data = []
+    for t in range(start, chain.time() + 2 * WEEK, WEEK):
+        data.append(gauge_controller.points_total(t))
+        for i in range(2):
+            data += list(gauge_controller.points_sum(i, t))
+            data.append(gauge_controller.points_type_weight(i, t))
+        for gauge in three_gauges:
+            data += list(gauge_controller.points_weight(gauge, t))
+    return data
+
+
+def test_catch_up_bounded(chain, accounts, controllers):
+    gauge_controller = controllers[1]
+    time_total = gauge_controller.time_total()
+
+    gauge_controller.catch_up(5, {"from": accounts[0]})
+
+    assert gauge_controller.time_total() == time_total + 5 * WEEK
+    for i in range(2):
+        assert gauge_controller.time_sum(i) == time_total + 5 * WEEK
+        assert gauge_controller.time_type_weight(i) == time_total + 5 * WEEK
+
+
+def test_catch_up_gauge_bounded(chain, accounts, controllers, three_gauges):
+    gauge_controller = controllers[1]
+    time_total = gauge_controller.time_total()
+    time_weight = gauge_controller.time_weight(three_gauges[0])
+
+    gauge_controller.catch_up_gauge(three_gauges[0], 5, {"from": accounts[0]})
+
+    assert gauge_controller.time_weight(three_gauges[0]) == time_weight + 5 * WEEK
+    assert gauge_controller.time_weight(three_gauges[1]) == time_weight
+    assert gauge_controller.time_total() == time_total
+
+
+def test_catch_up_zero_weeks(chain, accounts, controllers):
+    gauge_controller = controllers[1]
+    time_total = gauge_controller.time_total()
+
+    gauge_controller.catch_up(0, {"from": accounts[0]})
+
+    assert gauge_controller.time_total() == time_total
+
+
+@pytest.mark.parametrize("max_weeks", [1, 5, 13])
+def test_same_as_checkpoint(chain, accounts, controllers, three_gauges, max_weeks):
+    for gauge in three_gauges:
+        controllers[0].checkpoint_gauge(gauge, {"from": accounts[0]})
+
+    while controllers[1].time_total() <= chain.time():
+        controllers[1].catch_up(max_weeks, {"from": accounts[0]})
+    for gauge in three_gauges:
+        while controllers[1].time_weight(gauge) <= chain.time():
+            controllers[1].catch_up_gauge(gauge, max_weeks, {"from": accounts[0]})
+
+    assert _weeks(chain, controllers[1], three_gauges) == _weeks(
+        chain, controllers[0], three_gauges
+    )
+    assert controllers[1].time_total() == controllers[0].time_total()
+    for gauge in three_gauges:
+        assert controllers[1].gauge_relative_weight(gauge) == controllers[0].gauge_relative_weight(
+            gauge
+        )
@@ -0,0 +1,69 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+TYPES = 5
+
+
+def _add_type_with_gauge(accounts, gauge_controller, weight):
+    # type 0 is added by the conftest, so the new type id is the current type count
+    type_id = gauge_controller.n_gauge_types()
+    gauge_controller.add_type(f"Type {type_id}", weight, {"from": accounts[0]})
+    gauge_controller.add_gauge(f"0x{type_id:040x}", type_id, 10 ** 18, {"from": accounts[0]})
+    return f"0x{type_id:040x}"
+
+
+@pytest.fixture(scope="module")
+def gauges(accounts, gauge_controller):
+    yield [
+        _add_type_with_gauge(accounts, gauge_controller, (i + 1) * 10 ** 18) for i in range(TYPES)
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, chain, gauges, voting_escrow, token):
+    for acct in accounts[:3]:
+        if acct != accounts[0]:
+            token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+        token.approve(voting_escrow, 10 ** 24, {"from": acct})
+        voting_escrow.create_lock(10 ** 23, chain.time() + YEAR, {"from": acct})
+
+
+def _expected_total(gauge_controller, time):
+    return sum(
+        gauge_controller.points_sum(i, time)["bias"] * gauge_controller.points_type_weight(i, time)
+        for i in range(gauge_controller.n_gauge_types())
+    )
+
+
+@pytest.mark.parametrize("sleep", [0, WEEK, 3 * WEEK])
+def test_total_after_changes(accounts, chain, gauge_controller, gauges, sleep):
+    chain.sleep(sleep)
+    next_time = (chain.time() + WEEK) // WEEK * WEEK
+
+    gauge_controller.vote_for_gauge_weights(gauges[0], 5000, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(gauges[3], 5000, {"from": accounts[0]})
+    gauge_controller.vote_for_many_gauge_weights(
+        gauges[1:4] + [ZERO_ADDRESS] * 17, [2000, 3000, 5000] + [0] * 17, {"from": accounts[1]}
+    )
+    gauge_controller.change_gauge_weight(gauges[4], 3 * 10 ** 18, {"from": accounts[0]})
+    gauge_controller.change_type_weight(2, 10 ** 17, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(gauges[2], 10000, {"from": accounts[2]})
+    gauge_controller.checkpoint({"from": accounts[0]})
+
+    assert gauge_controller.time_total() == next_time
+    assert gauge_controller.points_total(next_time) == _expected_total(gauge_controller, next_time)
+
+
+def test_vote_gas_independent_of_types(accounts, chain, gauge_controller, gauges):
+    gauge_controller.checkpoint({"from": accounts[0]})
+    tx = gauge_controller.vote_for_gauge_weights(gauges[0], 5000, {"from": accounts[0]})
+
+    for i in range(TYPES * 3):
+        _add_type_with_gauge(accounts, gauge_controller, 10 ** 18)
+    # an identical vote from an identical lock, for a gauge of another type
+    tx_more_types = gauge_controller.vote_for_gauge_weights(gauges[1], 5000, {"from": accounts[1]})
+
+    # recomputing the total from every type would cost thousands of gas per added type
+    assert abs(tx_more_types.gas_used - tx.gas_used) < 500
@@ -0,0 +1,126 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def gauge_vote_setup(accounts, chain, gauge_controller, three_gauges, voting_escrow, token):
+    gauge_controller.add_type(b"Insurance", {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[0], 0, {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[1], 1, {"from": accounts[0]})
+
+    # two identical locks, so that both accounts have the same voting power
+    unlock_time = chain.time() + YEAR
+    for acct in accounts[:2]:
+        token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+        token.approve(voting_escrow, 10 ** 24, {"from": acct})
+        voting_escrow.create_lock(10 ** 24, unlock_time, {"from": acct})
+
+
+def _pad(gauges, weights):
+    padding = 20 - len(gauges)
+    return list(gauges) + [ZERO_ADDRESS] * padding, list(weights) + [0] * padding
+
+
+def _weights(gauge_controller, gauges, time):
+    # biases and slopes of the gauge weights and type sums, and the total weight
+    points = [gauge_controller.points_weight(i, time) for i in gauges]
+    points += [gauge_controller.points_sum(i, time) for i in range(2)]
+    return [i for point in points for i in point] + [gauge_controller.points_total(time)]
+
+
+def test_vote_many(accounts, gauge_controller, three_gauges):
+    gauge_controller.vote_for_many_gauge_weights(
+        *_pad(three_gauges[:2], [4000, 6000]), {"from": accounts[0]}
+    )
+
+    assert gauge_controller.vote_user_power(accounts[0]) == 10000
+    assert gauge_controller.vote_user_slopes(accounts[0], three_gauges[0])["power"] == 4000
+    assert gauge_controller.vote_user_slopes(accounts[0], three_gauges[1])["power"] == 6000
+
+
+def test_same_as_single_votes(chain, accounts, gauge_controller, three_gauges):
+    chain.sleep(WEEK - chain.time() % WEEK + 3600)
+    next_time = (chain.time() + WEEK) // WEEK * WEEK
+    gauges = three_gauges[:2]
+    initial = _weights(gauge_controller, gauges, next_time)
+
+    gauge_controller.vote_for_gauge_weights(gauges[0], 4000, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(gauges[1], 6000, {"from": accounts[0]})
+    single = _weights(gauge_controller, gauges, next_time)
+
+    gauge_controller.vote_for_many_gauge_weights(*_pad(gauges, [4000, 6000]), {"from": accounts[1]})
+    batch = _weights(gauge_controller, gauges, next_time)
+
+    for gauge in gauges:
+        assert gauge_controller.vote_user_slopes(
+            accounts[0], gauge
+        ) == gauge_controller.vote_user_slopes(accounts[1], gauge)
+    for before, after_single, after_batch in zip(initial, single, batch):
+        assert after_batch - after_single == after_single - before
+
+
+def test_move_power(chain, accounts, gauge_controller, three_gauges):
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+    chain.sleep(10 * 86400)
+
+    # power is only checked after every vote is applied
+    gauge_controller.vote_for_many_gauge_weights(
+        *_pad(three_gauges[1::-1], [10000, 0]), {"from": accounts[0]}
+    )
+
+    assert gauge_controller.vote_user_power(accounts[0]) == 10000
+    assert gauge_controller.vote_user_slopes(accounts[0], three_gauges[0])["power"] == 0
+
+
+def test_empty(accounts, gauge_controller):
+    gauge_controller.vote_for_many_gauge_weights(*_pad([], []), {"from": accounts[0]})
+
+    assert gauge_controller.vote_user_power(accounts[0]) == 0
+
+
+def test_stops_at_zero_address(accounts, gauge_controller, three_gauges):
+    gauges, weights = _pad(three_gauges[:1], [4000])
+    gauges[2] = three_gauges[1]
+    weights[2] = 6000
+    gauge_controller.vote_for_many_gauge_weights(gauges, weights, {"from": accounts[0]})
+
+    assert gauge_controller.vote_user_power(accounts[0]) == 4000
+
+
+def test_over_weight(accounts, gauge_controller, three_gauges):
+    with brownie.reverts("Used too much power"):
+        gauge_controller.vote_for_many_gauge_weights(
+            *_pad(three_gauges[:2], [6000, 6000]), {"from": accounts[0]}
+        )
+
+
+def test_over_user_weight(accounts, gauge_controller, three_gauges):
+    with brownie.reverts("You used all your voting power"):
+        gauge_controller.vote_for_many_gauge_weights(
+            *_pad(three_gauges[:1], [10001]), {"from": accounts[0]}
+        )
+
+
+def test_same_gauge_twice(accounts, gauge_controller, three_gauges):
+    with brownie.reverts("Cannot vote so often"):
+        gauge_controller.vote_for_many_gauge_weights(
+            *_pad([three_gauges[0]] * 2, [1000, 1000]), {"from": accounts[0]}
+        )
+
+
+def test_invalid_gauge_id(accounts, gauge_controller, three_gauges):
+    with brownie.reverts("Gauge not added"):
+        gauge_controller.vote_for_many_gauge_weights(
+            *_pad(three_gauges[:3], [1000, 1000, 1000]), {"from": accounts[0]}
+        )
+
+
+def test_no_balance(accounts, gauge_controller, three_gauges):
+    with brownie.reverts("Your token lock expires too soon"):
+        gauge_controller.vote_for_many_gauge_weights(
+            *_pad(three_gauges[:1], [10000]), {"from": accounts[2]}
+        )
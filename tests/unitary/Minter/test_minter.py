@@ -2,6 +2,9 @@ import itertools
 
 import brownie
 import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts.address_list import encode_addresses
 
 TYPE_WEIGHTS = [5e17, 1e19]
 GAUGE_WEIGHTS = [1e19, 1e18, 5e17]
@@ -94,6 +97,38 @@ def test_mint_multiple_gauges(accounts, chain, three_gauges, minter, token):
     assert token.balanceOf(accounts[1]) == total_minted
 
 
+def test_mint_list(accounts, chain, three_gauges, minter, token):
+    for i in range(3):
+        three_gauges[i].deposit((i + 1) * 10 ** 17, {"from": accounts[1]})
+
+    chain.sleep(MONTH)
+    minter.mint_list(encode_addresses(three_gauges), {"from": accounts[1]})
+
+    total_minted = 0
+    for gauge in three_gauges:
+        minted = minter.minted(accounts[1], gauge)
+        assert minted == gauge.integrate_fraction(accounts[1]) > 0
+        total_minted += minted
+
+    assert token.balanceOf(accounts[1]) == total_minted
+
+
+def test_mint_list_same_as_mint_many(accounts, chain, three_gauges, minter, token):
+    for acct in accounts[1:3]:
+        three_gauges[0].deposit(10 ** 17, {"from": acct})
+        three_gauges[2].deposit(10 ** 17, {"from": acct})
+
+    chain.sleep(MONTH)
+    chain.mine()
+    gauges = [three_gauges[0], three_gauges[2]]
+    minter.mint_many(gauges + [ZERO_ADDRESS] * 6, {"from": accounts[1]})
+    minter.mint_list(encode_addresses(gauges), {"from": accounts[2]})
+
+    for gauge in gauges:
+        assert gauge.integrate_fraction(accounts[1]) == minter.minted(accounts[1], gauge)
+        assert gauge.integrate_fraction(accounts[2]) == minter.minted(accounts[2], gauge)
+
+
 def test_mint_after_withdraw(accounts, chain, three_gauges, minter, token):
     three_gauges[0].deposit(1e18, {"from": accounts[1]})
 
@@ -141,6 +176,11 @@ def test_mint_not_a_gauge(accounts, minter):
         minter.mint(accounts[1], {"from": accounts[0]})
 
 
+def test_mint_list_not_a_gauge(accounts, minter, three_gauges):
+    with brownie.reverts("dev: gauge is not added"):
+        minter.mint_list(encode_addresses([three_gauges[0], accounts[1]]), {"from": accounts[0]})
+
+
 def test_mint_before_inflation_begins(accounts, chain, three_gauges, minter, token):
     three_gauges[0].deposit(1e18, {"from": accounts[1]})
 
@@ -1,6 +1,8 @@
 import brownie
 import pytest
 
+from scripts.address_list import encode_addresses
+
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
 
@@ -127,6 +129,14 @@ def test_withdraw_many(accounts, pool_proxy, owner_pool):
     assert pool_proxy.balance() == 31337
 
 
+def test_withdraw_list(accounts, pool_proxy, owner_pool):
+    accounts[0].transfer(owner_pool, 31337)
+    pool_proxy.withdraw_list(encode_addresses([owner_pool] * 25), {"from": accounts[0]})
+
+    assert owner_pool.withdrawn() == 25
+    assert pool_proxy.balance() == 31337
+
+
 @pytest.mark.parametrize("idx", range(1, 4))
 def test_set_burner_no_access(accounts, pool_proxy, token, idx):
     with brownie.reverts("Access denied"):
@@ -1,6 +1,8 @@
 import brownie
 import pytest
 
+from scripts.address_list import encode_addresses
+
 ETH_ADDRESS = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
@@ -56,6 +58,24 @@ def test_burn_many(accounts, pool_proxy, burner, coin_a, idx):
     assert burner.balance() == 31337
 
 
+@pytest.mark.parametrize("idx", range(2))
+def test_burn_list(accounts, pool_proxy, burner, coin_a, idx):
+    pool_proxy.burn_list(encode_addresses([coin_a, ETH_ADDRESS]), {"from": accounts[idx]})
+
+    assert burner.is_burned(coin_a)
+    assert burner.is_burned(ETH_ADDRESS)
+
+    assert pool_proxy.balance() == 0
+    assert burner.balance() == 31337
+
+
+def test_burn_list_empty(accounts, pool_proxy, burner, coin_a):
+    pool_proxy.burn_list(b"", {"from": accounts[0]})
+
+    assert not burner.is_burned(coin_a)
+    assert pool_proxy.balance() == 31337
+
+
 def test_burn_not_exists(accounts, pool_proxy):
     with brownie.reverts("dev: should implement burn()"):
         pool_proxy.burn(accounts[1], {"from": accounts[0]})
@@ -66,3 +86,15 @@ def test_burn_many_not_exists(accounts, pool_proxy, burner, coin_a):
         pool_proxy.burn_many(
             [coin_a, ETH_ADDRESS, accounts[1]] + [ZERO_ADDRESS] * 17, {"from": accounts[0]},
         )
+
+
+def test_burn_list_not_exists(accounts, pool_proxy, burner, coin_a):
+    with brownie.reverts("dev: should implement burn()"):
+        pool_proxy.burn_list(
+            encode_addresses([coin_a, ETH_ADDRESS, accounts[1]]), {"from": accounts[0]}
+        )
+
+
+def test_burn_list_invalid(accounts, pool_proxy, burner, coin_a):
+    with brownie.reverts("dev: invalid address list"):
+        pool_proxy.burn_list(encode_addresses([coin_a])[:-1], {"from": accounts[0]})
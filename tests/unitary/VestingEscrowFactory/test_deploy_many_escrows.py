@@ -0,0 +1,99 @@
+import brownie
+import pytest
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+AMOUNTS = [10 ** 17 * i for i in range(1, 33)]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def initial_funding(coin_a, vesting_factory, accounts):
+    coin_a._mint_for_testing(10 ** 21, {"from": accounts[0]})
+    coin_a.transfer(vesting_factory, 10 ** 21, {"from": accounts[0]})
+
+
+def test_admin_only(accounts, vesting_factory, coin_a):
+    with brownie.reverts("dev: admin only"):
+        vesting_factory.deploy_many_vesting_contracts(
+            coin_a, accounts[:32], AMOUNTS, True, 86400 * 365, {"from": accounts[1]}
+        )
+
+
+def test_start_too_soon(accounts, chain, vesting_factory, coin_a):
+    with brownie.reverts("dev: start time too soon"):
+        vesting_factory.deploy_many_vesting_contracts(
+            coin_a,
+            accounts[:32],
+            AMOUNTS,
+            True,
+            86400 * 365,
+            chain.time() - 1,
+            {"from": accounts[0]},
+        )
+
+
+def test_duration_too_short(accounts, vesting_factory, coin_a):
+    with brownie.reverts("dev: duration too short"):
+        vesting_factory.deploy_many_vesting_contracts(
+            coin_a, accounts[:32], AMOUNTS, True, 86400 * 365 - 1, {"from": accounts[0]}
+        )
+
+
+def test_deploys(VestingEscrowSimple, accounts, vesting_factory, coin_a):
+    tx = vesting_factory.deploy_many_vesting_contracts(
+        coin_a, accounts[:32], AMOUNTS, True, 86400 * 365, {"from": accounts[0]}
+    )
+
+    assert tx.return_value == 32
+    assert len(tx.new_contracts) == 32
+    for addr, acct, amount in zip(tx.new_contracts, accounts, AMOUNTS):
+        escrow = VestingEscrowSimple.at(addr)
+        assert escrow.initial_locked(acct) == amount
+        assert coin_a.balanceOf(escrow) == amount
+
+
+def test_partial_recipients(accounts, vesting_factory, coin_a):
+    recipients = accounts[:5] + [ZERO_ADDRESS] * 27
+    tx = vesting_factory.deploy_many_vesting_contracts(
+        coin_a, recipients, AMOUNTS, True, 86400 * 365, {"from": accounts[0]}
+    )
+
+    assert tx.return_value == 5
+    assert len(tx.new_contracts) == 5
+    assert coin_a.balanceOf(vesting_factory) == 10 ** 21 - sum(AMOUNTS[:5])
+
+
+def test_start_and_duration(VestingEscrowSimple, accounts, chain, vesting_factory, coin_a):
+    start_time = chain.time() + 100
+
+    tx = vesting_factory.deploy_many_vesting_contracts(
+        coin_a, accounts[:32], AMOUNTS, False, 86400 * 700, start_time, {"from": accounts[0]},
+    )
+
+    for addr in tx.new_contracts:
+        escrow = VestingEscrowSimple.at(addr)
+        assert escrow.start_time() == start_time
+        assert escrow.end_time() == start_time + 86400 * 700
+        assert escrow.can_disable() is False
+        assert escrow.admin() == accounts[0]
+
+
+def test_insufficient_balance(accounts, vesting_factory, coin_a):
+    amounts = [10 ** 21] * 2 + [0] * 30
+    with brownie.reverts():
+        vesting_factory.deploy_many_vesting_contracts(
+            coin_a, accounts[:32], amounts, True, 86400 * 365, {"from": accounts[0]}
+        )
+
+
+def test_batch_cheaper_per_escrow(accounts, chain, vesting_factory, coin_a):
+    tx = vesting_factory.deploy_vesting_contract(
+        coin_a, accounts[1], AMOUNTS[0], True, 86400 * 365, {"from": accounts[0]}
+    )
+    single_gas = tx.gas_used
+    chain.undo()
+
+    tx = vesting_factory.deploy_many_vesting_contracts(
+        coin_a, accounts[:32], AMOUNTS, True, 86400 * 365, {"from": accounts[0]}
+    )
+
+    assert tx.gas_used // 32 < single_gas
@@ -0,0 +1,59 @@
+import pytest
+
+from scripts.epoch_hints import block_epoch, user_block_epoch
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, chain, token, voting_escrow):
+    for acct in accounts[:3]:
+        if acct != accounts[0]:
+            token.transfer(acct, 10 ** 24, {"from": accounts[0]})
+        token.approve(voting_escrow, 2 ** 256 - 1, {"from": acct})
+
+    for i, acct in enumerate(accounts[:3]):
+        voting_escrow.create_lock(10 ** 21 * (i + 1), chain.time() + WEEK * (i + 4), {"from": acct})
+        chain.sleep(WEEK)
+    for i in range(6):
+        voting_escrow.increase_amount(10 ** 18, {"from": accounts[i % 2]})
+        chain.sleep(86400 * 2)
+    voting_escrow.checkpoint({"from": accounts[0]})
+    chain.mine()
+
+
+def _blocks(voting_escrow):
+    # the block of every point, and the blocks between them
+    blocks = [voting_escrow.point_history(i)["blk"] for i in range(1, voting_escrow.epoch() + 1)]
+    return sorted(set(blocks + [i + 1 for i in blocks[:-1]]))
+
+
+@pytest.mark.parametrize("offset", [0, -1, 1, 10 ** 9])
+def test_total_supply_at(voting_escrow, offset):
+    for block in _blocks(voting_escrow):
+        hint = max(block_epoch(voting_escrow, block) + offset, 0)
+        assert voting_escrow.totalSupplyAtHinted(block, hint) == voting_escrow.totalSupplyAt(block)
+
+
+@pytest.mark.parametrize("user_offset,offset", [(0, 0), (-1, 0), (1, 0), (0, 1), (10 ** 9, -1)])
+def test_balance_of_at(accounts, voting_escrow, user_offset, offset):
+    for block in _blocks(voting_escrow):
+        hint = max(block_epoch(voting_escrow, block) + offset, 0)
+        for acct in accounts[:4]:
+            user_hint = max(user_block_epoch(voting_escrow, acct, block) + user_offset, 0)
+            assert voting_escrow.balanceOfAtHinted(
+                acct, block, user_hint, hint
+            ) == voting_escrow.balanceOfAt(acct, block)
+
+
+def test_hint_saves_gas(accounts, voting_escrow):
+    block = _blocks(voting_escrow)[4]
+    hint = block_epoch(voting_escrow, block)
+    user_hint = user_block_epoch(voting_escrow, accounts[1], block)
+
+    assert voting_escrow.totalSupplyAtHinted.estimate_gas(
+        block, hint
+    ) < voting_escrow.totalSupplyAt.estimate_gas(block)
+    assert voting_escrow.balanceOfAtHinted.estimate_gas(
+        accounts[1], block, user_hint, hint
+    ) < voting_escrow.balanceOfAt.estimate_gas(accounts[1], block)